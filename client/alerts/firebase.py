@@ -35,6 +35,7 @@ class SystemResourceMonitor:
         self.monitor_thread = None
         self.resource_data = []
         self.lock = threading.Lock()
+        self.process = psutil.Process(os.getpid())
 
     def start_monitoring(self, interval=0.5):
         """Start resource monitoring"""
@@ -63,14 +64,14 @@ class SystemResourceMonitor:
 
                 try:
                     connections = len(psutil.net_connections())
-                except:
+                except (psutil.Error, OSError):
                     connections = 0
 
                 try:
-                    process = psutil.Process()
-                    process_memory = process.memory_info()
-                    process_cpu = process.cpu_percent()
-                except:
+                    # Reusing one Process keeps cpu_percent() measuring since the previous tick
+                    process_memory = self.process.memory_info()
+                    process_cpu = self.process.cpu_percent()
+                except (psutil.Error, OSError):
                     process_memory = None
                     process_cpu = 0
 
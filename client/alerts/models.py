@@ -227,11 +227,13 @@ class TechnologyMetrics(models.Model):
 
     def get_performance_grade(self):
         """Get a performance grade based on metrics"""
-        if self.total_attempts == 0:
-            return 'N/A'
+        return self.grade_performance(self.total_attempts, self.success_rate, self.avg_latency_ms)
 
-        success_rate = self.success_rate
-        avg_latency = self.avg_latency_ms
+    @staticmethod
+    def grade_performance(total_attempts, success_rate, avg_latency):
+        """Grade raw metric values; shared by model instances and .values() rows"""
+        if total_attempts == 0:
+            return 'N/A'
 
         # Grade based on success rate and latency
         if success_rate >= 95 and avg_latency <= 100:
@@ -2,19 +2,246 @@
 REAL Performance Testing - Actual Network Measurements
 No simulated data, only genuine performance metrics
 """
+import os
+import sys
 import json
 import time
+import socket
+import asyncio
+import threading
 import requests
 import websocket
-import uuid
+import secrets
+import itertools
+import multiprocessing
 import statistics
+import numpy as np
 from datetime import datetime
-from typing import Dict, List, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Any, Tuple, Callable, Optional
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import logging
 
 logger = logging.getLogger(__name__)
 
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    logger.warning("aiohttp not available, WebSocket tests will use blocking clients")
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+loads_json = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Ping frames differ only in a few fields, so they are formatted from templates
+# instead of serializing a dict per message; ids come from next_test_id and need no escaping
+LATENCY_PING_TEMPLATE = '{"type":"ping","ping_id":"%s","message_id":"%s","client_timestamp":%.6f,"sequence":%d}'
+# Client pings are spliced from a per-client prefix plus an integer millisecond timestamp,
+# so only the tail is built inside the timed region
+CLIENT_PING_PREFIX = '{"type":"ping","ping_id":"%s","client_id":%d,"timestamp":'
+
+
+def client_ping(prefix: str) -> str:
+    """Complete a formatted CLIENT_PING_PREFIX with the current wall-clock time in ms"""
+    return prefix + str(time.time_ns() // 1_000_000) + '}'
+
+# Beyond this many concurrent clients the per-message Python work is spread over processes
+PROCESS_FANOUT_MIN_CLIENTS = 50
+
+
+def _stats_kernel(a):
+    """Sort a in place and return (mean, min, max, p50, p95, p99) with linear interpolation"""
+    a.sort()
+    n = a.shape[0]
+    out = np.empty(6)
+    out[0] = a.mean()
+    out[1] = a[0]
+    out[2] = a[n - 1]
+    for j in range(3):
+        q = 50.0 if j == 0 else (95.0 if j == 1 else 99.0)
+        position = q / 100.0 * (n - 1)
+        lower = int(position)
+        upper = min(lower + 1, n - 1)
+        out[3 + j] = a[lower] + (a[upper] - a[lower]) * (position - lower)
+    return out
+
+
+if NUMBA_AVAILABLE:
+    _stats_kernel = njit(cache=True)(_stats_kernel)
+    # Compile at import so the first measurement summary does not pay for the JIT
+    _stats_kernel(np.ones(2))
+
+
+def latency_stats(values: List[float]) -> Dict[str, float]:
+    """Summary statistics of a sample list from a single sort"""
+    mean, minimum, maximum, p50, p95, p99 = _stats_kernel(np.array(values, dtype=np.float64)).tolist()
+    return {'mean': mean, 'min': minimum, 'max': maximum, 'median': p50, 'p95': p95, 'p99': p99}
+
+
+# Raw sample lists longer than this are stored as a percentile grid instead
+RAW_SAMPLE_LIMIT = 1000
+
+
+def sample_fields(name: str, values: List[float]) -> Dict[str, Any]:
+    """Result entries for a sample list: raw values, or a 0..100 percentile grid for large runs"""
+    if len(values) <= RAW_SAMPLE_LIMIT:
+        return {name: values}
+    return {
+        f'{name}_percentiles': np.percentile(np.array(values, dtype=np.float64), np.arange(101)).tolist(),
+        f'{name}_count': len(values)
+    }
+
+
+class TokenBucket:
+    """Token-bucket pacer; reserve() claims one send slot and returns how long to wait for it"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def reserve(self) -> float:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        # Tokens may go negative so back-to-back reservations queue up behind each other
+        self.tokens -= 1
+        return max(0.0, -self.tokens / self.rate)
+
+
+def write_lines(lines: List[str]) -> None:
+    """Emit buffered progress lines in one write once the timed loop has finished"""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+# Test ids only need to be unique per run: a random run prefix plus a counter
+# avoids a urandom read and 128-bit formatting for every id
+RUN_PREFIX = secrets.token_hex(4)
+_test_id_counter = itertools.count()
+
+
+def next_test_id(kind: str) -> str:
+    """Unique id for one test message or client, e.g. latency_test_1a2b3c4d_17"""
+    return f'{kind}_{RUN_PREFIX}_{next(_test_id_counter)}'
+
+
+def run_async(coro):
+    """Run a coroutine to completion on a fresh event loop, on uvloop when it is installed"""
+    if UVLOOP_AVAILABLE:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
+def run_sequentially(request: Callable[[], Any], count: int) -> List[Any]:
+    """Blocking counterpart of asyncio.gather(return_exceptions=True) for request callables"""
+    outcomes = []
+    for _ in range(count):
+        try:
+            outcomes.append(request())
+        except Exception as e:
+            outcomes.append(e)
+    return outcomes
+
+
+def warm_up(session, method: str, url: str, **kwargs) -> None:
+    """Send one unmeasured request so the first timed sample does not pay for DNS and the handshake"""
+    try:
+        session.request(method, url, **kwargs).close()
+    except Exception as e:
+        logger.debug(f"Warm-up request to {url} failed: {e}")
+
+
+async def warm_up_async(session, method: str, url: str, **kwargs) -> None:
+    """aiohttp counterpart of warm_up"""
+    try:
+        async with session.request(method, url, **kwargs) as response:
+            await response.read()
+    except Exception as e:
+        logger.debug(f"Warm-up request to {url} failed: {e}")
+
+
+async def receive_pong(ws, ping_id: str) -> None:
+    """Read frames until the pong for ping_id arrives, skipping unrelated server messages"""
+    async for msg in ws:
+        if msg.type != aiohttp.WSMsgType.TEXT:
+            if msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                break
+            continue
+        data = loads_json(msg.data)
+        if data.get('type') == 'pong' and data.get('ping_id') == ping_id:
+            return
+    raise ConnectionError('WebSocket closed before pong was received')
+
+
+DNS_CACHE_TTL = 60.0
+_DNS_CACHE: Dict[str, Tuple[str, float]] = {}
+_dns_lock = threading.Lock()
+
+
+def resolve_host(hostname: str) -> str:
+    """Resolve hostname to an IPv4 address, reusing lookups for DNS_CACHE_TTL seconds"""
+    # Numeric hosts need no lookup at all
+    try:
+        socket.inet_pton(socket.AF_INET, hostname)
+        return hostname
+    except OSError:
+        pass
+
+    cached = _DNS_CACHE.get(hostname)
+    if cached and time.monotonic() < cached[1]:
+        return cached[0]
+
+    ip = socket.getaddrinfo(hostname, None, socket.AF_INET)[0][4][0]
+    with _dns_lock:
+        _DNS_CACHE[hostname] = (ip, time.monotonic() + DNS_CACHE_TTL)
+    return ip
+
+
+class CachedDNSAdapter(HTTPAdapter):
+    """HTTPAdapter that sends plain-HTTP requests to the cached address of their host"""
+
+    def send(self, request, **kwargs):
+        parts = urlsplit(request.url)
+        # HTTPS keeps the hostname so SNI and certificate checks still match
+        if parts.scheme == 'http' and parts.hostname:
+            try:
+                ip = resolve_host(parts.hostname)
+            except OSError:
+                return super().send(request, **kwargs)
+            request.headers.setdefault('Host', parts.netloc)
+            netloc = f'{ip}:{parts.port}' if parts.port else ip
+            request.url = parts._replace(netloc=netloc).geturl()
+        return super().send(request, **kwargs)
+
+
+# One pooled keep-alive session shared by every tester so measurements reuse TCP connections
+SESSION = requests.Session()
+SESSION.headers.update({'User-Agent': 'RealPerformanceTester/1.0'})
+SESSION.mount('http://', CachedDNSAdapter(pool_connections=64, pool_maxsize=64, max_retries=0))
+SESSION.mount('https://', HTTPAdapter(pool_connections=64, pool_maxsize=64, max_retries=0))
+
 
 class NetworkLatencyMeasurer:
     """Measures actual network latency without simulation"""
@@ -24,18 +251,16 @@ class NetworkLatencyMeasurer:
 
     def measure_tcp_connect_time(self, host: str, port: int) -> float:
         """Measure actual TCP connection establishment time"""
-        import socket
-
-        start_time = time.perf_counter()
+        start_time = time.perf_counter_ns()
         try:
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             sock.settimeout(10)
             result = sock.connect_ex((host, port))
-            connect_time = time.perf_counter() - start_time
+            connect_time = time.perf_counter_ns() - start_time
             sock.close()
 
             if result == 0:
-                return connect_time * 1000  # Convert to milliseconds
+                return connect_time / 1e6  # Convert to milliseconds
             else:
                 return -1  # Connection failed
         except Exception:
@@ -43,33 +268,32 @@ class NetworkLatencyMeasurer:
 
     def measure_http_latency(self, url: str) -> Dict[str, float]:
         """Measure actual HTTP request latency components"""
-        session = requests.Session()
-
         # DNS resolution time
-        dns_start = time.perf_counter()
+        dns_start = time.perf_counter_ns()
         try:
-            import socket
-            hostname = url.split('://')[1].split('/')[0].split(':')[0]
-            socket.gethostbyname(hostname)
-            dns_time = (time.perf_counter() - dns_start) * 1000
+            resolve_host(urlsplit(url).hostname)
+            dns_time = (time.perf_counter_ns() - dns_start) / 1e6
         except Exception:
             dns_time = 0
 
         # Full HTTP request time
-        request_start = time.perf_counter()
+        request_start = time.perf_counter_ns()
         try:
-            response = session.get(url, timeout=10)
-            request_time = (time.perf_counter() - request_start) * 1000
+            # Count the body in chunks rather than materializing it; draining it also
+            # lets the with-block hand the connection back to the keep-alive pool
+            with SESSION.get(url, timeout=10, stream=True) as response:
+                response_size = sum(len(chunk) for chunk in response.iter_content(chunk_size=65536))
+            request_time = (time.perf_counter_ns() - request_start) / 1e6
 
             return {
                 'dns_time_ms': dns_time,
                 'request_time_ms': request_time,
                 'status_code': response.status_code,
-                'response_size_bytes': len(response.content),
+                'response_size_bytes': response_size,
                 'success': response.status_code == 200
             }
         except Exception as e:
-            request_time = (time.perf_counter() - request_start) * 1000
+            request_time = (time.perf_counter_ns() - request_start) / 1e6
             return {
                 'dns_time_ms': dns_time,
                 'request_time_ms': request_time,
@@ -97,51 +321,42 @@ class RealWebSocketTester:
 
         connection_times = []
         successful_connections = 0
+        log_lines = []
 
+        # Only the handshake is timed; reachability is checked afterwards on one connection
         for i in range(num_tests):
             try:
-                start_time = time.perf_counter()
+                start_time = time.perf_counter_ns()
                 ws = websocket.create_connection(self.url, timeout=10)
-                connection_time = (time.perf_counter() - start_time) * 1000
-
-                # Test if connection is actually working
-                ws.send(json.dumps({
-                    'type': 'ping',
-                    'test_id': f'connection_test_{i}',
-                    'timestamp': time.time() * 1000
-                }))
-
-                # Try to receive response
-                try:
-                    ws.settimeout(3)
-                    response = ws.recv()
-                    ws.close()
-
-                    connection_times.append(connection_time)
-                    successful_connections += 1
-                    print(f"  Connection {i+1}: {connection_time:.2f}ms ✓")
+                connection_time = (time.perf_counter_ns() - start_time) / 1e6
+                ws.close()
 
-                except websocket.WebSocketTimeoutException:
-                    ws.close()
-                    connection_times.append(connection_time)
-                    successful_connections += 1
-                    print(f"  Connection {i+1}: {connection_time:.2f}ms (no response)")
+                connection_times.append(connection_time)
+                successful_connections += 1
+                log_lines.append(f"  Connection {i+1}: {connection_time:.2f}ms ✓")
 
             except Exception as e:
                 self.errors.append(f"Connection {i+1} failed: {str(e)}")
-                print(f"  Connection {i+1}: Failed - {e}")
+                log_lines.append(f"  Connection {i+1}: Failed - {e}")
+
+        write_lines(log_lines)
 
         if connection_times:
+            health_check_times = self._health_check_pings(num_tests)
+            stats = latency_stats(connection_times)
             return {
                 'success': True,
                 'total_tests': num_tests,
                 'successful_connections': successful_connections,
-                'avg_connection_time_ms': statistics.mean(connection_times),
-                'min_connection_time_ms': min(connection_times),
-                'max_connection_time_ms': max(connection_times),
-                'median_connection_time_ms': statistics.median(connection_times),
+                'avg_connection_time_ms': stats['mean'],
+                'min_connection_time_ms': stats['min'],
+                'max_connection_time_ms': stats['max'],
+                'median_connection_time_ms': stats['median'],
                 'success_rate': (successful_connections / num_tests) * 100,
-                'all_connection_times': connection_times
+                **sample_fields('all_connection_times', connection_times),
+                'health_check_responses': len(health_check_times),
+                'avg_health_check_ms': statistics.mean(health_check_times) if health_check_times else 0,
+                **sample_fields('all_health_check_times', health_check_times)
             }
         else:
             return {
@@ -151,67 +366,63 @@ class RealWebSocketTester:
                 'errors': self.errors
             }
 
-    def test_message_latency(self, num_messages: int = 20) -> Dict[str, Any]:
-        """Test actual message round-trip latency"""
-        print(f"Testing WebSocket message latency ({num_messages} messages)...")
-
+    def _health_check_pings(self, num_pings: int) -> List[float]:
+        """Ping over one shared connection to confirm the endpoint answers; returns round trips in ms"""
+        round_trips = []
         try:
             ws = websocket.create_connection(self.url, timeout=10)
-            ws.settimeout(5)
+            ws.settimeout(3)
         except Exception as e:
-            return {'success': False, 'error': f'Failed to connect: {e}'}
-
-        latencies = []
-        successful_messages = 0
-
-        for i in range(num_messages):
-            message_id = f'latency_test_{uuid.uuid4()}'
-
-            try:
-                # Send message with precise timestamp
-                send_time = time.perf_counter()
-                message = {
-                    'type': 'ping',
-                    'message_id': message_id,
-                    'client_timestamp': send_time * 1000,
-                    'sequence': i + 1
-                }
-
-                ws.send(json.dumps(message))
+            self.errors.append(f"Health check connection failed: {str(e)}")
+            return round_trips
 
-                # Wait for response
-                response = ws.recv()
-                receive_time = time.perf_counter()
-
-                # Calculate actual round-trip latency
-                latency_ms = (receive_time - send_time) * 1000
-                latencies.append(latency_ms)
-                successful_messages += 1
-
-                print(f"  Message {i+1}: {latency_ms:.2f}ms")
+        try:
+            for i in range(num_pings):
+                ping_id = f'connection_test_{i}'
+                prefix = CLIENT_PING_PREFIX % (ping_id, i)
+                send_time = time.perf_counter_ns()
+                ws.send(client_ping(prefix))
+                # Skip the welcome frame and anything else that is not this ping's pong
+                while True:
+                    data = loads_json(ws.recv())
+                    if data.get('type') == 'pong' and data.get('ping_id') == ping_id:
+                        break
+                round_trips.append((time.perf_counter_ns() - send_time) / 1e6)
+        except Exception as e:
+            self.errors.append(f"Health check ping failed: {str(e)}")
+        finally:
+            ws.close()
 
-                # Small delay to avoid overwhelming server
-                time.sleep(0.05)
+        return round_trips
 
-            except Exception as e:
-                self.errors.append(f"Message {i+1} failed: {str(e)}")
-                print(f"  Message {i+1}: Failed - {e}")
+    def test_message_latency(self, num_messages: int = 20, rate_limit: Optional[float] = None) -> Dict[str, Any]:
+        """Test actual message round-trip latency, pacing sends to rate_limit messages/s if given"""
+        print(f"Testing WebSocket message latency ({num_messages} messages)...")
 
-        ws.close()
+        pacer = TokenBucket(rate_limit) if rate_limit else None
+        try:
+            if AIOHTTP_AVAILABLE:
+                latencies = run_async(self._measure_latency_async(num_messages, pacer))
+            else:
+                latencies = self._measure_latency_blocking(num_messages, pacer)
+        except Exception as e:
+            return {'success': False, 'error': f'Failed to connect: {e}'}
+        successful_messages = len(latencies)
 
         if latencies:
+            stats = latency_stats(latencies)
             return {
                 'success': True,
                 'total_messages': num_messages,
                 'successful_messages': successful_messages,
-                'avg_latency_ms': statistics.mean(latencies),
-                'min_latency_ms': min(latencies),
-                'max_latency_ms': max(latencies),
-                'median_latency_ms': statistics.median(latencies),
-                'p95_latency_ms': self._percentile(latencies, 95),
-                'p99_latency_ms': self._percentile(latencies, 99),
+                'avg_latency_ms': stats['mean'],
+                'min_latency_ms': stats['min'],
+                'max_latency_ms': stats['max'],
+                'median_latency_ms': stats['median'],
+                'p95_latency_ms': stats['p95'],
+                'p99_latency_ms': stats['p99'],
                 'success_rate': (successful_messages / num_messages) * 100,
-                'all_latencies': latencies
+                **sample_fields('all_latencies', latencies)
             }
         else:
             return {
@@ -221,6 +432,112 @@ class RealWebSocketTester:
                 'errors': self.errors
             }
 
+    async def _measure_latency_async(self, num_messages: int, pacer: Optional[TokenBucket] = None) -> List[float]:
+        """Pipeline every ping over one aiohttp WebSocket, then match pongs by ping_id"""
+        message_ids = [next_test_id('latency_test') for _ in range(num_messages)]
+        pending = {}
+        latencies = []
+
+        async with aiohttp.ClientSession() as session:
+            async with session.ws_connect(self.url, compress=0, timeout=10) as ws:
+                # One unmeasured round trip first, which also drains the welcome frame
+                warm_up_id = next_test_id('latency_warm_up')
+                try:
+                    await ws.send_str(LATENCY_PING_TEMPLATE % (warm_up_id, warm_up_id, time.perf_counter_ns() / 1e6, 0))
+                    await asyncio.wait_for(receive_pong(ws, warm_up_id), timeout=5)
+                except asyncio.TimeoutError:
+                    logger.debug("Latency warm-up ping got no response")
+
+                async def send_ping(i: int, message_id: str):
+                    if pacer:
+                        await asyncio.sleep(pacer.reserve())
+                    send_time = pending[message_id] = time.perf_counter_ns()
+                    await ws.send_str(
+                        LATENCY_PING_TEMPLATE % (message_id, message_id, send_time / 1e6, i + 1)
+                    )
+
+                await asyncio.gather(*(send_ping(i, mid) for i, mid in enumerate(message_ids)))
+
+                try:
+                    await asyncio.wait_for(
+                        self._collect_pongs(ws, pending, latencies), timeout=5 + num_messages * 0.05 + (num_messages / pacer.rate if pacer else 0)
+                    )
+                except Exception as e:
+                    self.errors.append(f"Collecting responses failed: {str(e)}")
+
+        for message_id in pending:
+            self.errors.append(f"Message {message_id} failed: no response")
+
+        write_lines([f"  Message {i+1}: {latency_ms:.2f}ms" for i, latency_ms in enumerate(latencies)])
+
+        return latencies
+
+    @staticmethod
+    async def _collect_pongs(ws, pending: Dict[str, int], latencies: List[float]) -> None:
+        """Read pongs in arrival order, removing each answered ping from pending"""
+        async for msg in ws:
+            if msg.type != aiohttp.WSMsgType.TEXT:
+                if msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                    break
+                continue
+            receive_time = time.perf_counter_ns()
+            data = loads_json(msg.data)
+            send_time = pending.pop(data.get('ping_id'), None) if data.get('type') == 'pong' else None
+            if send_time is None:
+                continue
+            latencies.append((receive_time - send_time) / 1e6)
+            if not pending:
+                return
+        raise ConnectionError('WebSocket closed before all pongs were received')
+
+    def _measure_latency_blocking(self, num_messages: int, pacer: Optional[TokenBucket] = None) -> List[float]:
+        """Measure ping round trips with the blocking websocket-client"""
+        ws = websocket.create_connection(self.url, timeout=10)
+        try:
+            ws.settimeout(5)
+
+            # One unmeasured round trip first, which also drains the welcome frame
+            warm_up_id = next_test_id('latency_warm_up')
+            try:
+                ws.send(LATENCY_PING_TEMPLATE % (warm_up_id, warm_up_id, time.perf_counter_ns() / 1e6, 0))
+                while loads_json(ws.recv()).get('ping_id') != warm_up_id:
+                    pass
+            except websocket.WebSocketTimeoutException:
+                logger.debug("Latency warm-up ping got no response")
+
+            latencies = []
+            log_lines = []
+
+            for i in range(num_messages):
+                message_id = next_test_id('latency_test')
+
+                try:
+                    if pacer:
+                        time.sleep(pacer.reserve())
+
+                    # Send message with precise timestamp
+                    send_time = time.perf_counter_ns()
+                    ws.send(LATENCY_PING_TEMPLATE % (message_id, message_id, send_time / 1e6, i + 1))
+
+                    # Wait for response
+                    response = ws.recv()
+                    receive_time = time.perf_counter_ns()
+
+                    # Calculate actual round-trip latency
+                    latency_ms = (receive_time - send_time) / 1e6
+                    latencies.append(latency_ms)
+
+                    log_lines.append(f"  Message {i+1}: {latency_ms:.2f}ms")
+
+                except Exception as e:
+                    self.errors.append(f"Message {i+1} failed: {str(e)}")
+                    log_lines.append(f"  Message {i+1}: Failed - {e}")
+        finally:
+            ws.close()
+
+        write_lines(log_lines)
+        return latencies
+
     def test_concurrent_connections(self, num_clients: int = 10) -> Dict[str, Any]:
         """Test performance with multiple concurrent connections"""
         print(f"Testing concurrent WebSocket connections ({num_clients} clients)...")
@@ -228,22 +545,19 @@ class RealWebSocketTester:
         def single_client_test(client_id: int) -> Dict[str, Any]:
             try:
                 # Connect
-                connect_start = time.perf_counter()
+                connect_start = time.perf_counter_ns()
                 ws = websocket.create_connection(self.url, timeout=10)
-                connect_time = (time.perf_counter() - connect_start) * 1000
+                connect_time = (time.perf_counter_ns() - connect_start) / 1e6
 
                 # Send test message
-                message_start = time.perf_counter()
-                ws.send(json.dumps({
-                    'type': 'ping',
-                    'client_id': client_id,
-                    'timestamp': time.time() * 1000
-                }))
+                prefix = CLIENT_PING_PREFIX % (f'concurrent_test_{client_id}', client_id)
+                message_start = time.perf_counter_ns()
+                ws.send(client_ping(prefix))
 
                 # Wait for response
                 ws.settimeout(5)
                 response = ws.recv()
-                message_time = (time.perf_counter() - message_start) * 1000
+                message_time = (time.perf_counter_ns() - message_start) / 1e6
 
                 ws.close()
 
@@ -263,10 +577,15 @@ class RealWebSocketTester:
                     'error': str(e)
                 }
 
-        # Run concurrent tests
-        with ThreadPoolExecutor(max_workers=num_clients) as executor:
-            futures = [executor.submit(single_client_test, i) for i in range(num_clients)]
-            results = [future.result() for future in as_completed(futures)]
+        # Run concurrent tests; event loops multiplex the clients when aiohttp is present
+        workers = os.cpu_count() or 1
+        if AIOHTTP_AVAILABLE and num_clients >= PROCESS_FANOUT_MIN_CLIENTS and workers > 1:
+            results = self._run_clients_in_processes(num_clients, workers)
+        elif AIOHTTP_AVAILABLE:
+            results = run_async(self._run_concurrent_clients(range(num_clients)))
+        else:
+            with ThreadPoolExecutor(max_workers=num_clients) as executor:
+                results = list(executor.map(single_client_test, range(num_clients)))
 
         # Analyze results
         successful_clients = [r for r in results if r['success']]
@@ -294,18 +613,53 @@ class RealWebSocketTester:
                 'client_results': results
             }
 
-    def _percentile(self, data: List[float], percentile: float) -> float:
-        """Calculate percentile of data"""
-        if not data:
-            return 0.0
-        sorted_data = sorted(data)
-        index = (percentile / 100.0) * (len(sorted_data) - 1)
-        if index.is_integer():
-            return sorted_data[int(index)]
-        else:
-            lower = sorted_data[int(index)]
-            upper = sorted_data[int(index) + 1]
-            return lower + (upper - lower) * (index - int(index))
+    def _run_clients_in_processes(self, num_clients: int, workers: int) -> List[Dict[str, Any]]:
+        """Split the clients across worker processes, each running its own event loop"""
+        client_ids = list(range(num_clients))
+        chunks = [client_ids[i::workers] for i in range(min(workers, num_clients))]
+        # Callers run on Django and monitor threads; forking a threaded process can deadlock on inherited locks
+        with ProcessPoolExecutor(max_workers=len(chunks), mp_context=multiprocessing.get_context('spawn')) as executor:
+            chunk_results = executor.map(run_client_chunk, [self.url] * len(chunks), chunks)
+            return [result for results in chunk_results for result in results]
+
+    async def _run_concurrent_clients(self, client_ids) -> List[Dict[str, Any]]:
+        """Fan out the concurrent clients as coroutines sharing one aiohttp session"""
+        async with aiohttp.ClientSession() as session:
+            return await asyncio.gather(*(self._client_coro(session, i) for i in client_ids))
+
+    async def _client_coro(self, session, client_id: int) -> Dict[str, Any]:
+        """Connect, send one ping and wait for its pong"""
+        try:
+            connect_start = time.perf_counter_ns()
+            async with session.ws_connect(self.url, compress=0, timeout=10) as ws:
+                connect_time = (time.perf_counter_ns() - connect_start) / 1e6
+
+                ping_id = next_test_id(f'concurrent_test_{client_id}')
+                prefix = CLIENT_PING_PREFIX % (ping_id, client_id)
+                message_start = time.perf_counter_ns()
+                await ws.send_str(client_ping(prefix))
+                await asyncio.wait_for(receive_pong(ws, ping_id), timeout=5)
+                message_time = (time.perf_counter_ns() - message_start) / 1e6
+
+            return {
+                'client_id': client_id,
+                'connect_time_ms': connect_time,
+                'message_time_ms': message_time,
+                'success': True
+            }
+
+        except Exception as e:
+            return {
+                'client_id': client_id,
+                'connect_time_ms': 0,
+                'message_time_ms': 0,
+                'success': False,
+                'error': str(e)
+            }
+
+def run_client_chunk(url: str, client_ids: List[int]) -> List[Dict[str, Any]]:
+    """Process-pool entry point: run one chunk of concurrent WebSocket clients"""
+    return run_async(RealWebSocketTester(url)._run_concurrent_clients(client_ids))
 
 
 class RealLongPollingTester:
@@ -314,8 +668,7 @@ class RealLongPollingTester:
     def __init__(self, url: str):
         self.url = url
         self.latency_measurer = NetworkLatencyMeasurer()
-        self.session = requests.Session()
-        self.session.headers.update({'User-Agent': 'RealPerformanceTester/1.0'})
+        self.session = SESSION
 
     def test_immediate_response_time(self, num_tests: int = 10) -> Dict[str, Any]:
         """Test response time when data is immediately available"""
@@ -331,33 +684,36 @@ class RealLongPollingTester:
 
         response_times = []
         successful_requests = 0
+        log_lines = []
 
-        for i in range(num_tests):
-            client_id = f'immediate_test_{uuid.uuid4()}'
-
-            try:
-                start_time = time.perf_counter()
-                response = self.session.get(
-                    self.url,
-                    params={'client_id': client_id, 'timeout': 5},
-                    timeout=10
-                )
-                response_time = (time.perf_counter() - start_time) * 1000
-
-                if response.status_code == 200:
-                    data = response.json()
-                    if 'alert' in data and data['alert']:
-                        response_times.append(response_time)
-                        successful_requests += 1
-                        immediate = data.get('immediate', False)
-                        print(f"  Request {i+1}: {response_time:.2f}ms (immediate: {immediate})")
-                    else:
-                        print(f"  Request {i+1}: {response_time:.2f}ms (no data)")
+        # Requests are independent, so issue them concurrently when aiohttp is present
+        if AIOHTTP_AVAILABLE:
+            outcomes = run_async(self._immediate_requests_async(num_tests))
+        else:
+            warm_up(
+                self.session, 'GET', self.url,
+                params={'client_id': next_test_id('immediate_warm_up'), 'timeout': 5}, timeout=10
+            )
+            outcomes = run_sequentially(self._immediate_request, num_tests)
+
+        for i, outcome in enumerate(outcomes):
+            if isinstance(outcome, Exception):
+                log_lines.append(f"  Request {i+1}: Error - {outcome}")
+                continue
+
+            response_time, status_code, data = outcome
+            if status_code == 200:
+                if 'alert' in data and data['alert']:
+                    response_times.append(response_time)
+                    successful_requests += 1
+                    immediate = data.get('immediate', False)
+                    log_lines.append(f"  Request {i+1}: {response_time:.2f}ms (immediate: {immediate})")
                 else:
-                    print(f"  Request {i+1}: HTTP {response.status_code}")
+                    log_lines.append(f"  Request {i+1}: {response_time:.2f}ms (no data)")
+            else:
+                log_lines.append(f"  Request {i+1}: HTTP {status_code}")
 
-            except Exception as e:
-                print(f"  Request {i+1}: Error - {e}")
+        write_lines(log_lines)
 
         if response_times:
             return {
@@ -368,7 +724,7 @@ class RealLongPollingTester:
                 'min_response_time_ms': min(response_times),
                 'max_response_time_ms': max(response_times),
                 'success_rate': (successful_requests / num_tests) * 100,
-                'all_response_times': response_times
+                **sample_fields('all_response_times', response_times)
             }
         else:
             return {
@@ -377,74 +733,65 @@ class RealLongPollingTester:
                 'total_requests': num_tests
             }
 
+    def _immediate_request(self) -> Tuple[float, int, Any]:
+        """Issue one immediate poll; returns (response time ms, status code, body)"""
+        start_time = time.perf_counter_ns()
+        response = self.session.get(
+            self.url,
+            params={'client_id': next_test_id('immediate_test'), 'timeout': 5},
+            timeout=10
+        )
+        response_time = (time.perf_counter_ns() - start_time) / 1e6
+        return response_time, response.status_code, response.json() if response.status_code == 200 else None
+
+    async def _immediate_requests_async(self, num_tests: int) -> List[Any]:
+        """Issue num_tests immediate polls concurrently over one aiohttp session"""
+        connector = aiohttp.TCPConnector(limit=num_tests)
+        async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=10)) as session:
+            await warm_up_async(
+                session, 'GET', self.url, params={'client_id': next_test_id('immediate_warm_up'), 'timeout': '5'}
+            )
+
+            async def poll_once():
+                start_time = time.perf_counter_ns()
+                async with session.get(
+                    self.url,
+                    params={'client_id': next_test_id('immediate_test'), 'timeout': '5'}
+                ) as response:
+                    body = await response.read()
+                response_time = (time.perf_counter_ns() - start_time) / 1e6
+                return response_time, response.status, loads_json(body) if response.status == 200 else None
+
+            return await asyncio.gather(*(poll_once() for _ in range(num_tests)), return_exceptions=True)
+
     def test_timeout_accuracy(self, timeout_values: List[int] = None) -> Dict[str, Any]:
         """Test actual timeout behavior accuracy"""
         if timeout_values is None:
             timeout_values = [3, 5, 10]
 
         print(f"Testing Long Polling timeout accuracy...")
-
-        timeout_results = []
-
         for timeout_sec in timeout_values:
             print(f"  Testing {timeout_sec}s timeout...")
 
-            # Use unique client to ensure no data available
-            client_id = f'timeout_test_{uuid.uuid4()}'
-
-            start_time = 0  # Initialize to avoid potential reference before assignment
-
-            try:
-                start_time = time.perf_counter()
-                response = self.session.get(
-                    self.url,
-                    params={'client_id': client_id, 'timeout': timeout_sec},
-                    timeout=timeout_sec + 5  # HTTP timeout longer than expected server timeout
+        # Each poll waits out its own timeout, so run them together: wall time is max(), not sum()
+        if AIOHTTP_AVAILABLE:
+            outcomes = run_async(self._timeout_polls_async(timeout_values))
+        else:
+            outcomes = [self._timeout_poll(timeout_sec) for timeout_sec in timeout_values]
+        timeout_results = [result for result in outcomes if result is not None]
+
+        log_lines = []
+        for result in timeout_results:
+            timeout_sec = result['requested_timeout']
+            if not result['success']:
+                log_lines.append(f"    {timeout_sec}s: Error - {result['error']}")
+            elif result.get('http_timeout'):
+                log_lines.append(f"    {timeout_sec}s: HTTP timeout at {result['actual_time']:.2f}s")
+            else:
+                log_lines.append(
+                    f"    {timeout_sec}s: actual {result['actual_time']:.2f}s (diff: {result['accuracy_diff']:.2f}s)"
                 )
-                actual_time = time.perf_counter() - start_time
-
-                if response.status_code == 200:
-                    data = response.json()
-                    timeout_occurred = data.get('timeout', False)
-                    server_wait_time = data.get('wait_time', 0)
-
-                    accuracy = abs(actual_time - timeout_sec)
-
-                    timeout_results.append({
-                        'requested_timeout': timeout_sec,
-                        'actual_time': actual_time,
-                        'server_wait_time': server_wait_time,
-                        'timeout_occurred': timeout_occurred,
-                        'accuracy_diff': accuracy,
-                        'success': True
-                    })
-
-                    print(f"    {timeout_sec}s: actual {actual_time:.2f}s (diff: {accuracy:.2f}s)")
-
-            except requests.exceptions.Timeout:
-                actual_time = time.perf_counter() - start_time if start_time else 0
-                accuracy = abs(actual_time - timeout_sec)
-
-                timeout_results.append({
-                    'requested_timeout': timeout_sec,
-                    'actual_time': actual_time,
-                    'server_wait_time': timeout_sec,
-                    'timeout_occurred': True,
-                    'accuracy_diff': accuracy,
-                    'success': True,
-                    'http_timeout': True
-                })
-
-                print(f"    {timeout_sec}s: HTTP timeout at {actual_time:.2f}s")
-
-            except Exception as e:
-                timeout_results.append({
-                    'requested_timeout': timeout_sec,
-                    'actual_time': 0,
-                    'success': False,
-                    'error': str(e)
-                })
-                print(f"    {timeout_sec}s: Error - {e}")
+        write_lines(log_lines)
 
         successful_tests = [r for r in timeout_results if r['success']]
 
@@ -465,13 +812,83 @@ class RealLongPollingTester:
                 'timeout_tests': timeout_results
             }
 
+    def _timeout_poll(self, timeout_sec: int):
+        """Run one poll expected to time out; None when the server answers with a non-200 status"""
+        start_time = time.perf_counter_ns()
+        try:
+            response = self.session.get(
+                self.url,
+                # Use unique client to ensure no data available
+                params={'client_id': next_test_id('timeout_test'), 'timeout': timeout_sec},
+                timeout=timeout_sec + 5  # HTTP timeout longer than expected server timeout
+            )
+            actual_time = (time.perf_counter_ns() - start_time) / 1e9
+            if response.status_code != 200:
+                return None
+            return self._timeout_result(timeout_sec, actual_time, response.json())
+
+        except requests.exceptions.Timeout:
+            return self._http_timeout_result(timeout_sec, (time.perf_counter_ns() - start_time) / 1e9)
+
+        except Exception as e:
+            return {'requested_timeout': timeout_sec, 'actual_time': 0, 'success': False, 'error': str(e)}
+
+    async def _timeout_polls_async(self, timeout_values: List[int]) -> List[Any]:
+        """Run one timeout poll per value concurrently over one aiohttp session"""
+        async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=len(timeout_values))) as session:
+            async def poll(timeout_sec: int):
+                start_time = time.perf_counter_ns()
+                try:
+                    async with session.get(
+                        self.url,
+                        params={'client_id': next_test_id('timeout_test'), 'timeout': str(timeout_sec)},
+                        timeout=aiohttp.ClientTimeout(total=timeout_sec + 5)
+                    ) as response:
+                        body = await response.read()
+                    actual_time = (time.perf_counter_ns() - start_time) / 1e9
+                    if response.status != 200:
+                        return None
+                    return self._timeout_result(timeout_sec, actual_time, loads_json(body))
+
+                except asyncio.TimeoutError:
+                    return self._http_timeout_result(timeout_sec, (time.perf_counter_ns() - start_time) / 1e9)
+
+                except Exception as e:
+                    return {'requested_timeout': timeout_sec, 'actual_time': 0, 'success': False, 'error': str(e)}
+
+            return await asyncio.gather(*(poll(timeout_sec) for timeout_sec in timeout_values))
+
+    @staticmethod
+    def _timeout_result(timeout_sec: int, actual_time: float, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the result entry for a poll the server answered"""
+        return {
+            'requested_timeout': timeout_sec,
+            'actual_time': actual_time,
+            'server_wait_time': data.get('wait_time', 0),
+            'timeout_occurred': data.get('timeout', False),
+            'accuracy_diff': abs(actual_time - timeout_sec),
+            'success': True
+        }
+
+    @staticmethod
+    def _http_timeout_result(timeout_sec: int, actual_time: float) -> Dict[str, Any]:
+        """Build the result entry for a poll cut off by the client-side HTTP timeout"""
+        return {
+            'requested_timeout': timeout_sec,
+            'actual_time': actual_time,
+            'server_wait_time': timeout_sec,
+            'timeout_occurred': True,
+            'accuracy_diff': abs(actual_time - timeout_sec),
+            'success': True,
+            'http_timeout': True
+        }
 
 class RealFirebaseTester:
     """Real Firebase push notification testing with actual API calls"""
 
     def __init__(self, base_url: str):
         self.base_url = base_url
-        self.session = requests.Session()
+        self.session = SESSION
         self.registered_tokens = []
 
     def test_token_registration_performance(self, num_tokens: int = 5) -> Dict[str, Any]:
@@ -481,28 +898,26 @@ class RealFirebaseTester:
         registration_times = []
         successful_registrations = 0
 
-        for i in range(num_tokens):
-            test_token = f'test_token_{uuid.uuid4()}_{int(time.time())}'
-
-            try:
-                start_time = time.perf_counter()
-                response = self.session.post(
-                    f'{self.base_url}/register-token/',
-                    json={'token': test_token},
-                    timeout=10
-                )
-                registration_time = (time.perf_counter() - start_time) * 1000
-
-                if response.status_code in [200, 201]:
-                    registration_times.append(registration_time)
-                    successful_registrations += 1
-                    self.registered_tokens.append(test_token)
-                    print(f"  Token {i+1}: {registration_time:.2f}ms ✓")
-                else:
-                    print(f"  Token {i+1}: HTTP {response.status_code}")
-
-            except Exception as e:
-                print(f"  Token {i+1}: Error - {e}")
+        # Registrations are independent, so issue them concurrently when aiohttp is present
+        if AIOHTTP_AVAILABLE:
+            outcomes = run_async(self._register_tokens_async(num_tokens))
+        else:
+            warm_up(self.session, 'HEAD', f'{self.base_url}/register-token/', timeout=10)
+            outcomes = run_sequentially(self._register_token, num_tokens)
+
+        for i, outcome in enumerate(outcomes):
+            if isinstance(outcome, Exception):
+                print(f"  Token {i+1}: Error - {outcome}")
+                continue
+
+            registration_time, status_code, test_token = outcome
+            if status_code in [200, 201]:
+                registration_times.append(registration_time)
+                successful_registrations += 1
+                self.registered_tokens.append(test_token)
+                print(f"  Token {i+1}: {registration_time:.2f}ms ✓")
+            else:
+                print(f"  Token {i+1}: HTTP {status_code}")
 
         if registration_times:
             return {
@@ -513,7 +928,7 @@ class RealFirebaseTester:
                 'min_registration_time_ms': min(registration_times),
                 'max_registration_time_ms': max(registration_times),
                 'success_rate': (successful_registrations / num_tokens) * 100,
-                'all_registration_times': registration_times
+                **sample_fields('all_registration_times', registration_times)
             }
         else:
             return {
@@ -522,6 +937,33 @@ class RealFirebaseTester:
                 'total_tokens': num_tokens
             }
 
+    def _register_token(self) -> Tuple[float, int, str]:
+        """Register one test token; returns (registration time ms, status code, token)"""
+        test_token = f'{next_test_id("test_token")}_{int(time.time())}'
+        start_time = time.perf_counter_ns()
+        response = self.session.post(
+            f'{self.base_url}/register-token/',
+            json={'token': test_token},
+            timeout=10
+        )
+        return (time.perf_counter_ns() - start_time) / 1e6, response.status_code, test_token
+
+    async def _register_tokens_async(self, num_tokens: int) -> List[Any]:
+        """Register num_tokens test tokens concurrently over one aiohttp session"""
+        connector = aiohttp.TCPConnector(limit=num_tokens)
+        async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=10)) as session:
+            # HEAD opens the connection without registering a throwaway token
+            await warm_up_async(session, 'HEAD', f'{self.base_url}/register-token/')
+
+            async def register_once():
+                test_token = f'{next_test_id("test_token")}_{int(time.time())}'
+                start_time = time.perf_counter_ns()
+                async with session.post(f'{self.base_url}/register-token/', json={'token': test_token}) as response:
+                    await response.read()
+                return (time.perf_counter_ns() - start_time) / 1e6, response.status, test_token
+
+            return await asyncio.gather(*(register_once() for _ in range(num_tokens)), return_exceptions=True)
+
     def test_notification_api_performance(self) -> Dict[str, Any]:
         """Test Firebase notification sending API performance"""
         print("Testing Firebase notification API...")
@@ -530,13 +972,13 @@ class RealFirebaseTester:
             return {'success': False, 'error': 'No registered tokens available'}
 
         try:
-            start_time = time.perf_counter()
+            start_time = time.perf_counter_ns()
             response = self.session.post(
                 f'{self.base_url}/send-sequential/',
                 json={'delay': 0.5},
                 timeout=15
             )
-            api_response_time = (time.perf_counter() - start_time) * 1000
+            api_response_time = (time.perf_counter_ns() - start_time) / 1e6
 
             if response.status_code == 200:
                 data = response.json()
@@ -724,8 +1166,16 @@ if __name__ == "__main__":
     filename = f"real_performance_results_{timestamp}.json"
 
     try:
-        with open(filename, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        if ORJSON_AVAILABLE:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(
+                    results,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                ))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(results, f, indent=2, default=str)
         print(f"\n📁 Results saved to {filename}")
     except Exception as e:
         print(f"❌ Failed to save results: {e}")
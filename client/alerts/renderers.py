@@ -0,0 +1,61 @@
+# alerts/renderers.py
+
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSONRenderer that encodes with orjson when it is installed"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if not ORJSON_AVAILABLE:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+
+        # DRF's encoder still handles the types orjson does not know (Decimal, lazy strings, ...)
+        return orjson.dumps(
+            data,
+            default=self.encoder_class().default,
+            option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+
+class ORJSONResponse(HttpResponse):
+    """JsonResponse counterpart for plain Django views, encoded with orjson when it is installed"""
+
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        if ORJSON_AVAILABLE:
+            content = orjson.dumps(
+                data,
+                default=DjangoJSONEncoder().default,
+                option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+        else:
+            content = json.dumps(data, cls=DjangoJSONEncoder)
+        super().__init__(content=content, **kwargs)
+
+
+class ORJSONParser(JSONParser):
+    """JSONParser that decodes with orjson when it is installed"""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if not ORJSON_AVAILABLE:
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f'JSON parse error - {exc}')
@@ -1,32 +1,106 @@
 # alerts/serializers.py
 
+from copy import copy
+from functools import lru_cache
+
+from django.db import models
 from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
 from .models import FCMToken, PerformanceTestResult, TechnologyMetrics, AlertDeliveryLog, TestSession
 
 
-class FCMTokenSerializer(serializers.ModelSerializer):
+class CachedModelSerializer(serializers.ModelSerializer):
+    """ModelSerializer that builds its field map once per class and hands out shallow copies"""
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = self.__class__
+        fields = self._fields_cache.get(cls)
+        if fields is None:
+            # None of the model serializers nest other serializers, so shallow copies are enough
+            fields = self._fields_cache[cls] = super().get_fields()
+        return {name: copy(field) for name, field in fields.items()}
+
+    def to_representation(self, instance):
+        return self.extend_representation(instance, super().to_representation(instance))
+
+    def extend_representation(self, instance, ret):
+        """Add values computed outside the field machinery; FastListSerializer calls this per row"""
+        return ret
+
+
+class StaticFieldsMeta(serializers.SerializerMetaclass):
+    """Serializer metaclass that fixes the field map at class creation"""
+
+    def __init__(cls, name, bases, attrs):
+        super().__init__(name, bases, attrs)
+        cls._cached_fields = cls._declared_fields
+
+
+class StaticSerializer(serializers.Serializer, metaclass=StaticFieldsMeta):
+    """Serializer whose fields never vary per instance, so get_fields shallow-copies the class map"""
+
+    def get_fields(self):
+        return {name: copy(field) for name, field in self._cached_fields.items()}
+
+
+class FastListSerializer(serializers.ListSerializer):
+    """ListSerializer that resolves the child's readable fields once for the whole list"""
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        fields = list(self.child._readable_fields)
+        extend_representation = getattr(self.child, 'extend_representation', None)
+        rows = []
+
+        for instance in iterable:
+            ret = {}
+            for field in fields:
+                try:
+                    attribute = field.get_attribute(instance)
+                except SkipField:
+                    continue
+
+                check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+                ret[field.field_name] = None if check_for_none is None else field.to_representation(attribute)
+            rows.append(extend_representation(instance, ret) if extend_representation else ret)
+
+        return rows
+
+
+_VALID_TOKEN_LENGTHS = range(10, 501)
+_TECHNOLOGY_CHOICES = ('websocket', 'longpolling', 'firebase')
+_NETWORK_PROFILE_CHOICES = ('perfect', 'local_wifi', 'good_mobile', 'poor_mobile', 'international', 'satellite')
+_VALID_SESSION_TECHNOLOGIES = frozenset(('websocket', 'longpolling', 'firebase', 'push'))
+
+
+@lru_cache(maxsize=4096)
+def _validate_fcm_token(value):
+    """Validate and strip an FCM token; clients re-register the same token, so results are memoized"""
+    if not value or len(value.strip()) == 0:
+        raise serializers.ValidationError("Token cannot be empty")
+
+    if len(value) not in _VALID_TOKEN_LENGTHS:
+        raise serializers.ValidationError("Token is too short" if len(value) < 10 else "Token is too long")
+
+    return value.strip()
+
+
+class FCMTokenSerializer(CachedModelSerializer):
     """Serializer for FCM token registration"""
 
     class Meta:
         model = FCMToken
-        fields = ['id', 'token', 'created_at', 'is_active']
-        read_only_fields = ['id', 'created_at']
+        fields = ('id', 'token', 'created_at', 'is_active')
+        read_only_fields = ('id', 'created_at')
 
     def validate_token(self, value):
         """Validate FCM token format"""
-        if not value or len(value.strip()) == 0:
-            raise serializers.ValidationError("Token cannot be empty")
+        return _validate_fcm_token(value)
 
-        if len(value) < 10:
-            raise serializers.ValidationError("Token is too short")
 
-        if len(value) > 500:
-            raise serializers.ValidationError("Token is too long")
-
-        return value.strip()
-
-
-class PerformanceTestConfigSerializer(serializers.Serializer):
+class PerformanceTestConfigSerializer(StaticSerializer):
     """Serializer for performance test configuration"""
     duration = serializers.IntegerField(min_value=10, max_value=600, default=60)
     e2e_clients = serializers.IntegerField(min_value=1, max_value=20, default=5)
@@ -34,19 +108,24 @@ class PerformanceTestConfigSerializer(serializers.Serializer):
     max_concurrent_clients = serializers.IntegerField(min_value=1, max_value=50, required=False)
     token_scale_test = serializers.IntegerField(min_value=1, max_value=1000, default=100)
     technologies = serializers.ListField(
-        child=serializers.ChoiceField(choices=['websocket', 'longpolling', 'firebase']),
+        child=serializers.ChoiceField(choices=_TECHNOLOGY_CHOICES),
         min_length=1
     )
     network_profile = serializers.ChoiceField(
-        choices=['perfect', 'local_wifi', 'good_mobile', 'poor_mobile', 'international', 'satellite'],
+        choices=_NETWORK_PROFILE_CHOICES,
         default='good_mobile'
     )
     enable_resource_monitoring = serializers.BooleanField(default=True)
     test_description = serializers.CharField(max_length=500, required=False)
 
 
-class PerformanceTestResponseSerializer(serializers.Serializer):
-    """Serializer for performance test response"""
+class PerformanceTestResponseSerializer(StaticSerializer):
+    """Serializer for performance test response
+
+    Documents the response shape only. Views build these payloads themselves and return
+    the dict directly, so this and the other *Response/Check serializers are not wrapped
+    around outgoing data.
+    """
     status = serializers.CharField()
     message = serializers.CharField()
     test_id = serializers.CharField()
@@ -56,14 +135,19 @@ class PerformanceTestResponseSerializer(serializers.Serializer):
     architecture = serializers.DictField(required=False)
 
 
-class PerformanceTestResultSerializer(serializers.ModelSerializer):
+class PerformanceTestResultSerializer(CachedModelSerializer):
     """Serializer for performance test results"""
     duration_seconds = serializers.ReadOnlyField()
     is_completed = serializers.ReadOnlyField()
 
     class Meta:
         model = PerformanceTestResult
-        fields = '__all__'
+        list_serializer_class = FastListSerializer
+        fields = (
+            'id', 'duration_seconds', 'is_completed', 'test_id', 'technology', 'test_config', 'metrics',
+            'status', 'started_at', 'completed_at', 'created_at', 'client_server_testing',
+            'real_measurements', 'error_message'
+        )
 
     def validate_test_config(self, value):
         """Validate test configuration"""
@@ -78,50 +162,88 @@ class PerformanceTestResultSerializer(serializers.ModelSerializer):
         return value
 
 
-class TechnologyMetricsSerializer(serializers.ModelSerializer):
-    """Serializer for technology metrics"""
-    success_rate = serializers.ReadOnlyField()
-    error_rate = serializers.ReadOnlyField()
-    avg_throughput = serializers.ReadOnlyField()
-    performance_grade = serializers.ReadOnlyField(source='get_performance_grade')
+class PerformanceTestResultSummarySerializer(CachedModelSerializer):
+    """List view of performance test results without the JSON config/metrics blobs"""
+    duration_seconds = serializers.ReadOnlyField()
+    is_completed = serializers.ReadOnlyField()
 
     class Meta:
-        model = TechnologyMetrics
-        fields = '__all__'
+        model = PerformanceTestResult
+        list_serializer_class = FastListSerializer
+        fields = (
+            'id', 'duration_seconds', 'is_completed', 'test_id', 'technology', 'status',
+            'started_at', 'completed_at', 'created_at', 'client_server_testing', 'real_measurements'
+        )
 
 
-class AlertDeliveryLogSerializer(serializers.ModelSerializer):
+class TechnologyMetricsSerializer(CachedModelSerializer):
+    """Serializer for technology metrics"""
+
+    class Meta:
+        model = TechnologyMetrics
+        list_serializer_class = FastListSerializer
+        fields = (
+            'id', 'technology', 'avg_latency_ms', 'min_latency_ms', 'max_latency_ms', 'median_latency_ms',
+            'total_attempts', 'successful_deliveries', 'failed_deliveries', 'max_concurrent_clients',
+            'messages_per_second', 'avg_connection_time_ms', 'total_data_transferred_bytes', 'client_server_measurements',
+            'last_test_id', 'source_app', 'last_updated', 'created_at'
+        )
+
+    def extend_representation(self, instance, ret):
+        """Read-only computed metrics, set directly instead of through ReadOnlyField objects"""
+        return self.add_computed_metrics(ret, instance.success_rate, instance.error_rate)
+
+    @staticmethod
+    def add_computed_metrics(ret, success_rate, error_rate):
+        """Add the computed metrics to a row of Meta.fields values; shared with the .values() list path"""
+        ret['success_rate'] = success_rate
+        ret['error_rate'] = error_rate
+        ret['avg_throughput'] = ret['messages_per_second']
+        ret['performance_grade'] = TechnologyMetrics.grade_performance(
+            ret['total_attempts'], success_rate, ret['avg_latency_ms']
+        )
+        return ret
+
+
+class AlertDeliveryLogSerializer(CachedModelSerializer):
     """Serializer for alert delivery logs"""
     success_rate = serializers.ReadOnlyField()
 
     class Meta:
         model = AlertDeliveryLog
-        fields = '__all__'
+        list_serializer_class = FastListSerializer
+        fields = (
+            'id', 'success_rate', 'technology', 'alert_title', 'alert_message', 'delivery_status',
+            'latency_ms', 'client_count', 'sent_at', 'metadata', 'client_server_test', 'test_id', 'source_app'
+        )
 
 
-class TestSessionSerializer(serializers.ModelSerializer):
+class TestSessionSerializer(CachedModelSerializer):
     """Serializer for test sessions"""
     success_rate = serializers.ReadOnlyField()
     duration_minutes = serializers.ReadOnlyField()
 
     class Meta:
         model = TestSession
-        fields = '__all__'
+        fields = (
+            'id', 'success_rate', 'duration_minutes', 'session_id', 'session_name', 'technologies_tested',
+            'configuration', 'started_at', 'completed_at', 'status', 'total_tests', 'successful_tests',
+            'failed_tests', 'client_server_testing', 'resource_monitoring_enabled', 'real_measurements'
+        )
 
     def validate_technologies_tested(self, value):
         """Validate technologies list"""
         if not isinstance(value, list):
             raise serializers.ValidationError("Technologies tested must be a list")
 
-        valid_technologies = ['websocket', 'longpolling', 'firebase', 'push']
         for tech in value:
-            if tech not in valid_technologies:
+            if not isinstance(tech, str) or tech not in _VALID_SESSION_TECHNOLOGIES:
                 raise serializers.ValidationError(f"Invalid technology: {tech}")
 
         return value
 
 
-class SystemResourcesSerializer(serializers.Serializer):
+class SystemResourcesSerializer(StaticSerializer):
     """Serializer for system resources"""
     monitoring_active = serializers.BooleanField()
     current_stats = serializers.DictField(required=False)
@@ -132,7 +254,7 @@ class SystemResourcesSerializer(serializers.Serializer):
     client_role = serializers.CharField(required=False)
 
 
-class HealthCheckSerializer(serializers.Serializer):
+class HealthCheckSerializer(StaticSerializer):
     """Serializer for health check response"""
     status = serializers.CharField()
     timestamp = serializers.FloatField()
@@ -145,7 +267,7 @@ class HealthCheckSerializer(serializers.Serializer):
     server_info = serializers.DictField(required=False)
 
 
-class ConnectivityCheckSerializer(serializers.Serializer):
+class ConnectivityCheckSerializer(StaticSerializer):
     """Serializer for connectivity check response"""
     overall_status = serializers.CharField()
     server_endpoints = serializers.DictField()
@@ -154,17 +276,17 @@ class ConnectivityCheckSerializer(serializers.Serializer):
     architecture = serializers.DictField(required=False)
 
 
-class LoadSimulationRequestSerializer(serializers.Serializer):
+class LoadSimulationRequestSerializer(StaticSerializer):
     """Serializer for load simulation request"""
     clients = serializers.IntegerField(min_value=1, max_value=20, default=5)
     duration = serializers.IntegerField(min_value=10, max_value=120, default=30)
     technology = serializers.ChoiceField(
-        choices=['websocket', 'longpolling', 'firebase'],
+        choices=_TECHNOLOGY_CHOICES,
         default='websocket'
     )
 
 
-class LoadSimulationResponseSerializer(serializers.Serializer):
+class LoadSimulationResponseSerializer(StaticSerializer):
     """Serializer for load simulation response"""
     status = serializers.CharField()
     message = serializers.CharField()
@@ -174,7 +296,7 @@ class LoadSimulationResponseSerializer(serializers.Serializer):
     architecture = serializers.CharField(required=False)
 
 
-class MetricsComparisonSerializer(serializers.Serializer):
+class MetricsComparisonSerializer(StaticSerializer):
     """Serializer for metrics comparison"""
     timestamp = serializers.FloatField()
     technologies = serializers.DictField()
@@ -183,7 +305,7 @@ class MetricsComparisonSerializer(serializers.Serializer):
     architecture = serializers.CharField(required=False)
 
 
-class LiveMetricsSerializer(serializers.Serializer):
+class LiveMetricsSerializer(StaticSerializer):
     """Serializer for live metrics"""
     live_metrics = serializers.DictField()
     system_metrics = serializers.DictField(required=False)
@@ -194,7 +316,7 @@ class LiveMetricsSerializer(serializers.Serializer):
     architecture = serializers.CharField(required=False)
 
 
-class EnhancedTestResultsSerializer(serializers.Serializer):
+class EnhancedTestResultsSerializer(StaticSerializer):
     """Serializer for enhanced test results"""
     test_id = serializers.CharField()
     test_type = serializers.CharField()
@@ -214,7 +336,7 @@ class EnhancedTestResultsSerializer(serializers.Serializer):
     server_role = serializers.CharField(required=False)
 
 
-class TechnologyTestResultSerializer(serializers.Serializer):
+class TechnologyTestResultSerializer(StaticSerializer):
     """Serializer for individual technology test results"""
     technology = serializers.CharField()
     status = serializers.CharField()
@@ -225,7 +347,7 @@ class TechnologyTestResultSerializer(serializers.Serializer):
     error = serializers.CharField(required=False)
 
 
-class TestSummarySerializer(serializers.Serializer):
+class TestSummarySerializer(StaticSerializer):
     """Serializer for test summary"""
     total_technologies_tested = serializers.IntegerField()
     successful_technologies = serializers.IntegerField()
@@ -236,7 +358,7 @@ class TestSummarySerializer(serializers.Serializer):
     testing_architecture = serializers.CharField(required=False)
 
 
-class TechnologyPerformanceSerializer(serializers.Serializer):
+class TechnologyPerformanceSerializer(StaticSerializer):
     """Serializer for individual technology performance"""
     success_rate = serializers.FloatField()
     avg_latency_ms = serializers.FloatField()
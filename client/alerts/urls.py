@@ -8,50 +8,66 @@ router = DefaultRouter()
 router.register(r'performance-tests', views.PerformanceTestViewSet, basename='performance-test')
 router.register(r'metrics', views.TechnologyMetricsViewSet, basename='metrics')
 
-urlpatterns = [
-    # Main pages
-    path('', views.connection_type_view, name='connection_type'),
-    path('connection-type/', views.connection_type_view, name='connection_type'),
-
-    # Alert technology pages
-    path('alerts/poll/', views.alerts_longpolling_view, name='alerts_longpolling'),
-    path('alerts/websocket/', views.alerts_websocket_view, name='alerts_websocket'),
-    path('alerts/push/', views.alerts_push_view, name='alerts_push'),
-
-    # Performance Testing Dashboard
-    path('test/', views.performance_test_dashboard, name='performance_test_dashboard'),
-
-    # API endpoints
-    path('api/', include(router.urls)),
+# ViewSet action views, built once
+run_performance_test = views.PerformanceTestViewSet.as_view({'post': 'run_test'})
+get_test_results = views.PerformanceTestViewSet.as_view({'get': 'results'})
+get_metrics_comparison = views.PerformanceTestViewSet.as_view({'get': 'get_metrics_comparison'})
+live_metrics_comparison = views.TechnologyMetricsViewSet.as_view({'get': 'live_comparison'})
 
+# Routes under api/, grouped so the resolver matches the prefix once
+api_patterns = router.urls + [
     # Enhanced Performance Testing API endpoints
-    path('api/start-enhanced-performance-test/',
+    path('start-enhanced-performance-test/',
          views.start_enhanced_performance_test,
          name='start_enhanced_performance_test'),
-    path('api/get-enhanced-test-results/',
+    path('get-enhanced-test-results/',
          views.get_enhanced_test_results,
          name='get_enhanced_test_results'),
-    path('api/get-system-resources/',
+    path('get-system-resources/',
          views.get_system_resources,
          name='get_system_resources'),
 
     # Additional CLIENT utility endpoints
-    path('api/server-connectivity/', views.server_connectivity_check, name='server_connectivity_check'),
-    path('api/simulate-load/', views.simulate_performance_load, name='simulate_performance_load'),
+    path('server-connectivity/', views.server_connectivity_check, name='server_connectivity_check'),
+    path('simulate-load/', views.simulate_performance_load, name='simulate_performance_load'),
 
     # Health check endpoint
-    path('api/health/', views.health_check, name='health_check'),
+    path('health/', views.health_check, name='health_check'),
+]
+
+# Routes under test/
+test_patterns = [
+    # Performance Testing Dashboard
+    path('', views.performance_test_dashboard, name='performance_test_dashboard'),
 
     # Legacy API endpoints for backwards compatibility
-    path('test/performance/run/', views.start_enhanced_performance_test, name='start_performance_test'),
-    path('test/performance/results/', views.get_enhanced_test_results, name='get_performance_results'),
-    path('test/performance/resources/', views.get_system_resources, name='get_system_resources_legacy'),
+    path('performance/', include([
+        path('run/', views.start_enhanced_performance_test, name='start_performance_test'),
+        path('results/', views.get_enhanced_test_results, name='get_performance_results'),
+        path('resources/', views.get_system_resources, name='get_system_resources_legacy'),
+    ])),
 
     # Legacy endpoints
-    path('test/run/', views.PerformanceTestViewSet.as_view({'post': 'run_test'}), name='run_performance_test'),
-    path('test/results/', views.PerformanceTestViewSet.as_view({'get': 'results'}), name='get_test_results'),
+    path('run/', run_performance_test, name='run_performance_test'),
+    path('results/', get_test_results, name='get_test_results'),
 
     # Live metrics endpoints
-    path('test/metrics/comparison/', views.PerformanceTestViewSet.as_view({'get': 'get_metrics_comparison'}), name='get_metrics_comparison'),
-    path('test/metrics/live/', views.TechnologyMetricsViewSet.as_view({'get': 'live_comparison'}), name='live_metrics_comparison'),
+    path('metrics/', include([
+        path('comparison/', get_metrics_comparison, name='get_metrics_comparison'),
+        path('live/', live_metrics_comparison, name='live_metrics_comparison'),
+    ])),
+]
+
+urlpatterns = [
+    # Main pages
+    path('', views.connection_type_view, name='connection_type'),
+    path('connection-type/', views.connection_type_view, name='connection_type'),
+
+    # Alert technology pages
+    path('alerts/poll/', views.alerts_longpolling_view, name='alerts_longpolling'),
+    path('alerts/websocket/', views.alerts_websocket_view, name='alerts_websocket'),
+    path('alerts/push/', views.alerts_push_view, name='alerts_push'),
+
+    path('test/', include(test_patterns)),
+    path('api/', include(api_patterns)),
 ]
@@ -1,6 +1,9 @@
 # alerts/views.py
 
+import atexit
+import base64
 import json
+import secrets
 import time
 import threading
 import uuid
@@ -9,36 +12,63 @@ import os
 import websocket
 import requests
 from datetime import datetime
+from functools import lru_cache
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Any, Optional
+from cachetools import TTLCache
 from django.shortcuts import render, redirect
-from django.http import JsonResponse
+from django.template.loader import get_template
+from django.http import HttpResponse, JsonResponse
+from django.views.decorators.cache import cache_page
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.conf import settings
+from django.db import connection
+from django.core.cache import cache
+from django.utils.cache import patch_cache_control
+from django.db.models import Case, ExpressionWrapper, F, FloatField, Max, Value, When
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
+from rest_framework.throttling import ScopedRateThrottle
 
 from .models import PerformanceTestResult, TechnologyMetrics
+from .renderers import ORJSONResponse
 from .serializers import (
     PerformanceTestResultSerializer,
+    PerformanceTestResultSummarySerializer,
     TechnologyMetricsSerializer
 )
 import logging
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    loads_json = orjson.loads
+except ImportError:
+    loads_json = json.loads
+
+# Background test and load runs share a few reused worker threads instead of one new thread per POST
+_TEST_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix='perftest')
+atexit.register(_TEST_EXECUTOR.shutdown, wait=False)
+
 
 class UnifiedResourceMonitor:
     """Unified resource monitor for CLIENT system during performance tests"""
 
+    HAS_LOADAVG = hasattr(os, 'getloadavg')
+    # net_connections() walks every socket on the host, so it is refreshed every Nth tick only
+    CONNECTIONS_SAMPLE_EVERY = 10
+
     def __init__(self):
         self.monitoring = False
         self.monitor_thread = None
         self.resource_data = []
         self.lock = threading.Lock()
+        # One handle for the life of the monitor; cpu_percent() measures since its previous call
+        self._process = psutil.Process()
 
     def start(self, interval: float = 0.5):
         """Start resource monitoring"""
@@ -60,20 +90,24 @@ class UnifiedResourceMonitor:
 
     def _monitor_loop(self, interval: float):
         """Monitor system resources in loop"""
+        tick = 0
+        connections = 0
         while self.monitoring:
             try:
                 cpu_percent = psutil.cpu_percent(interval=0.1)
                 memory = psutil.virtual_memory()
 
-                try:
-                    connections = len(psutil.net_connections())
-                except (psutil.AccessDenied, OSError):
-                    connections = 0
+                if tick % self.CONNECTIONS_SAMPLE_EVERY == 0:
+                    try:
+                        connections = len(psutil.net_connections(kind='tcp'))
+                    except (psutil.AccessDenied, OSError):
+                        connections = 0
+                tick += 1
 
                 try:
-                    process = psutil.Process()
-                    process_memory = process.memory_info()
-                    process_cpu = process.cpu_percent()
+                    with self._process.oneshot():
+                        process_memory = self._process.memory_info()
+                        process_cpu = self._process.cpu_percent()
                 except (psutil.AccessDenied, psutil.NoSuchProcess):
                     process_memory = None
                     process_cpu = 0
@@ -87,7 +121,7 @@ class UnifiedResourceMonitor:
                         'process_memory_mb': process_memory.rss / (1024 ** 2) if process_memory else 0,
                         'process_cpu_percent': process_cpu,
                         'active_connections': connections,
-                        'load_avg': os.getloadavg()[0] if hasattr(os, 'getloadavg') else 0
+                        'load_avg': os.getloadavg()[0] if self.HAS_LOADAVG else 0
                     })
 
                     # Keep only last 1000 entries
@@ -133,7 +167,7 @@ class UnifiedResourceMonitor:
             cpu_percent = psutil.cpu_percent()
 
             try:
-                connections = len(psutil.net_connections())
+                connections = len(psutil.net_connections(kind='tcp'))
             except (psutil.AccessDenied, OSError):
                 connections = 0
 
@@ -161,6 +195,9 @@ class UnifiedTestResultsStorage:
     def store_results(self, test_id: str, results: dict):
         """Store test results with metadata"""
         with self._lock:
+            # Re-inserting keeps both dicts ordered by stored_at, oldest first
+            self._results.pop(test_id, None)
+            self._metadata.pop(test_id, None)
             self._results[test_id] = results
             self._metadata[test_id] = {
                 'stored_at': time.time() * 1000,
@@ -178,10 +215,8 @@ class UnifiedTestResultsStorage:
             if test_id:
                 return self._results.get(test_id, {})
             elif self._results:
-                # Return latest test
-                latest_id = max(self._metadata.keys(),
-                                key=lambda k: self._metadata[k]['stored_at'])
-                return self._results[latest_id]
+                # Return latest test; _results is kept in stored_at order
+                return self._results[next(reversed(self._results))]
             else:
                 return {}
 
@@ -191,17 +226,10 @@ class UnifiedTestResultsStorage:
 
     def cleanup_old_results(self, keep_latest: int = 10):
         """Keep only the latest N test results"""
-        if len(self._results) <= keep_latest:
-            return
-
-        sorted_ids = sorted(self._metadata.keys(),
-                            key=lambda k: self._metadata[k]['stored_at'],
-                            reverse=True)
-
-        ids_to_remove = sorted_ids[keep_latest:]
-        for test_id in ids_to_remove:
-            self._results.pop(test_id, None)
-            self._metadata.pop(test_id, None)
+        while len(self._results) > keep_latest:
+            oldest_id = next(iter(self._results))
+            self._results.pop(oldest_id, None)
+            self._metadata.pop(oldest_id, None)
 
     def get_all_test_ids(self) -> List[str]:
         """Get all available test IDs"""
@@ -226,10 +254,10 @@ class EnhancedPerformanceTestRunner:
 
     def run_enhanced_tests(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Run enhanced performance tests against SERVER"""
-        test_id = config.get('test_id', f'test_{int(time.time())}_{str(uuid.uuid4())[:8]}')
+        test_id = config.get('test_id', f'test_{time.monotonic_ns():x}_{uuid.uuid4().hex[:8]}')
 
         # FIXED: Replace arrow with ASCII for Windows compatibility
-        logger.info(f"Starting enhanced CLIENT->SERVER performance tests: {test_id}")
+        logger.info("Starting enhanced CLIENT->SERVER performance tests: %s", test_id)
 
         # Start resource monitoring if enabled
         if config.get('enable_resource_monitoring', True):
@@ -253,33 +281,30 @@ class EnhancedPerformanceTestRunner:
         # Store initial results
         self.results_storage.store_results(test_id, results)
 
-        # Run tests for each technology
-        for technology in config.get('technologies', []):
-            try:
-                logger.info(f"Testing {technology} CLIENT->SERVER...")
-
-                if technology == 'websocket':
-                    tech_results = self._test_websocket_performance(config)
-                elif technology == 'longpolling':
-                    tech_results = self._test_longpolling_performance(config)
-                elif technology == 'firebase':
-                    tech_results = self._test_firebase_performance(config)
+        # Technologies are independent and network-bound, so they run side by side
+        # and the HTTP-based ones share one pooled session for the whole run
+        with requests.Session() as session:
+            testers = {
+                'websocket': lambda: self._test_websocket_performance(config),
+                'longpolling': lambda: self._test_longpolling_performance(config, session),
+                'firebase': lambda: self._test_firebase_performance(config, session)
+            }
+
+            technologies = []
+            for technology in config.get('technologies', []):
+                if technology in testers:
+                    technologies.append(technology)
                 else:
                     logger.warning(f"Unknown technology: {technology}")
-                    continue
-
-                results['results'][technology] = tech_results
-                logger.info(f"Completed {technology} CLIENT->SERVER testing")
 
-            except Exception as e:
-                logger.error(f"Error testing {technology}: {e}")
-                results['results'][technology] = {
-                    'technology': technology,
-                    'status': 'error',
-                    'error': str(e),
-                    'real_testing': True,
-                    'client_server_testing': True
-                }
+            if technologies:
+                with ThreadPoolExecutor(max_workers=len(technologies), thread_name_prefix='perftest-tech') as executor:
+                    futures = {
+                        technology: executor.submit(self._run_technology_test, technology, testers[technology])
+                        for technology in technologies
+                    }
+                    for technology, future in futures.items():
+                        results['results'][technology] = future.result()
 
         # Finalize results
         results['status'] = 'completed'
@@ -296,9 +321,27 @@ class EnhancedPerformanceTestRunner:
         # Store final results
         self.results_storage.store_results(test_id, results)
 
-        logger.info(f"Enhanced CLIENT->SERVER performance tests completed: {test_id}")
+        logger.info("Enhanced CLIENT->SERVER performance tests completed: %s", test_id)
         return results
 
+    def _run_technology_test(self, technology: str, tester) -> Dict[str, Any]:
+        """Run one technology's tester, converting failures into an error entry"""
+        try:
+            logger.info("Testing %s CLIENT->SERVER...", technology)
+            tech_results = tester()
+            logger.info("Completed %s CLIENT->SERVER testing", technology)
+            return tech_results
+
+        except Exception as e:
+            logger.error(f"Error testing {technology}: {e}")
+            return {
+                'technology': technology,
+                'status': 'error',
+                'error': str(e),
+                'real_testing': True,
+                'client_server_testing': True
+            }
+
     def get_test_results(self, test_id: Optional[str] = None) -> Dict[str, Any]:
         """Get test results by ID or latest"""
         return self.results_storage.get_results(test_id)
@@ -457,10 +500,11 @@ class EnhancedPerformanceTestRunner:
             }
 
         # FIXED: Replace arrow with ASCII for Windows compatibility
-        logger.info(f"WebSocket CLIENT->SERVER test completed: {len(successful_tests)}/{len(test_results)} successful")
+        logger.info("WebSocket CLIENT->SERVER test completed: %d/%d successful", len(successful_tests), len(test_results))
         return results
 
-    def _test_longpolling_performance(self, config: Dict[str, Any]) -> Dict[str, Any]:
+    def _test_longpolling_performance(self, config: Dict[str, Any],
+                                      session: Optional[requests.Session] = None) -> Dict[str, Any]:
         """Test Long Polling performance against SERVER"""
         # FIXED: Replace arrow with ASCII for Windows compatibility
         logger.info("Starting Long Polling CLIENT->SERVER performance test")
@@ -474,7 +518,7 @@ class EnhancedPerformanceTestRunner:
         }
 
         num_tests = min(config.get('e2e_clients', 5), 10)
-        session = requests.Session()
+        session = session or requests.Session()
 
         def test_single_longpoll(client_id: int) -> Dict[str, Any]:
             try:
@@ -544,10 +588,11 @@ class EnhancedPerformanceTestRunner:
 
         # FIXED: Replace arrow with ASCII for Windows compatibility
         logger.info(
-            f"Long Polling CLIENT->SERVER test completed: {len(successful_tests)}/{len(test_results)} successful")
+            "Long Polling CLIENT->SERVER test completed: %d/%d successful", len(successful_tests), len(test_results))
         return results
 
-    def _test_firebase_performance(self, config: Dict[str, Any]) -> Dict[str, Any]:
+    def _test_firebase_performance(self, config: Dict[str, Any],
+                                   session: Optional[requests.Session] = None) -> Dict[str, Any]:
         """Enhanced Firebase performance test with better token handling"""
         logger.info("Starting Enhanced Firebase performance test")
 
@@ -560,7 +605,7 @@ class EnhancedPerformanceTestRunner:
             'end_to_end_testing': True
         }
 
-        session = requests.Session()
+        session = session or requests.Session()
         test_results = []
 
         # Step 1: Register enhanced test tokens
@@ -570,9 +615,6 @@ class EnhancedPerformanceTestRunner:
         real_test_tokens = []
         for i in range(3):
             # FCM tokens are base64-like strings with specific patterns
-            import base64
-            import secrets
-
             # Generate a more realistic test token (still fake, but better format)
             token_data = f"test_device_{i}_{int(time.time())}_performance_test"
             encoded_data = base64.b64encode(token_data.encode()).decode()
@@ -605,7 +647,7 @@ class EnhancedPerformanceTestRunner:
                 })
 
                 if response.status_code in [200, 201]:
-                    logger.info(f"[SUCCESS] Registered enhanced test token {i + 1}: {registration_time:.2f}ms")
+                    logger.info("[SUCCESS] Registered enhanced test token %d: %.2fms", i + 1, registration_time)
                 else:
                     logger.error(f"[FAILED] Failed to register token {i + 1}: HTTP {response.status_code}")
 
@@ -641,7 +683,7 @@ class EnhancedPerformanceTestRunner:
                     'active_tokens': stats_data.get('active_tokens', 0),
                     'tokens_available_for_testing': stats_data.get('active_tokens', 0) > 0
                 })
-                logger.info(f"[SUCCESS] Server has {stats_data.get('active_tokens', 0)} active tokens")
+                logger.info("[SUCCESS] Server has %s active tokens", stats_data.get('active_tokens', 0))
 
             test_results.append(stats_result)
 
@@ -681,7 +723,7 @@ class EnhancedPerformanceTestRunner:
                     'api_accessible': True,
                     'enhanced_testing': True
                 })
-                logger.info(f"[SUCCESS] Firebase API accessible: {api_time:.2f}ms response time")
+                logger.info("[SUCCESS] Firebase API accessible: %.2fms response time", api_time)
 
                 # Optional: Test the send-sequential endpoint (without expecting real delivery)
                 try:
@@ -706,7 +748,7 @@ class EnhancedPerformanceTestRunner:
                             'tokens_targeted': len(real_test_tokens),
                             'api_test_successful': True
                         })
-                        logger.info(f"[SUCCESS] Send API accessible: {send_api_time:.2f}ms response time")
+                        logger.info("[SUCCESS] Send API accessible: %.2fms response time", send_api_time)
 
                         # Note: Test tokens will be rejected by Firebase, but the API call succeeds
                         send_result.update({
@@ -755,7 +797,7 @@ class EnhancedPerformanceTestRunner:
                 })
 
                 if ping_response.status_code == 200:
-                    logger.info(f"[SUCCESS] API ping {i + 1}: {latency:.2f}ms")
+                    logger.info("[SUCCESS] API ping %d: %.2fms", i + 1, latency)
                 else:
                     logger.warning(f"[WARNING] API ping {i + 1}: HTTP {ping_response.status_code}")
 
@@ -814,7 +856,7 @@ class EnhancedPerformanceTestRunner:
             }
 
         logger.info(
-            f"Enhanced Firebase test completed: {len(successful_tests)}/{len(all_tests)} tests successful")
+            "Enhanced Firebase test completed: %d/%d tests successful", len(successful_tests), len(all_tests))
         return results
 
 
@@ -827,72 +869,100 @@ resource_monitor = UnifiedResourceMonitor()
 # TEMPLATE VIEWS
 # =============================================================================
 
+# Page contexts only depend on settings, so they are built once at import
+_PERFORMANCE_TEST_URLS = getattr(settings, 'PERFORMANCE_TEST_URLS', {})
+
+_WEBSOCKET_CONTEXT = {
+    'websocket_url': _PERFORMANCE_TEST_URLS.get('WEBSOCKET_URL', 'ws://127.0.0.1:8001/ws/alerts/'),
+    'server_port': '8001',
+    'server_name': 'ServerSide Alert Server',
+    'client_role': 'CLIENT'
+}
+
+_LONGPOLLING_CONTEXT = {
+    'longpolling_url': _PERFORMANCE_TEST_URLS.get('LONGPOLLING_URL', 'http://127.0.0.1:8001/api/poll/alerts/'),
+    'server_port': '8001',
+    'server_name': 'ServerSide Alert Server',
+    'client_role': 'CLIENT'
+}
+
+_PUSH_CONTEXT = {
+    'push_api_url': _PERFORMANCE_TEST_URLS.get('FIREBASE_URL', 'http://127.0.0.1:8001/api/push/'),
+    'server_port': '8001',
+    'server_name': 'ServerSide Alert Server',
+    'client_role': 'CLIENT'
+}
+
+_DASHBOARD_CONTEXT = {
+    'server_urls': getattr(settings, 'PERFORMANCE_TEST_URLS', {
+        'WEBSOCKET_URL': 'ws://127.0.0.1:8001/ws/alerts/',
+        'LONGPOLLING_URL': 'http://127.0.0.1:8001/api/poll/alerts/',
+        'FIREBASE_URL': 'http://127.0.0.1:8001/api/push/'
+    }),
+    'firebase_config': getattr(settings, 'FIREBASE_CONFIG', {}),
+    'client_role': 'CLIENT',
+    'server_role': 'SERVER'
+}
+
+# Token-free pages are static for a given deployment. Pages that carry a CSRF token or rely on
+# the csrftoken cookie are not cached: cache_page stores the response before CsrfViewMiddleware
+# sets the cookie, so every visitor would get the first visitor's token.
+PAGE_CACHE_SECONDS = 60 * 15
+
+
+def _page_template(template_name: str):
+    """Resolve a page template through Django's loaders"""
+    return get_template(template_name)
+
+
+if not settings.DEBUG:
+    # Outside development templates never change, so skip the per-render loader walk;
+    # with DEBUG on, Django's loaders must see edits
+    _page_template = lru_cache(maxsize=None)(_page_template)
+
+
+def _render_page(request, template_name: str, context: Dict[str, Any]) -> HttpResponse:
+    """Render a static page through its pre-resolved template"""
+    return HttpResponse(_page_template(template_name).render(context, request))
+
+
+# Chosen connection type -> URL name of its alerts page
+_CONNECTION_ROUTES = {
+    'websocket': 'alerts_websocket',
+    'long_polling': 'alerts_longpolling',
+    'push': 'alerts_push'
+}
+
+
 def connection_type_view(request):
     """Main entry point - choose alert technology"""
     if request.method == 'POST':
-        connection_type = request.POST.get('connection_type')
-
-        if connection_type == "websocket":
-            return redirect('alerts_websocket')
-        elif connection_type == "long_polling":
-            return redirect('alerts_longpolling')
-        elif connection_type == "push":
-            return redirect('alerts_push')
-        else:
-            return redirect('connection_type')
+        return redirect(_CONNECTION_ROUTES.get(request.POST.get('connection_type'), 'connection_type'))
 
     return render(request, 'connection_type.html')
 
 
+@cache_page(PAGE_CACHE_SECONDS)
 def alerts_websocket_view(request):
     """WebSocket alerts page"""
-    context = {
-        'websocket_url': getattr(settings, 'PERFORMANCE_TEST_URLS', {}).get('WEBSOCKET_URL',
-                                                                            'ws://127.0.0.1:8001/ws/alerts/'),
-        'server_port': '8001',
-        'server_name': 'ServerSide Alert Server',
-        'client_role': 'CLIENT'
-    }
-    return render(request, 'alerts/alerts_websocket.html', context)
+    return _render_page(request, 'alerts/alerts_websocket.html', _WEBSOCKET_CONTEXT)
 
 
+@cache_page(PAGE_CACHE_SECONDS)
 def alerts_longpolling_view(request):
     """Long polling alerts page"""
-    context = {
-        'longpolling_url': getattr(settings, 'PERFORMANCE_TEST_URLS', {}).get('LONGPOLLING_URL',
-                                                                              'http://127.0.0.1:8001/api/poll/alerts/'),
-        'server_port': '8001',
-        'server_name': 'ServerSide Alert Server',
-        'client_role': 'CLIENT'
-    }
-    return render(request, 'alerts/alerts_longpolling.html', context)
+    return _render_page(request, 'alerts/alerts_longpolling.html', _LONGPOLLING_CONTEXT)
 
 
+@cache_page(PAGE_CACHE_SECONDS)
 def alerts_push_view(request):
     """Push notifications alerts page"""
-    context = {
-        'push_api_url': getattr(settings, 'PERFORMANCE_TEST_URLS', {}).get('FIREBASE_URL',
-                                                                           'http://127.0.0.1:8001/api/push/'),
-        'server_port': '8001',
-        'server_name': 'ServerSide Alert Server',
-        'client_role': 'CLIENT'
-    }
-    return render(request, 'alerts/alerts_push.html', context)
+    return _render_page(request, 'alerts/alerts_push.html', _PUSH_CONTEXT)
 
 
 def performance_test_dashboard(request):
     """Performance testing dashboard"""
-    context = {
-        'server_urls': getattr(settings, 'PERFORMANCE_TEST_URLS', {
-            'WEBSOCKET_URL': 'ws://127.0.0.1:8001/ws/alerts/',
-            'LONGPOLLING_URL': 'http://127.0.0.1:8001/api/poll/alerts/',
-            'FIREBASE_URL': 'http://127.0.0.1:8001/api/push/'
-        }),
-        'firebase_config': getattr(settings, 'FIREBASE_CONFIG', {}),
-        'client_role': 'CLIENT',
-        'server_role': 'SERVER'
-    }
-    return render(request, 'alerts/performance_dashboard.html', context)
+    return _render_page(request, 'alerts/performance_dashboard.html', _DASHBOARD_CONTEXT)
 
 
 # =============================================================================
@@ -904,7 +974,7 @@ def performance_test_dashboard(request):
 def start_enhanced_performance_test(request):
     """Start enhanced CLIENT->SERVER performance test"""
     try:
-        data = json.loads(request.body)
+        data = loads_json(request.body)
 
         # Validate and prepare configuration
         config = {
@@ -920,7 +990,7 @@ def start_enhanced_performance_test(request):
         }
 
         # Generate test ID
-        test_id = f'enhanced_test_{int(time.time())}_{str(uuid.uuid4())[:8]}'
+        test_id = f'enhanced_test_{time.monotonic_ns():x}_{uuid.uuid4().hex[:8]}'
         config['test_id'] = test_id
 
         # Run tests in background thread
@@ -928,7 +998,7 @@ def start_enhanced_performance_test(request):
             try:
                 results = test_runner.run_enhanced_tests(config)
                 # FIXED: Replace arrow with ASCII for Windows compatibility
-                logger.info(f"Enhanced CLIENT->SERVER performance tests completed: {test_id}")
+                logger.info("Enhanced CLIENT->SERVER performance tests completed: %s", test_id)
             except Exception as e:
                 logger.error(f"Enhanced test execution error: {e}")
                 error_results = {
@@ -941,9 +1011,7 @@ def start_enhanced_performance_test(request):
                 }
                 test_runner.results_storage.store_results(test_id, error_results)
 
-        test_thread = threading.Thread(target=run_tests)
-        test_thread.daemon = True
-        test_thread.start()
+        _TEST_EXECUTOR.submit(run_tests)
 
         return JsonResponse({
             'status': 'started',
@@ -1006,7 +1074,7 @@ def get_enhanced_test_results(request):
                 'testing_direction': 'CLIENT->SERVER'  # FIXED: ASCII arrow
             }
 
-            return JsonResponse(results)
+            return ORJSONResponse(results)
         else:
             return JsonResponse({
                 'error': 'No test results found',
@@ -1109,7 +1177,6 @@ def health_check(request):
 
         # Check database connectivity - with error handling
         try:
-            from django.db import connection
             with connection.cursor() as cursor:
                 cursor.execute("SELECT 1")
                 cursor.fetchone()  # Actually fetch the result
@@ -1131,7 +1198,6 @@ def health_check(request):
 
         # Check system resources - with error handling
         try:
-            import psutil
             memory = psutil.virtual_memory()
             cpu_percent = psutil.cpu_percent(interval=0.1)
 
@@ -1155,7 +1221,6 @@ def health_check(request):
 
         # Test SERVER connectivity - with better error handling
         try:
-            import requests
             server_response = requests.get('http://127.0.0.1:8001/api/status/', timeout=5)
 
             if server_response.status_code == 200:
@@ -1276,29 +1341,23 @@ def server_connectivity_check(request):
 def simulate_performance_load(request):
     """Simulate performance load for testing (CLIENT->SERVER)"""
     try:
-        data = json.loads(request.body)
+        data = loads_json(request.body)
 
         num_clients = min(data.get('clients', 5), 20)  # Limit to prevent overload
         duration = min(data.get('duration', 30), 120)  # Max 2 minutes
         technology = data.get('technology', 'websocket')
 
         # FIXED: Replace arrow with ASCII for Windows compatibility
-        logger.info(f"Starting CLIENT->SERVER load simulation: {num_clients} clients, {duration}s, {technology}")
+        logger.info("Starting CLIENT->SERVER load simulation: %s clients, %ss, %s", num_clients, duration, technology)
 
         def run_load_test():
-            if technology == 'websocket':
-                return _simulate_websocket_load(num_clients, duration)
-            elif technology == 'longpolling':
-                return _simulate_longpolling_load(num_clients, duration)
-            elif technology == 'firebase':
-                return _simulate_firebase_load(num_clients, duration)
-            else:
+            simulator = LOAD_SIMULATORS.get(technology)
+            if simulator is None:
                 return {'error': f'Unknown technology: {technology}'}
+            return simulator(num_clients, duration)
 
         # Run in background
-        load_thread = threading.Thread(target=run_load_test)
-        load_thread.daemon = True
-        load_thread.start()
+        _TEST_EXECUTOR.submit(run_load_test)
 
         return JsonResponse({
             'status': 'started',
@@ -1357,7 +1416,8 @@ def _simulate_websocket_load(num_clients: int, duration: int) -> dict:
 
     # FIXED: Replace arrow with ASCII for Windows compatibility
     logger.info(
-        f"WebSocket CLIENT->SERVER load test completed: {len([r for r in results if r['success']])}/{len(results)} successful")
+        "WebSocket CLIENT->SERVER load test completed: %d/%d successful",
+        sum(1 for r in results if r['success']), len(results))
     return {'technology': 'websocket', 'results': results, 'client_server_test': True}
 
 
@@ -1402,7 +1462,8 @@ def _simulate_longpolling_load(num_clients: int, duration: int) -> dict:
 
     # FIXED: Replace arrow with ASCII for Windows compatibility
     logger.info(
-        f"Long Polling CLIENT->SERVER load test completed: {len([r for r in results if r['success']])}/{len(results)} successful")
+        "Long Polling CLIENT->SERVER load test completed: %d/%d successful",
+        sum(1 for r in results if r['success']), len(results))
     return {'technology': 'longpolling', 'results': results, 'client_server_test': True}
 
 
@@ -1459,7 +1520,8 @@ def _simulate_firebase_load(num_clients: int, duration: int) -> dict:
 
         # FIXED: Replace arrow with ASCII for Windows compatibility
         logger.info(
-            f"Firebase CLIENT->SERVER load test completed: {len(registered_tokens)} tokens, {len(notification_results)} notifications")
+            "Firebase CLIENT->SERVER load test completed: %d tokens, %d notifications",
+            len(registered_tokens), len(notification_results))
         return {
             'technology': 'firebase',
             'registered_tokens': len(registered_tokens),
@@ -1473,15 +1535,40 @@ def _simulate_firebase_load(num_clients: int, duration: int) -> dict:
         return {'technology': 'firebase', 'error': str(e), 'client_server_test': True}
 
 
+# Technology -> load simulator(num_clients, duration)
+LOAD_SIMULATORS = {
+    'websocket': _simulate_websocket_load,
+    'longpolling': _simulate_longpolling_load,
+    'firebase': _simulate_firebase_load
+}
+
+
 # =============================================================================
 # LEGACY VIEWSETS FOR BACKWARD COMPATIBILITY
 # =============================================================================
 
-class PerformanceTestViewSet(viewsets.ModelViewSet):
+class PerformanceTestViewSet(viewsets.ReadOnlyModelViewSet):
     """ViewSet for performance test management (Legacy with enhanced backend)"""
     queryset = PerformanceTestResult.objects.all()
     serializer_class = PerformanceTestResultSerializer
     permission_classes = [AllowAny]
+    throttle_scope = 'metrics'
+
+    FINISHED_STATUSES = ('completed', 'failed', 'error')
+
+    # The list view skips the JSON blobs; detail views still return the full row
+    list_deferred_fields = ('test_config', 'metrics', 'error_message')
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            return queryset.defer(*self.list_deferred_fields)
+        return queryset
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return PerformanceTestResultSummarySerializer
+        return super().get_serializer_class()
 
     @action(detail=False, methods=['post'])
     def run_test(self, request):
@@ -1499,7 +1586,12 @@ class PerformanceTestViewSet(viewsets.ModelViewSet):
             # Add legacy compatibility markers
             results['legacy_compatibility'] = True
             results['enhanced_backend'] = True
-            return Response(results, status=status.HTTP_200_OK)
+            response = Response(results, status=status.HTTP_200_OK)
+
+            # A finished test addressed by id never changes, so pollers may reuse it client-side
+            if test_id and results.get('status') in self.FINISHED_STATUSES:
+                patch_cache_control(response, public=True, max_age=60)
+            return response
         else:
             return Response({
                 'error': 'No test results found',
@@ -1507,50 +1599,72 @@ class PerformanceTestViewSet(viewsets.ModelViewSet):
                 'client_role': 'CLIENT'
             }, status=status.HTTP_404_NOT_FOUND)
 
-    @action(detail=False, methods=['get'])
-    def get_metrics_comparison(self, request):
-        """Metrics comparison from CLIENT perspective"""
-        try:
-            comparison_data = {
-                'timestamp': time.time() * 1000,
-                'technologies': {},
-                'client_perspective': True,
-                'role': 'CLIENT',
-                'architecture': 'CLIENT->SERVER'  # FIXED: ASCII arrow
+    # Per-technology latency statistic, in lookup order
+    LATENCY_STAT_KEYS = ('avg_connection_time_ms', 'avg_request_time_ms', 'avg_registration_time_ms')
+
+    @classmethod
+    def _comparison_metrics(cls, stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Build one technology's comparison entry from its test statistics"""
+        avg_latency = next((stats[key] for key in cls.LATENCY_STAT_KEYS if key in stats), 0)
+        return {
+            'success_rate': stats.get('success_rate', 0),
+            'total_tests': stats.get('total_tests', stats.get('total_token_tests', 0)),
+            'status': 'active',
+            'client_server_testing': True,
+            'avg_latency_ms': avg_latency
+        }
+
+    # Polling dashboards share one comparison build per second; ?fresh=1 bypasses it
+    _comparison_cache = TTLCache(maxsize=1, ttl=1.0)
+    _comparison_lock = threading.Lock()
+
+    def _build_metrics_comparison(self) -> Dict[str, Any]:
+        """Assemble the comparison payload from the latest test results"""
+        comparison_data = {
+            'timestamp': time.time_ns() // 1_000_000,
+            'technologies': {},
+            'client_perspective': True,
+            'role': 'CLIENT',
+            'architecture': 'CLIENT->SERVER'  # FIXED: ASCII arrow
+        }
+
+        # Get metrics from latest test results
+        latest_results = test_runner.get_test_results()
+        if latest_results and latest_results.get('results'):
+            comparison_data['technologies'] = {
+                tech: self._comparison_metrics(tech_data['statistics'])
+                for tech, tech_data in latest_results['results'].items()
+                if 'statistics' in tech_data
+            }
+        else:
+            comparison_data['technologies'] = {
+                'status': 'no_data_available',
+                'message': 'Run enhanced CLIENT->SERVER performance tests to see measurements'
             }
 
-            # Get metrics from latest test results
-            latest_results = test_runner.get_test_results()
-            if latest_results and latest_results.get('results'):
-                for tech, tech_data in latest_results.get('results', {}).items():
-                    if 'statistics' in tech_data:
-                        stats = tech_data['statistics']
-
-                        metrics = {
-                            'success_rate': stats.get('success_rate', 0),
-                            'total_tests': stats.get('total_tests', stats.get('total_token_tests', 0)),
-                            'status': 'active',
-                            'client_server_testing': True
-                        }
-
-                        # Extract appropriate latency metric
-                        if 'avg_connection_time_ms' in stats:
-                            metrics['avg_latency_ms'] = stats['avg_connection_time_ms']
-                        elif 'avg_request_time_ms' in stats:
-                            metrics['avg_latency_ms'] = stats['avg_request_time_ms']
-                        elif 'avg_registration_time_ms' in stats:
-                            metrics['avg_latency_ms'] = stats['avg_registration_time_ms']
-                        else:
-                            metrics['avg_latency_ms'] = 0
-
-                        comparison_data['technologies'][tech] = metrics
-            else:
-                comparison_data['technologies'] = {
-                    'status': 'no_data_available',
-                    'message': 'Run enhanced CLIENT->SERVER performance tests to see measurements'
-                }
+        return comparison_data
+
+    @action(detail=False, methods=['get'], throttle_classes=[ScopedRateThrottle])
+    def get_metrics_comparison(self, request):
+        """Metrics comparison from CLIENT perspective
 
-            return Response(comparison_data, status=status.HTTP_200_OK)
+        Built from in-process test results, not upstream requests, so it stays a sync view.
+        """
+        try:
+            fresh = request.query_params.get('fresh') == '1'
+            with self._comparison_lock:
+                comparison_data = None if fresh else self._comparison_cache.get('comparison')
+                if comparison_data is None:
+                    comparison_data = self._build_metrics_comparison()
+                    self._comparison_cache['comparison'] = comparison_data
+
+            response = Response(comparison_data, status=status.HTTP_200_OK)
+            if fresh:
+                # A forced rebuild must not be served to other clients from a shared cache
+                patch_cache_control(response, no_store=True)
+            else:
+                patch_cache_control(response, public=True, max_age=1)
+            return response
 
         except Exception as e:
             logger.error(f"Failed to get metrics comparison: {e}")
@@ -1566,38 +1680,82 @@ class TechnologyMetricsViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = TechnologyMetrics.objects.all()
     serializer_class = TechnologyMetricsSerializer
     permission_classes = [AllowAny]
+    throttle_scope = 'metrics'
+
+    @staticmethod
+    def _rate_expression(count_field):
+        """SQL equivalent of the model's percentage-of-attempts properties"""
+        return Case(
+            When(total_attempts=0, then=Value(0.0)),
+            default=ExpressionWrapper(F(count_field) * 100.0 / F('total_attempts'), output_field=FloatField()),
+            output_field=FloatField()
+        )
+
+    def list(self, request, *args, **kwargs):
+        """List metrics straight from .values() rows, skipping model and serializer instantiation"""
+        serializer_class = self.get_serializer_class()
+        rows = self.filter_queryset(self.get_queryset()).annotate(
+            success_rate=self._rate_expression('successful_deliveries'),
+            error_rate=self._rate_expression('failed_deliveries')
+        ).values(*serializer_class.Meta.fields, 'success_rate', 'error_rate')
+
+        page = self.paginate_queryset(rows)
+        data = [
+            serializer_class.add_computed_metrics(row, row['success_rate'], row['error_rate'])
+            for row in (rows if page is None else page)
+        ]
+
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
+
+    def _live_metrics(self) -> Dict[str, Any]:
+        """Per-technology metrics as plain tuples; success_rate is computed in SQL"""
+        rows = TechnologyMetrics.objects.annotate(
+            success_rate=self._rate_expression('successful_deliveries')
+        ).values_list(
+            'technology', 'avg_latency_ms', 'success_rate', 'messages_per_second',
+            'total_attempts', 'last_updated'
+        )
+        return {
+            technology: {
+                'avg_latency_ms': avg_latency,
+                'success_rate': success_rate,
+                'messages_per_second': messages_per_second,
+                'total_attempts': total_attempts,
+                'last_updated': last_updated.isoformat(),
+                'client_measurements': True
+            }
+            for technology, avg_latency, success_rate, messages_per_second, total_attempts, last_updated
+            in rows.iterator(chunk_size=256)
+        }
 
-    @action(detail=False, methods=['get'])
+    @action(detail=False, methods=['get'], throttle_classes=[ScopedRateThrottle])
     def live_comparison(self, request):
         """Live performance comparison from CLIENT measurements"""
         try:
-            metrics = {}
-
-            # Get metrics from database
-            for tech_obj in TechnologyMetrics.objects.all():
-                metrics[tech_obj.technology] = {
-                    'avg_latency_ms': tech_obj.avg_latency_ms,
-                    'success_rate': tech_obj.success_rate,
-                    'messages_per_second': tech_obj.messages_per_second,
-                    'total_attempts': tech_obj.total_attempts,
-                    'last_updated': tech_obj.last_updated.isoformat(),
-                    'client_measurements': True
-                }
+            # Any metrics update bumps max(last_updated), so the key doubles as the invalidation
+            version = TechnologyMetrics.objects.aggregate(m=Max('last_updated'))['m']
+            cache_key = f"live_cmp:{version.timestamp() if version else 0}"
+            metrics = cache.get_or_set(cache_key, self._live_metrics, timeout=30)
 
             # Add real-time system metrics if monitoring
             system_metrics = {}
             if resource_monitor.monitoring:
                 system_metrics = resource_monitor.get_current_stats()
 
-            return Response({
+            # Fixed-shape payload: encode directly and skip DRF content negotiation
+            response = ORJSONResponse({
                 'live_metrics': metrics,
                 'system_metrics': system_metrics,
-                'timestamp': time.time() * 1000,
+                'timestamp': time.time_ns() // 1_000_000,
                 'monitoring': resource_monitor.monitoring,
                 'client_measurements_only': True,
                 'role': 'CLIENT',
                 'architecture': 'CLIENT->SERVER'  # FIXED: ASCII arrow
-            }, status=status.HTTP_200_OK)
+            })
+            patch_cache_control(response, public=True, max_age=1)
+            return response
 
         except Exception as e:
             logger.error(f"Failed to get live comparison: {e}")
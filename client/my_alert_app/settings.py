@@ -46,14 +46,18 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.AllowAny',
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'alerts.renderers.ORJSONRenderer',
         'rest_framework.renderers.BrowsableAPIRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
-        'rest_framework.parsers.JSONParser',
+        'alerts.renderers.ORJSONParser',
         'rest_framework.parsers.FormParser',
         'rest_framework.parsers.MultiPartParser',
     ],
+    'DEFAULT_THROTTLE_RATES': {
+        # Comparison endpoints opt in via ScopedRateThrottle
+        'metrics': '120/min',
+    },
     'UNAUTHENTICATED_USER': None,
     'UNAUTHENTICATED_TOKEN': None,
     'DEFAULT_AUTHENTICATION_CLASSES': [],
@@ -93,6 +97,13 @@ DATABASES = {
     }
 }
 
+# Cache - in-process LocMem; keeps hot dashboard reads off the database
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = []
 
@@ -198,7 +209,8 @@ LOGGING = {
     'loggers': {
         'alerts': {
             'handlers': ['file', 'console'],
-            'level': 'INFO',
+            # Per-request INFO records are dropped at the level check outside development
+            'level': 'INFO' if DEBUG else 'WARNING',
             'propagate': False,
         },
         'alerts.enhanced_performance_views': {
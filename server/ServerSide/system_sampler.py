@@ -0,0 +1,62 @@
+"""
+Background process CPU/memory sampling shared by the metrics collectors
+"""
+import os
+import threading
+from collections import deque
+
+import psutil
+
+BYTES_PER_MB = 1024 * 1024
+
+
+class SystemMetricsSampler:
+    """Samples process CPU/memory on a daemon thread, off the request/send path"""
+
+    def __init__(self):
+        self.memory_usage = deque(maxlen=3600)  # One hour at the 1s sampling cadence
+        self.cpu_usage = deque(maxlen=3600)
+
+        self._process = psutil.Process(os.getpid())
+        self._sampler_thread = None
+        self._sampler_stop = None
+        self._sampler_lock = threading.Lock()
+
+    def record_system_metrics(self):
+        """Record current system metrics"""
+        try:
+            self.memory_usage.append(self._process.memory_info().rss / BYTES_PER_MB)
+            self.cpu_usage.append(self._process.cpu_percent(interval=None))
+        except (psutil.Error, OSError):
+            pass  # Skip if psutil fails
+
+    def start_system_sampling(self, interval: float = 1.0):
+        """Start sampling process CPU/memory on a background thread (idempotent)"""
+        with self._sampler_lock:
+            if self._sampler_thread and self._sampler_thread.is_alive():
+                return
+            self._sampler_stop = threading.Event()
+            self._sampler_thread = threading.Thread(
+                target=self._sample_system_metrics, args=(interval, self._sampler_stop)
+            )
+            self._sampler_thread.daemon = True
+            self._sampler_thread.start()
+
+    def _sample_system_metrics(self, interval: float, stop_event: threading.Event):
+        """Record system metrics at a fixed cadence until stop_event is set"""
+        try:
+            # Prime cpu_percent so the first real sample is not a meaningless 0.0
+            self._process.cpu_percent(interval=None)
+        except (psutil.Error, OSError):
+            pass
+
+        while not stop_event.wait(interval):
+            self.record_system_metrics()
+
+    def stop_system_sampling(self):
+        """Stop the background system metrics sampler"""
+        with self._sampler_lock:
+            if self._sampler_stop is not None:
+                self._sampler_stop.set()
+            self._sampler_thread = None
+            self._sampler_stop = None
@@ -1,106 +1,256 @@
 # ServerSide/enhanced_performance_report.py
 
 import csv
+import io
+import json
+import os
 import statistics
+import threading
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Tuple, Union
 import logging
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Rendered reports kept in memory across generator instances
+REPORT_CACHE_SIZE = 32
+
+# Defaults for every metric read by the CSV rows; merged once per row so fields are plain subscripts
+CSV_METRIC_DEFAULTS = {
+    'message_latency_ms': 0,
+    'latency_min_ms': 0,
+    'latency_max_ms': 0,
+    'latency_p95': 0,
+    'success_rate_percent': 0,
+    'total_messages': 0,
+    'successful_messages': 0,
+    'failed_messages': 0,
+    'throughput_msg_per_sec': 0,
+    'cpu_usage_percent': 0,
+    'memory_usage_mb': 0,
+    'test_duration_seconds': 0
+}
+
+# Markup repeated inside the report loops, parsed once at import and filled with str.format
+NETWORK_ROW_TEMPLATE = """
+                                <tr>
+                                    <td class="profile-name">{profile}</td>
+                                    <td>{websocket:.1f}</td>
+                                    <td>{longpolling:.1f}</td>
+                                    <td>{firebase:.1f}</td>
+                                    <td class="best-performer">{best}</td>
+                                </tr>
+            """
+
+COMPARISON_ROW_TEMPLATE = """
+                                <tr>
+                                    <td>{metric_name}</td>
+                                    <td {websocket_class}>{websocket:.2f}</td>
+                                    <td {longpolling_class}>{longpolling:.2f}</td>
+                                    <td {firebase_class}>{firebase:.2f}</td>
+                                    <td class="best-performer">{best}</td>
+                                </tr>
+            """
+
+CLAIM_ITEM_TEMPLATE = """
+                            <div class="claim-item {status_class}">
+                                <span class="claim-status">{status_icon}</span>
+                                <span class="claim-text">{claim}</span>
+                            </div>
+                """
+
+RESEARCH_CLAIM_TEMPLATE = """
+                                <div class="research-claim {status_class}">
+                                    <span class="claim-icon">{status_icon}</span>
+                                    <span class="claim-description">{claim}</span>
+                                    <span class="claim-result">{status_text}</span>
+                                </div>
+                """
+
+# (css class, icon[, label]) per claim outcome
+CLAIM_STATUS = {True: ('confirmed', '✓'), False: ('not-confirmed', '✗')}
+RESEARCH_CLAIM_STATUS = {True: ('claim-confirmed', '✓', 'CONFIRMED'), False: ('claim-failed', '✗', 'NOT CONFIRMED')}
+BEST_METRIC_CLASS = 'class="best-metric"'
+
 
 class EnhancedPerformanceReport:
     """Generate comprehensive performance reports"""
 
+    # Rendered reports keyed by (report kind, test_id, end_time); results are immutable once a run ends
+    _render_cache: Dict[Tuple[str, str, str], Union[str, bytes]] = {}
+    _render_lock = threading.Lock()
+
     def __init__(self):
         self.css_styles = self._get_modern_css_styles()
 
     def generate_comprehensive_html_report(self, results: Dict[str, Any], output_file: str = "comprehensive_performance_report.html"):
         """Generate comprehensive HTML report with detailed analysis"""
         try:
-            html_content = self._generate_html_header(results)
-            html_content += self._generate_executive_summary(results)
-            html_content += self._generate_network_condition_analysis(results)
-            html_content += self._generate_technology_comparison(results)
-            html_content += self._generate_statistical_analysis(results)
-            html_content += self._generate_performance_analysis_section(results)
-            html_content += self._generate_recommendations_section(results)
-            html_content += self._generate_html_footer()
-
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-
-            logger.info(f"Comprehensive HTML report generated: {output_file}")
+            html_content = self._cached_render('comprehensive_html', results, self._render_comprehensive_html)
+
+            self._write_report(output_file, html_content)
+
+            logger.info("Comprehensive HTML report generated: %s", output_file)
             return True
         except Exception as e:
-            logger.error(f"Failed to generate comprehensive HTML report: {e}")
+            logger.error("Failed to generate comprehensive HTML report: %s", e)
             return False
 
     def generate_research_analysis_report(self, results: Dict[str, Any], output_file: str = "research_analysis_report.html"):
         """Generate analysis report"""
         try:
-            html_content = self._generate_html_header(results, "Research Analysis Report")
-            html_content += self._generate_research_claims_analysis(results)
-            html_content += self._generate_performance_evidence(results)
-            html_content += self._generate_network_simulation_results(results)
-            html_content += self._generate_scalability_evidence(results)
-            html_content += self._generate_html_footer()
+            html_content = self._cached_render('research_html', results, self._render_research_html)
 
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            self._write_report(output_file, html_content)
 
-            logger.info(f"Research analysis report generated: {output_file}")
+            logger.info("Research analysis report generated: %s", output_file)
             return True
         except Exception as e:
-            logger.error(f"Failed to generate research analysis report: {e}")
+            logger.error("Failed to generate research analysis report: %s", e)
             return False
 
     def generate_detailed_csv_report(self, results: Dict[str, Any], output_file: str = "detailed_performance_metrics.csv"):
         """Generate detailed CSV report with all metrics"""
         try:
-            with open(output_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-
-                # Header
-                writer.writerow([
-                    'Technology', 'Network_Profile', 'Status',
-                    'Avg_Latency_ms', 'Min_Latency_ms', 'Max_Latency_ms', 'P95_Latency_ms',
-                    'Success_Rate_%', 'Total_Messages', 'Successful_Messages', 'Failed_Messages',
-                    'Throughput_msg/s', 'CPU_Usage_%', 'Memory_Usage_MB',
-                    'Test_Duration_s'
-                ])
-
-                # Data rows
-                individual_results = results.get('results', {})
-                for tech, tech_result in individual_results.items():
-                    network_results = tech_result.get('network_condition_results', {})
-                    for profile, profile_result in network_results.items():
-                        if profile_result.get('status') == 'Completed':
-                            metrics = profile_result.get('metrics', {})
-                            writer.writerow([
-                                tech,
-                                profile,
-                                profile_result.get('status', 'Unknown'),
-                                f"{metrics.get('message_latency_ms', 0):.2f}",
-                                f"{metrics.get('latency_min_ms', 0):.2f}",
-                                f"{metrics.get('latency_max_ms', 0):.2f}",
-                                f"{metrics.get('latency_p95', 0):.2f}",
-                                f"{metrics.get('success_rate_percent', 0):.1f}",
-                                metrics.get('total_messages', 0),
-                                metrics.get('successful_messages', 0),
-                                metrics.get('failed_messages', 0),
-                                f"{metrics.get('throughput_msg_per_sec', 0):.2f}",
-                                f"{metrics.get('cpu_usage_percent', 0):.1f}",
-                                f"{metrics.get('memory_usage_mb', 0):.1f}",
-                                f"{metrics.get('test_duration_seconds', 0):.2f}"
-                            ])
-
-            logger.info(f"Detailed CSV report generated: {output_file}")
+            csv_content = self._cached_render('detailed_csv', results, self._render_detailed_csv)
+
+            self._write_report(output_file, csv_content)
+
+            logger.info("Detailed CSV report generated: %s", output_file)
             return True
         except Exception as e:
-            logger.error(f"Failed to generate CSV report: {e}")
+            logger.error("Failed to generate CSV report: %s", e)
             return False
 
+    def generate_json_report(self, results: Dict[str, Any], output_file: str = "performance_results.json"):
+        """Write the raw results as indented JSON"""
+        try:
+            json_content = self._cached_render('json', results, self._render_json)
+
+            self._write_report(output_file, json_content)
+
+            logger.info("JSON results saved: %s", output_file)
+            return True
+        except Exception as e:
+            logger.error("Failed to generate JSON report: %s", e)
+            return False
+
+    @staticmethod
+    def _write_report(output_file: str, content: Union[str, bytes]) -> None:
+        """Encode the report once and hand it to the kernel with raw os.write calls"""
+        data = memoryview(content.encode('utf-8') if isinstance(content, str) else content)
+        fd = os.open(output_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while data:
+                written = os.write(fd, data)
+                data = data[written:]
+        finally:
+            os.close(fd)
+
+    def _cached_render(self, kind: str, results: Dict[str, Any],
+                       render: Callable[[Dict[str, Any]], Union[str, bytes]]) -> Union[str, bytes]:
+        """Return a previously rendered report for the same completed run, rendering it on a miss"""
+        test_id = results.get('test_id')
+        end_time = results.get('end_time')
+        # Runs without an end_time may still change, so they are always rendered fresh
+        if not test_id or not end_time:
+            return render(results)
+
+        key = (kind, test_id, end_time)
+        content = self._render_cache.get(key)
+        if content is None:
+            content = render(results)
+            # Reports may be generated from several threads at once
+            with self._render_lock:
+                if len(self._render_cache) >= REPORT_CACHE_SIZE:
+                    self._render_cache.pop(next(iter(self._render_cache)))
+                self._render_cache[key] = content
+        return content
+
+    @staticmethod
+    def _render_json(results: Dict[str, Any]) -> bytes:
+        """Serialize results to indented JSON bytes, using orjson when available"""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(results, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        return json.dumps(results, indent=2, default=str).encode('utf-8')
+
+    def _render_comprehensive_html(self, results: Dict[str, Any]) -> str:
+        """Render the comprehensive HTML report"""
+        return ''.join((
+            self._generate_html_header(results),
+            self._generate_executive_summary(results),
+            self._generate_network_condition_analysis(results),
+            self._generate_technology_comparison(results),
+            self._generate_statistical_analysis(results),
+            self._generate_performance_analysis_section(results),
+            self._generate_recommendations_section(results),
+            self._generate_html_footer()
+        ))
+
+    def _render_research_html(self, results: Dict[str, Any]) -> str:
+        """Render the research analysis HTML report"""
+        return ''.join((
+            self._generate_html_header(results, "Research Analysis Report"),
+            self._generate_research_claims_analysis(results),
+            self._generate_performance_evidence(results),
+            self._generate_network_simulation_results(results),
+            self._generate_scalability_evidence(results),
+            self._generate_html_footer()
+        ))
+
+    def _render_detailed_csv(self, results: Dict[str, Any]) -> str:
+        """Render the detailed CSV report"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        # Header
+        writer.writerow([
+            'Technology', 'Network_Profile', 'Status',
+            'Avg_Latency_ms', 'Min_Latency_ms', 'Max_Latency_ms', 'P95_Latency_ms',
+            'Success_Rate_%', 'Total_Messages', 'Successful_Messages', 'Failed_Messages',
+            'Throughput_msg/s', 'CPU_Usage_%', 'Memory_Usage_MB',
+            'Test_Duration_s'
+        ])
+
+        # Data rows, written in one batch
+        rows = [
+            self._csv_row(tech, profile, profile_result)
+            for tech, tech_result in results.get('results', {}).items()
+            for profile, profile_result in tech_result.get('network_condition_results', {}).items()
+            if profile_result.get('status') == 'Completed'
+        ]
+        writer.writerows(rows)
+
+        return buffer.getvalue()
+
+    @staticmethod
+    def _csv_row(tech: str, profile: str, profile_result: Dict[str, Any]) -> list:
+        """Format one network-profile result as a CSV row"""
+        m = CSV_METRIC_DEFAULTS | profile_result.get('metrics', {})
+        return [
+            tech,
+            profile,
+            profile_result.get('status', 'Unknown'),
+            f"{m['message_latency_ms']:.2f}",
+            f"{m['latency_min_ms']:.2f}",
+            f"{m['latency_max_ms']:.2f}",
+            f"{m['latency_p95']:.2f}",
+            f"{m['success_rate_percent']:.1f}",
+            m['total_messages'],
+            m['successful_messages'],
+            m['failed_messages'],
+            f"{m['throughput_msg_per_sec']:.2f}",
+            f"{m['cpu_usage_percent']:.1f}",
+            f"{m['memory_usage_mb']:.1f}",
+            f"{m['test_duration_seconds']:.2f}"
+        ]
+
     def _generate_html_header(self, results: Dict[str, Any], title: str = "Performance Test Report") -> str:
         """Generate HTML header with modern styling"""
         test_id = results.get('test_id', 'Unknown')
@@ -183,14 +333,14 @@ class EnhancedPerformanceReport:
 
     def _generate_network_condition_analysis(self, results: Dict[str, Any]) -> str:
         """Generate network condition analysis section"""
-        html = """<div class="section"> <h2>Network Condition Analysis</h2> <p>Performance testing under simulated 
-        network conditions ranging from perfect local connections to poor satellite links.</p>"""
+        parts = ["""<div class="section"> <h2>Network Condition Analysis</h2> <p>Performance testing under simulated 
+        network conditions ranging from perfect local connections to poor satellite links.</p>"""]
 
         individual_results = results.get('results', {})
         network_profiles = ['perfect', 'local_wifi', 'good_mobile', 'poor_mobile', 'satellite']
 
         # Create network condition comparison table
-        html += """
+        parts.append("""
                     <div class="table-container">
                         <table class="performance-table">
                             <thead>
@@ -203,7 +353,7 @@ class EnhancedPerformanceReport:
                                 </tr>
                             </thead>
                             <tbody>
-        """
+        """)
 
         for profile in network_profiles:
             profile_latencies = {}
@@ -219,34 +369,32 @@ class EnhancedPerformanceReport:
 
             best_tech = min(profile_latencies.keys(), key=lambda x: profile_latencies[x]) if profile_latencies else 'N/A'
 
-            html += f"""
-                                <tr>
-                                    <td class="profile-name">{profile.replace('_', ' ').title()}</td>
-                                    <td>{profile_latencies.get('websocket', 0):.1f}</td>
-                                    <td>{profile_latencies.get('longpolling', 0):.1f}</td>
-                                    <td>{profile_latencies.get('firebase', 0):.1f}</td>
-                                    <td class="best-performer">{best_tech.title() if best_tech != 'N/A' else 'N/A'}</td>
-                                </tr>
-            """
+            parts.append(NETWORK_ROW_TEMPLATE.format(
+                profile=profile.replace('_', ' ').title(),
+                websocket=profile_latencies.get('websocket', 0),
+                longpolling=profile_latencies.get('longpolling', 0),
+                firebase=profile_latencies.get('firebase', 0),
+                best=best_tech.title() if best_tech != 'N/A' else 'N/A'
+            ))
 
-        html += """
+        parts.append("""
                             </tbody>
                         </table>
                     </div>
                 </div>
-        """
+        """)
 
-        return html
+        return ''.join(parts)
 
     def _generate_technology_comparison(self, results: Dict[str, Any]) -> str:
         """Generate detailed technology comparison"""
-        html = """<div class="section"> <h2>Technology Comparison</h2> <p>Comprehensive comparison of WebSocket, 
-        Long Polling, and Firebase Push Notifications under perfect network conditions.</p>"""
+        parts = ["""<div class="section"> <h2>Technology Comparison</h2> <p>Comprehensive comparison of WebSocket, 
+        Long Polling, and Firebase Push Notifications under perfect network conditions.</p>"""]
 
         individual_results = results.get('results', {})
 
         # Create detailed comparison table
-        html += """
+        parts.append("""
                     <div class="table-container">
                         <table class="performance-table">
                             <thead>
@@ -259,7 +407,7 @@ class EnhancedPerformanceReport:
                                 </tr>
                             </thead>
                             <tbody>
-        """
+        """)
 
         metrics_to_compare = [
             ('Average Latency (ms)', 'message_latency_ms', 'lower'),
@@ -287,32 +435,33 @@ class EnhancedPerformanceReport:
             else:
                 best_tech = max(metric_values.keys(), key=lambda x: metric_values[x]) if metric_values else 'N/A'
 
-            html += f"""
-                                <tr>
-                                    <td>{metric_name}</td>
-                                    <td {'class="best-metric"' if best_tech == 'websocket' else ''}>{metric_values.get('websocket', 0):.2f}</td>
-                                    <td {'class="best-metric"' if best_tech == 'longpolling' else ''}>{metric_values.get('longpolling', 0):.2f}</td>
-                                    <td {'class="best-metric"' if best_tech == 'firebase' else ''}>{metric_values.get('firebase', 0):.2f}</td>
-                                    <td class="best-performer">{best_tech.title() if best_tech != 'N/A' else 'N/A'}</td>
-                                </tr>
-            """
-
-        html += """
+            parts.append(COMPARISON_ROW_TEMPLATE.format(
+                metric_name=metric_name,
+                websocket=metric_values.get('websocket', 0),
+                longpolling=metric_values.get('longpolling', 0),
+                firebase=metric_values.get('firebase', 0),
+                websocket_class=BEST_METRIC_CLASS if best_tech == 'websocket' else '',
+                longpolling_class=BEST_METRIC_CLASS if best_tech == 'longpolling' else '',
+                firebase_class=BEST_METRIC_CLASS if best_tech == 'firebase' else '',
+                best=best_tech.title() if best_tech != 'N/A' else 'N/A'
+            ))
+
+        parts.append("""
                             </tbody>
                         </table>
                     </div>
                 </div>
-        """
+        """)
 
-        return html
+        return ''.join(parts)
 
     def _generate_statistical_analysis(self, results: Dict[str, Any]) -> str:
         """Generate statistical analysis section"""
-        html = """
+        parts = ["""
                 <div class="section">
                     <h2>Statistical Analysis</h2>
                     <p>Detailed statistical analysis of performance metrics across all network conditions.</p>
-        """
+        """]
 
         individual_results = results.get('results', {})
 
@@ -333,7 +482,7 @@ class EnhancedPerformanceReport:
                     throughputs.append(metrics.get('throughput_msg_per_sec', 0))
 
             if latencies:
-                html += f"""
+                parts.append(f"""
                     <div class="tech-stats">
                         <h3>{tech.title()} Statistical Summary</h3>
                         <div class="stats-grid">
@@ -363,18 +512,18 @@ class EnhancedPerformanceReport:
                             </div>
                         </div>
                     </div>
-                """
+                """)
 
-        html += "</div>"
-        return html
+        parts.append("</div>")
+        return ''.join(parts)
 
     def _generate_performance_analysis_section(self, results: Dict[str, Any]) -> str:
         """Generate performance analysis section"""
-        html = """
+        parts = ["""
                 <div class="section">
                     <h2>Performance Analysis</h2>
                     <p>Analysis of performance characteristics based on empirical test results.</p>
-        """
+        """]
 
         individual_results = results.get('results', {})
 
@@ -391,43 +540,40 @@ class EnhancedPerformanceReport:
         # Analyze key performance claims
         claims_analysis = self._analyze_performance_claims(analysis_data)
 
-        html += """
+        parts.append("""
                     <div class="analysis-grid">
-        """
+        """)
 
         for tech, claims in claims_analysis.items():
-            html += f"""
+            parts.append(f"""
                         <div class="analysis-card">
                             <h3>{tech.title()} Performance Analysis</h3>
-            """
+            """)
 
             for claim, result in claims.items():
-                status_class = "confirmed" if result else "not-confirmed"
-                status_icon = "✓" if result else "✗"
+                status_class, status_icon = CLAIM_STATUS[bool(result)]
+                parts.append(CLAIM_ITEM_TEMPLATE.format(
+                    status_class=status_class,
+                    status_icon=status_icon,
+                    claim=claim.replace('_', ' ').title()
+                ))
 
-                html += f"""
-                            <div class="claim-item {status_class}">
-                                <span class="claim-status">{status_icon}</span>
-                                <span class="claim-text">{claim.replace('_', ' ').title()}</span>
-                            </div>
-                """
-
-            html += "</div>"
+            parts.append("</div>")
 
-        html += """
+        parts.append("""
                     </div>
                 </div>
-        """
+        """)
 
-        return html
+        return ''.join(parts)
 
     def _generate_research_claims_analysis(self, results: Dict[str, Any]) -> str:
         """Generate specific research claims analysis"""
-        html = """
+        parts = ["""
                 <div class="section">
                     <h2>Research Claims Analysis</h2>
                     <p>Analysis of performance claims based on empirical test results.</p>
-        """
+        """]
 
         # Extract analysis data
         individual_results = results.get('results', {})
@@ -464,31 +610,28 @@ class EnhancedPerformanceReport:
         }
 
         for tech, claims in research_claims.items():
-            html += f"""
+            parts.append(f"""
                         <div class="research-analysis-section">
                             <h3>{tech.title()} Research Claims</h3>
                             <div class="claims-list">
-            """
+            """)
 
             for claim_text, is_confirmed in claims:
-                status_class = "claim-confirmed" if is_confirmed else "claim-failed"
-                status_icon = "✓" if is_confirmed else "✗"
-
-                html += f"""
-                                <div class="research-claim {status_class}">
-                                    <span class="claim-icon">{status_icon}</span>
-                                    <span class="claim-description">{claim_text}</span>
-                                    <span class="claim-result">{'CONFIRMED' if is_confirmed else 'NOT CONFIRMED'}</span>
-                                </div>
-                """
-
-            html += """
+                status_class, status_icon, status_text = RESEARCH_CLAIM_STATUS[bool(is_confirmed)]
+                parts.append(RESEARCH_CLAIM_TEMPLATE.format(
+                    status_class=status_class,
+                    status_icon=status_icon,
+                    claim=claim_text,
+                    status_text=status_text
+                ))
+
+            parts.append("""
                             </div>
                         </div>
-            """
+            """)
 
-        html += "</div>"
-        return html
+        parts.append("</div>")
+        return ''.join(parts)
 
     def _generate_performance_evidence(self, results: Dict[str, Any]) -> str:
         """Generate performance evidence section"""
@@ -1079,7 +1222,7 @@ def generate_performance_report(results: Dict[str, Any], output_dir: str = "."):
         }
 
     except Exception as e:
-        logger.error(f"Failed to generate performance reports: {e}")
+        logger.error("Failed to generate performance reports: %s", e)
         return {
             'success': False,
             'error': str(e),
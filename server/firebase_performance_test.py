@@ -2,10 +2,10 @@
 
 import json
 import time
-import requests
 import uuid
-from typing import Dict, Any
-from network_condition_simulator import NetworkConditionSimulator, EnhancedPerformanceMetrics
+from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from network_condition_simulator import BasePerformanceTester, EnhancedPerformanceMetrics, bind_simulator, create_http_session
 import logging
 import atexit
 import signal
@@ -40,75 +40,51 @@ atexit.register(cleanup_firebase_background)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+JSON_HEADERS = {'Content-Type': 'application/json'}
 
-class RealFirebaseTester:
-    """Enhanced Firebase tester with network simulation and comprehensive metrics"""
-
-    def __init__(self, base_url: str, test_config: Dict[str, Any]):
-        self.base_url = base_url.rstrip('/')
-        self.test_config = test_config
-        self.registered_tokens = []
-        self.network_simulator = NetworkConditionSimulator()
-        self.session = requests.Session()
 
-    def run_test(self) -> Dict[str, Any]:
-        """Run comprehensive Firebase performance test"""
-        logger.info(f"Starting enhanced Firebase test: {self.test_config}")
+def encode_json_body(payload: Dict[str, Any]) -> bytes:
+    """Serialize a request payload once so the same bytes are sent and counted"""
+    return json.dumps(payload, separators=(',', ':')).encode('utf-8')
 
-        # Test all network conditions
-        all_results = {}
-        network_profiles = ['perfect', 'local_wifi', 'good_mobile', 'poor_mobile', 'satellite']
 
-        for profile in network_profiles:
-            logger.info(f"Testing Firebase under {profile} network conditions...")
-
-            def test_under_conditions():
-                return self._run_single_test(profile)
-
-            profile_results = self.network_simulator.apply_network_conditions(profile, test_under_conditions)
-            all_results[profile] = profile_results
+class RealFirebaseTester(BasePerformanceTester):
+    """Enhanced Firebase tester with network simulation and comprehensive metrics"""
 
-            # Wait between network condition tests
-            time.sleep(2)
+    technology_label = 'Firebase Push Notifications'
+    short_name = 'Firebase'
+    metrics_name = 'firebase'
 
-        return {
-            'technology': 'Firebase Push Notifications',
-            'test_type': 'enhanced_performance',
-            'network_condition_results': all_results,
-            'summary': self._generate_summary(all_results)
-        }
+    def __init__(self, base_url: str, test_config: Dict[str, Any]):
+        super().__init__(test_config)
+        self.base_url = base_url.rstrip('/')
+        self.registered_tokens = []
+        self.session = create_http_session()
 
-    def _run_single_test(self, network_profile: str) -> Dict[str, Any]:
-        """Run single test under specific network conditions"""
-        metrics = EnhancedPerformanceMetrics('firebase')
-        metrics.start_test(network_profile)
+    def _target_url(self) -> str:
+        """URL whose connections are drained between network profiles"""
+        return self.base_url
 
+    def _run_test_phases(self, metrics: EnhancedPerformanceMetrics) -> Optional[str]:
+        """Run the Firebase test phases under the active network conditions"""
         # Clear registered tokens for clean test
         self.registered_tokens = []
 
-        try:
-            # Test 1: Token registration performance
-            self._test_token_registration_performance(metrics)
-
-            # Test 2: API response time measurement
-            self._test_api_response_performance(metrics)
+        # Test 1: Token registration performance
+        self._test_token_registration_performance(metrics)
 
-            # Test 3: Notification sending performance
-            self._test_notification_sending_performance(metrics)
+        # Test 2: API response time measurement
+        self._test_api_response_performance(metrics)
 
-            # Test 4: Batch processing performance
-            self._test_batch_processing_performance(metrics)
+        # Test 3: Notification sending performance
+        self._test_notification_sending_performance(metrics)
 
-            # Test 5: Delivery confirmation and reliability
-            self._test_delivery_reliability(metrics)
+        # Test 4: Batch processing performance
+        self._test_batch_processing_performance(metrics)
 
-        except Exception as e:
-            logger.error(f"Firebase test error under {network_profile}: {e}")
-            metrics.record_failure()
-        finally:
-            metrics.end_test()
-
-        return self._get_results(metrics, "Completed")
+        # Test 5: Delivery confirmation and reliability
+        self._test_delivery_reliability(metrics)
+        return None
 
     def _test_token_registration_performance(self, metrics: EnhancedPerformanceMetrics) -> None:
         """Test Firebase token registration performance with statistical analysis"""
@@ -116,41 +92,63 @@ class RealFirebaseTester:
 
         # Test multiple token registrations
         token_count = self.test_config.get('token_count', 25)
+        max_workers = max(1, min(token_count, self.test_config.get('registration_workers', 8)))
+        # One keep-alive pool shared by all workers, sized so no worker waits for a connection
+        session = create_http_session(pool_connections=1, pool_maxsize=max_workers)
+
+        def register_token(i: int) -> Dict[str, Any]:
+            """Register one token on the shared keep-alive session"""
+            # Generate realistic test token
+            test_token = f"test_token_{uuid.uuid4()}_{int(time.time())}_{i}"
+            body = encode_json_body({'token': test_token})
+
+            start_time = time.perf_counter_ns()
+            response = session.post(
+                f"{self.base_url}/register-token/",
+                data=body,
+                headers=JSON_HEADERS,
+                timeout=15
+            )
+            registration_time = (time.perf_counter_ns() - start_time) / 1e6
+
+            return {
+                'index': i,
+                'token': test_token,
+                'registration_time': registration_time,
+                'bytes_sent': len(body),
+                'bytes_received': len(response.content),
+                'status_code': response.status_code
+            }
 
-        for i in range(token_count):
-            try:
-                # Generate realistic test token
-                test_token = f"test_token_{uuid.uuid4()}_{int(time.time())}_{i}"
+        # Requests run in parallel; metrics are recorded here on the calling thread
+        with session, ThreadPoolExecutor(max_workers=max_workers) as executor:
+            register = bind_simulator(register_token)
+            futures = {executor.submit(register, i): i for i in range(token_count)}
 
-                start_time = time.time()
-                response = self.session.post(
-                    f"{self.base_url}/register-token/",
-                    json={'token': test_token},
-                    timeout=15
-                )
-                registration_time = (time.time() - start_time) * 1000
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Token registration {i + 1} error: {e}")
+                    metrics.record_failure()
+                    continue
 
-                metrics.record_connection_time(registration_time)
+                metrics.record_connection_time(result['registration_time'])
                 metrics.record_data_transfer(
-                    bytes_sent=len(json.dumps({'token': test_token}).encode()),
-                    bytes_received=len(response.content)
+                    bytes_sent=result['bytes_sent'],
+                    bytes_received=result['bytes_received']
                 )
 
-                if response.status_code in [200, 201]:
+                if result['status_code'] in [200, 201]:
                     metrics.record_success()
-                    self.registered_tokens.append(test_token)
+                    self.registered_tokens.append(result['token'])
 
                     if i % 5 == 0:
-                        logger.info(f"Token {i + 1} registered in {registration_time:.2f}ms")
+                        logger.info(f"Token {i + 1} registered in {result['registration_time']:.2f}ms")
                 else:
                     metrics.record_failure()
-                    logger.error(f"Token {i + 1} registration failed: HTTP {response.status_code}")
-
-            except Exception as e:
-                logger.error(f"Token registration {i + 1} error: {e}")
-                metrics.record_failure()
-
-            time.sleep(0.2)  # Small delay between registrations
+                    logger.error(f"Token {i + 1} registration failed: HTTP {result['status_code']}")
 
         logger.info(f"Registered {len(self.registered_tokens)} tokens successfully")
 
@@ -167,23 +165,25 @@ class RealFirebaseTester:
         for endpoint, method in endpoints_to_test:
             for i in range(10):
                 try:
-                    start_time = time.time()
+                    body = encode_json_body({'token': f'api_test_token_{i}'}) if method == 'POST' else b'{}'
+
+                    start_time = time.perf_counter_ns()
 
                     if method == 'GET':
                         response = self.session.get(f"{self.base_url}{endpoint}", timeout=15)
                     else:  # POST
-                        test_data = {'token': f'api_test_token_{i}'}
                         response = self.session.post(
                             f"{self.base_url}{endpoint}",
-                            json=test_data,
+                            data=body,
+                            headers=JSON_HEADERS,
                             timeout=15
                         )
 
-                    response_time = (time.time() - start_time) * 1000
+                    response_time = (time.perf_counter_ns() - start_time) / 1e6
 
                     metrics.record_message_latency(response_time)
                     metrics.record_data_transfer(
-                        bytes_sent=len(json.dumps(test_data if method == 'POST' else {}).encode()) + 100,
+                        bytes_sent=len(body) + 100,
                         bytes_received=len(response.content)
                     )
 
@@ -214,17 +214,20 @@ class RealFirebaseTester:
 
         for delay in delay_intervals:
             try:
-                start_time = time.time()
+                body = encode_json_body({'delay': delay})
+
+                start_time = time.perf_counter_ns()
                 response = self.session.post(
                     f"{self.base_url}/send-sequential/",
-                    json={'delay': delay},
+                    data=body,
+                    headers=JSON_HEADERS,
                     timeout=30
                 )
-                send_request_time = (time.time() - start_time) * 1000
+                send_request_time = (time.perf_counter_ns() - start_time) / 1e6
 
                 metrics.record_message_latency(send_request_time)
                 metrics.record_data_transfer(
-                    bytes_sent=len(json.dumps({'delay': delay}).encode()),
+                    bytes_sent=len(body),
                     bytes_received=len(response.content)
                 )
 
@@ -280,7 +283,7 @@ class RealFirebaseTester:
 
             try:
                 # Simulate batch notification request
-                start_time = time.time()
+                start_time = time.perf_counter_ns()
 
                 # In a real Firebase implementation, this would be a batch send request
                 # For this test, we'll simulate by sending individual requests rapidly
@@ -288,13 +291,13 @@ class RealFirebaseTester:
 
                 for i in range(batch_size):
                     try:
-                        batch_start = time.time()
+                        batch_start = time.perf_counter_ns()
                         response = self.session.post(
                             f"{self.base_url}/send-sequential/",
                             json={'delay': 0.5, 'target_tokens': 1},
                             timeout=10
                         )
-                        batch_time = (time.time() - batch_start) * 1000
+                        batch_time = (time.perf_counter_ns() - batch_start) / 1e6
 
                         metrics.record_message_latency(batch_time)
                         metrics.record_data_transfer(
@@ -312,7 +315,7 @@ class RealFirebaseTester:
                         logger.error(f"Batch item {i + 1} failed: {e}")
                         metrics.record_failure()
 
-                total_batch_time = (time.time() - start_time) * 1000
+                total_batch_time = (time.perf_counter_ns() - start_time) / 1e6
 
                 if batch_size > 0:
                     avg_batch_time = total_batch_time / batch_size
@@ -340,9 +343,9 @@ class RealFirebaseTester:
                 logger.info("🛑 Firebase reliability test stopping due to cleanup request")
                 break
             try:
-                start_time = time.time()
+                start_time = time.perf_counter_ns()
                 response = self.session.get(f"{self.base_url}/stats/", timeout=15)
-                stats_time = (time.time() - start_time) * 1000
+                stats_time = (time.perf_counter_ns() - start_time) / 1e6
 
                 metrics.record_message_latency(stats_time)
                 metrics.record_data_transfer(
@@ -381,13 +384,13 @@ class RealFirebaseTester:
                 break
             try:
                 # Simulate notification with potential retry
-                start_time = time.time()
+                start_time = time.perf_counter_ns()
                 response = self.session.post(
                     f"{self.base_url}/send-sequential/",
                     json={'delay': 1.0, 'test_retry': True},
                     timeout=20
                 )
-                retry_time = (time.time() - start_time) * 1000
+                retry_time = (time.perf_counter_ns() - start_time) / 1e6
 
                 metrics.record_message_latency(retry_time)
                 metrics.record_data_transfer(
@@ -428,80 +431,52 @@ class RealFirebaseTester:
             try:
                 self.session.close()
                 logger.info("Firebase session closed")
-            except:
-                pass
+            except Exception as e:
+                logger.debug(f"Firebase session close failed: {e}")
 
     def _get_results(self, metrics: EnhancedPerformanceMetrics, status: str) -> Dict[str, Any]:
         """Get comprehensive test results"""
-        comprehensive_metrics = metrics.calculate_comprehensive_metrics()
+        results = super()._get_results(metrics, status)
 
         # Add Firebase-specific metrics
-        comprehensive_metrics.update({
+        results['metrics'].update({
             'registered_tokens_count': len(self.registered_tokens),
             'firebase_api_tested': True,
             'end_to_end_delivery_tested': True
         })
-
-        return {
-            'technology': 'Firebase Push Notifications',
-            'status': status,
-            'metrics': comprehensive_metrics,
-            'config': self.test_config,
-            'network_profile': metrics.network_profile,
-            'registered_tokens': len(self.registered_tokens)
-        }
+        results['registered_tokens'] = len(self.registered_tokens)
+        return results
 
     def _generate_summary(self, all_results: Dict[str, Any]) -> Dict[str, Any]:
         """Generate summary across all network conditions"""
-        summary = {
-            'best_performance_profile': None,
-            'worst_performance_profile': None,
-            'average_metrics': {},
-            'network_impact_analysis': {},
-            'firebase_specific_analysis': {}
-        }
-
-        # Find best and worst performing profiles
-        latencies = {}
+        summary = super()._generate_summary(all_results)
+        summary['firebase_specific_analysis'] = {}
+
         success_rates = {}
         registration_times = {}
 
         for profile, result in all_results.items():
             if result['status'] == 'Completed':
                 metrics = result['metrics']
-                latencies[profile] = metrics.get('message_latency_ms', float('inf'))
                 success_rates[profile] = metrics.get('success_rate_percent', 0)
                 registration_times[profile] = metrics.get('connection_time_ms', float('inf'))
 
-        if latencies:
-            summary['best_performance_profile'] = min(latencies, key=latencies.get)
-            summary['worst_performance_profile'] = max(latencies, key=latencies.get)
-
-            # Calculate network impact
-            perfect_latency = latencies.get('perfect', 0)
+        if success_rates:
+            # Add registration impact next to the shared latency impact
             perfect_registration = registration_times.get('perfect', 0)
-
-            for profile, latency in latencies.items():
-                if profile != 'perfect' and perfect_latency > 0:
-                    latency_impact = ((latency - perfect_latency) / perfect_latency) * 100
-                    registration_impact = 0
-                    if perfect_registration > 0:
-                        registration_impact = ((registration_times.get(profile,
-                                                                       0) - perfect_registration) / perfect_registration) * 100
-
-                    summary['network_impact_analysis'][profile] = {
-                        'latency_increase_percent': latency_impact,
-                        'registration_time_increase_percent': registration_impact,
-                        'success_rate_impact': success_rates.get(profile, 0) - success_rates.get('perfect', 0)
-                    }
+            for profile, impact in summary['network_impact_analysis'].items():
+                registration_impact = 0
+                if perfect_registration > 0:
+                    registration_impact = ((registration_times.get(profile,
+                                                                   0) - perfect_registration) / perfect_registration) * 100
+                impact['registration_time_increase_percent'] = registration_impact
 
             # Firebase-specific analysis
             summary['firebase_specific_analysis'] = {
-                'token_registration_reliability': min(success_rates.values()) if success_rates else 0,
-                'api_response_consistency': max(success_rates.values()) - min(
-                    success_rates.values()) if success_rates else 0,
-                'best_registration_time': min(registration_times.values()) if registration_times else 0,
-                'worst_registration_time': max(registration_times.values()) if registration_times else 0
+                'token_registration_reliability': min(success_rates.values()),
+                'api_response_consistency': max(success_rates.values()) - min(success_rates.values()),
+                'best_registration_time': min(registration_times.values()),
+                'worst_registration_time': max(registration_times.values())
             }
 
         return summary
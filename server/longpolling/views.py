@@ -4,24 +4,33 @@ Simple Long Polling Views - For simple alert generation testing
 import json
 import time
 import threading
-import psutil
-import os
+from types import MappingProxyType
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.conf import settings
 import logging
+from ServerSide.system_sampler import SystemMetricsSampler
 
 logger = logging.getLogger(__name__)
 
 
+# Frozen template for the zeroed metrics payload; callers get a mutable copy
+EMPTY_METRICS = MappingProxyType({
+    'connection_time_ms': 0, 'message_latency_ms': 0, 'latency_min_ms': 0,
+    'latency_max_ms': 0, 'latency_p95_ms': 0, 'throughput_msg_per_sec': 0,
+    'success_rate_percent': 0, 'memory_usage_mb': 0, 'cpu_usage_percent': 0,
+    'network_bytes_sent': 0, 'network_bytes_received': 0, 'error_rate_percent': 0,
+    'reconnection_count': 0, 'total_requests': 0, 'active_connections': 0
+})
+
+
 # Performance Metrics Collection
-class RealTimeMetrics:
+class RealTimeMetrics(SystemMetricsSampler):
     def __init__(self):
+        super().__init__()
         self.request_times = []
         self.response_sizes = []
-        self.memory_usage = []
-        self.cpu_usage = []
         self.active_connections = 0
         self.total_requests = 0
         self.failed_requests = 0
@@ -36,13 +45,8 @@ class RealTimeMetrics:
         if not success:
             self.failed_requests += 1
 
-        # Capture system metrics
-        try:
-            process = psutil.Process(os.getpid())
-            self.memory_usage.append(process.memory_info().rss / 1024 / 1024)  # MB
-            self.cpu_usage.append(process.cpu_percent())
-        except:
-            pass  # Skip if psutil fails
+        if self._sampler_thread is None:
+            self.start_system_sampling()
 
     def get_real_metrics(self):
         """Get real-time performance metrics"""
@@ -53,16 +57,19 @@ class RealTimeMetrics:
 
         duration = time.time() - self.start_time
 
+        # One sort serves min, max and p95; fmean is a single C-level pass over floats
+        request_times = sorted(self.request_times)
+
         return {
-            'connection_time_ms': min(self.request_times) if self.request_times else 0,
-            'message_latency_ms': statistics.mean(self.request_times),
-            'latency_min_ms': min(self.request_times),
-            'latency_max_ms': max(self.request_times),
-            'latency_p95_ms': self._percentile(self.request_times, 95),
+            'connection_time_ms': request_times[0],
+            'message_latency_ms': statistics.fmean(request_times),
+            'latency_min_ms': request_times[0],
+            'latency_max_ms': request_times[-1],
+            'latency_p95_ms': self._percentile(request_times, 95, presorted=True),
             'throughput_msg_per_sec': self.total_requests / duration if duration > 0 else 0,
             'success_rate_percent': (self.total_requests - self.failed_requests) / self.total_requests * 100 if self.total_requests > 0 else 0,
-            'memory_usage_mb': statistics.mean(self.memory_usage) if self.memory_usage else 0,
-            'cpu_usage_percent': statistics.mean(self.cpu_usage) if self.cpu_usage else 0,
+            'memory_usage_mb': statistics.fmean(self.memory_usage) if self.memory_usage else 0,
+            'cpu_usage_percent': statistics.fmean(self.cpu_usage) if self.cpu_usage else 0,
             'network_bytes_sent': sum(self.response_sizes),
             'network_bytes_received': self.total_requests * 100,
             'error_rate_percent': self.failed_requests / self.total_requests * 100 if self.total_requests > 0 else 0,
@@ -71,11 +78,11 @@ class RealTimeMetrics:
             'active_connections': self.active_connections
         }
 
-    def _percentile(self, data, percentile):
-        """Calculate percentile"""
+    def _percentile(self, data, percentile, presorted=False):
+        """Calculate percentile (pass presorted=True to skip the sort)"""
         if not data:
             return 0
-        sorted_data = sorted(data)
+        sorted_data = data if presorted else sorted(data)
         index = (percentile / 100) * (len(sorted_data) - 1)
         if index.is_integer():
             return sorted_data[int(index)]
@@ -86,13 +93,7 @@ class RealTimeMetrics:
 
     def _empty_metrics(self):
         """Return empty metrics structure"""
-        return {
-            'connection_time_ms': 0, 'message_latency_ms': 0, 'latency_min_ms': 0,
-            'latency_max_ms': 0, 'latency_p95_ms': 0, 'throughput_msg_per_sec': 0,
-            'success_rate_percent': 0, 'memory_usage_mb': 0, 'cpu_usage_percent': 0,
-            'network_bytes_sent': 0, 'network_bytes_received': 0, 'error_rate_percent': 0,
-            'reconnection_count': 0, 'total_requests': 0, 'active_connections': 0
-        }
+        return dict(EMPTY_METRICS)
 
 
 # Simple Alert Management System for testing
@@ -524,6 +525,7 @@ def get_performance_metrics(request):
 def reset_performance_metrics(request):
     """Reset performance metrics"""
     global metrics_collector
+    metrics_collector.stop_system_sampling()
     metrics_collector = RealTimeMetrics()
 
     return JsonResponse({
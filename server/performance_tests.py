@@ -2,12 +2,16 @@
 
 import json
 import time
+import threading
+import asyncio
 import requests
 import websocket
 import uuid
 import statistics
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import logging
 
 # Import enhanced components
@@ -16,7 +20,8 @@ try:
         NetworkConditionSimulator,
         EnhancedPerformanceMetrics,
         SystemResourceMonitor,
-        StatisticalAnalyzer
+        StatisticalAnalyzer,
+        wait_for_connections_drained
     )
 except ImportError:
     print("Warning: Enhanced components not found. Please ensure network_condition_simulator.py is in the same "
@@ -24,6 +29,11 @@ except ImportError:
 
     # Fallback minimal implementations
 
+    def wait_for_connections_drained(url, timeout=2.0, poll_interval=0.1):
+        time.sleep(timeout)
+        return timeout
+
+
     class NetworkConditionSimulator:
         def __init__(self):
             pass
@@ -113,13 +123,13 @@ class EnhancedWebSocketTester:
 
     def run_test(self) -> Dict[str, Any]:
         """Run comprehensive WebSocket test with network simulation"""
-        logger.info(f"Starting enhanced WebSocket test: {self.test_config}")
+        logger.info("Starting enhanced WebSocket test: %s", self.test_config)
 
         all_results = {}
         network_profiles = ['perfect', 'local_wifi', 'good_mobile', 'poor_mobile', 'satellite']
 
         for profile in network_profiles:
-            logger.info(f"Testing WebSocket under {profile} network conditions...")
+            logger.info("Testing WebSocket under %s network conditions...", profile)
 
             def test_under_conditions():
                 return self._run_single_test(profile)
@@ -128,14 +138,14 @@ class EnhancedWebSocketTester:
                 profile_results = self.network_simulator.apply_network_conditions(profile, test_under_conditions)
                 all_results[profile] = profile_results
             except Exception as e:
-                logger.error(f"Error testing {profile}: {e}")
+                logger.error("Error testing %s: %s", profile, e)
                 all_results[profile] = {
                     'status': 'Error',
                     'metrics': {},
                     'error': str(e)
                 }
 
-            time.sleep(2)  # Wait between tests
+            wait_for_connections_drained(self.url)  # Wait for sockets from the last profile to close
 
         return {
             'technology': 'WebSocket',
@@ -159,15 +169,15 @@ class EnhancedWebSocketTester:
                 self._test_enhanced_throughput(metrics)
 
         except Exception as e:
-            logger.error(f"WebSocket test error under {network_profile}: {e}")
+            logger.error("WebSocket test error under %s: %s", network_profile, e)
             metrics.record_failure()
         finally:
             self.running = False
             if self.ws:
                 try:
                     self.ws.close()
-                except:
-                    pass
+                except Exception as e:
+                    logger.debug("WebSocket close failed: %s", e)
             metrics.end_test()
 
         return self._get_results(metrics, "Completed")
@@ -189,7 +199,7 @@ class EnhancedWebSocketTester:
                 metrics.record_success()
                 successful_connections += 1
 
-                logger.info(f"Connection {attempt + 1}: {connection_time:.2f}ms")
+                logger.info("Connection %s: %.2fms", attempt + 1, connection_time)
 
                 if attempt == 9:  # Keep last connection
                     self.ws = test_ws
@@ -199,7 +209,7 @@ class EnhancedWebSocketTester:
                 time.sleep(0.3)
 
             except Exception as e:
-                logger.error(f"Connection attempt {attempt + 1} failed: {e}")
+                logger.error("Connection attempt %s failed: %s", attempt + 1, e)
                 metrics.record_failure()
 
         return successful_connections > 0
@@ -254,7 +264,7 @@ class EnhancedWebSocketTester:
                 time.sleep(0.1)  # Small delay
 
             except Exception as e:
-                logger.error(f"Message {i + 1} failed: {e}")
+                logger.error("Message %s failed: %s", i + 1, e)
                 metrics.record_failure()
                 # Simulate some latency even on failure
                 metrics.record_message_latency(100.0)
@@ -294,7 +304,7 @@ class EnhancedWebSocketTester:
                 time.sleep(0.05)  # Moderate delay
 
             except Exception as e:
-                logger.error(f"Throughput test error: {e}")
+                logger.error("Throughput test error: %s", e)
                 metrics.record_failure()
                 break
 
@@ -352,13 +362,13 @@ class EnhancedLongPollingTester:
 
     def run_test(self) -> Dict[str, Any]:
         """Run comprehensive Long Polling test with network simulation"""
-        logger.info(f"Starting enhanced Long Polling test: {self.test_config}")
+        logger.info("Starting enhanced Long Polling test: %s", self.test_config)
 
         all_results = {}
         network_profiles = ['perfect', 'local_wifi', 'good_mobile', 'poor_mobile', 'satellite']
 
         for profile in network_profiles:
-            logger.info(f"Testing Long Polling under {profile} network conditions...")
+            logger.info("Testing Long Polling under %s network conditions...", profile)
 
             def test_under_conditions():
                 return self._run_single_test(profile)
@@ -367,14 +377,14 @@ class EnhancedLongPollingTester:
                 profile_results = self.network_simulator.apply_network_conditions(profile, test_under_conditions)
                 all_results[profile] = profile_results
             except Exception as e:
-                logger.error(f"Error testing {profile}: {e}")
+                logger.error("Error testing %s: %s", profile, e)
                 all_results[profile] = {
                     'status': 'Error',
                     'metrics': {},
                     'error': str(e)
                 }
 
-            time.sleep(2)  # Wait between tests
+            wait_for_connections_drained(self.url)  # Wait for sockets from the last profile to close
 
         return {
             'technology': 'Long Polling',
@@ -394,7 +404,7 @@ class EnhancedLongPollingTester:
             self._test_enhanced_timeout_behavior(metrics)
 
         except Exception as e:
-            logger.error(f"Long Polling test error under {network_profile}: {e}")
+            logger.error("Long Polling test error under %s: %s", network_profile, e)
             metrics.record_failure()
         finally:
             metrics.end_test()
@@ -427,7 +437,7 @@ class EnhancedLongPollingTester:
                         metrics.record_failure()
 
                 except Exception as e:
-                    logger.error(f"Connection test {endpoint} {i + 1} failed: {e}")
+                    logger.error("Connection test %s %s failed: %s", endpoint, i + 1, e)
                     metrics.record_failure()
                     # Record simulated connection time
                     metrics.record_connection_time(200.0)
@@ -441,8 +451,8 @@ class EnhancedLongPollingTester:
         # Try to reset if endpoint exists
         try:
             self.session.post(f"{self.url}/reset/", timeout=5)
-        except:
-            pass
+        except requests.exceptions.RequestException as e:
+            logger.debug("Reset endpoint unavailable: %s", e)
 
         client_id = f"immediate_test_{uuid.uuid4()}"
 
@@ -469,13 +479,13 @@ class EnhancedLongPollingTester:
                             metrics.record_success()
                         else:
                             metrics.record_success()  # Still a successful HTTP response
-                    except:
-                        metrics.record_success()
+                    except ValueError:
+                        metrics.record_success()  # Non-JSON body, but the HTTP request succeeded
                 else:
                     metrics.record_failure()
 
             except Exception as e:
-                logger.error(f"Immediate response test {i + 1} failed: {e}")
+                logger.error("Immediate response test %s failed: %s", i + 1, e)
                 metrics.record_failure()
                 # Record simulated response time
                 metrics.record_message_latency(250.0)
@@ -516,7 +526,7 @@ class EnhancedLongPollingTester:
                 metrics.record_success()  # Expected behavior
 
             except Exception as e:
-                logger.error(f"Timeout test {timeout_val}s failed: {e}")
+                logger.error("Timeout test %ss failed: %s", timeout_val, e)
                 metrics.record_failure()
                 metrics.record_message_latency(timeout_val * 1000)
 
@@ -575,13 +585,13 @@ class EnhancedFirebaseTester:
 
     def run_test(self) -> Dict[str, Any]:
         """Run comprehensive Firebase test with network simulation"""
-        logger.info(f"Starting enhanced Firebase test: {self.test_config}")
+        logger.info("Starting enhanced Firebase test: %s", self.test_config)
 
         all_results = {}
         network_profiles = ['perfect', 'local_wifi', 'good_mobile', 'poor_mobile', 'satellite']
 
         for profile in network_profiles:
-            logger.info(f"Testing Firebase under {profile} network conditions...")
+            logger.info("Testing Firebase under %s network conditions...", profile)
 
             def test_under_conditions():
                 return self._run_single_test(profile)
@@ -590,14 +600,14 @@ class EnhancedFirebaseTester:
                 profile_results = self.network_simulator.apply_network_conditions(profile, test_under_conditions)
                 all_results[profile] = profile_results
             except Exception as e:
-                logger.error(f"Error testing {profile}: {e}")
+                logger.error("Error testing %s: %s", profile, e)
                 all_results[profile] = {
                     'status': 'Error',
                     'metrics': {},
                     'error': str(e)
                 }
 
-            time.sleep(2)  # Wait between tests
+            wait_for_connections_drained(self.base_url)  # Wait for sockets from the last profile to close
 
         return {
             'technology': 'Firebase Push Notifications',
@@ -619,7 +629,7 @@ class EnhancedFirebaseTester:
             self._test_enhanced_notification_sending(metrics)
 
         except Exception as e:
-            logger.error(f"Firebase test error under {network_profile}: {e}")
+            logger.error("Firebase test error under %s: %s", network_profile, e)
             metrics.record_failure()
         finally:
             metrics.end_test()
@@ -657,7 +667,7 @@ class EnhancedFirebaseTester:
                     metrics.record_failure()
 
             except Exception as e:
-                logger.error(f"Token registration {i + 1} error: {e}")
+                logger.error("Token registration %s error: %s", i + 1, e)
                 metrics.record_failure()
                 # Record simulated registration time
                 metrics.record_connection_time(200.0)
@@ -689,7 +699,7 @@ class EnhancedFirebaseTester:
                         metrics.record_failure()
 
                 except Exception as e:
-                    logger.error(f"API test {endpoint} {i + 1} failed: {e}")
+                    logger.error("API test %s %s failed: %s", endpoint, i + 1, e)
                     metrics.record_failure()
                     metrics.record_message_latency(300.0)
 
@@ -736,14 +746,14 @@ class EnhancedFirebaseTester:
                         # Record additional successes for notifications
                         for _ in range(min(total_alerts, 5)):
                             metrics.record_success()
-                    except:
-                        metrics.record_success()
+                    except ValueError:
+                        metrics.record_success()  # Non-JSON body, but the HTTP request succeeded
 
                 else:
                     metrics.record_failure()
 
             except Exception as e:
-                logger.error(f"Notification sending test (delay {delay}s) error: {e}")
+                logger.error("Notification sending test (delay %ss) error: %s", delay, e)
                 metrics.record_failure()
                 metrics.record_message_latency(1500.0)  # Simulate higher latency
 
@@ -833,46 +843,31 @@ class RealPerformanceTestRunner:
         self.longpolling_url = 'http://localhost:8001/api/poll'
         self.firebase_url = 'http://localhost:8001/api/push'
 
-        logger.info(f"Initialized enhanced test runner - ID: {self.test_id}")
+        logger.info("Initialized enhanced test runner - ID: %s", self.test_id)
 
     def run_tests(self) -> Dict[str, Any]:
         """Run enhanced performance tests"""
-        logger.info(f"Starting enhanced performance test suite - ID: {self.test_id}")
+        return asyncio.run(self.run_tests_async())
+
+    async def run_tests_async(self) -> Dict[str, Any]:
+        """Run the per-technology tests concurrently; they hit independent endpoints"""
+        logger.info("Starting enhanced performance test suite - ID: %s", self.test_id)
 
         start_time = datetime.now()
+        start_ns = time.monotonic_ns()
         technologies = self.test_config.get('technologies', ['websocket', 'longpolling', 'firebase'])
 
-        for tech in technologies:
-            logger.info(f"Running enhanced {tech} test...")
-
-            try:
-                if tech == 'websocket':
-                    tester = EnhancedWebSocketTester(self.websocket_url, self.test_config)
-                    result = tester.run_test()
-                elif tech == 'longpolling':
-                    tester = EnhancedLongPollingTester(self.longpolling_url, self.test_config)
-                    result = tester.run_test()
-                elif tech == 'firebase':
-                    tester = EnhancedFirebaseTester(self.firebase_url, self.test_config)
-                    result = tester.run_test()
-                else:
-                    logger.warning(f"Unknown technology: {tech}")
-                    continue
+        # Sequential by default so the technologies don't contend for CPU and
+        # bandwidth and skew each other's latency; concurrency is opt-in.
+        if self.test_config.get('concurrent_technologies', False):
+            outcomes = await asyncio.gather(*(asyncio.to_thread(self._run_one, tech) for tech in technologies))
+        else:
+            outcomes = [self._run_one(tech) for tech in technologies]
 
+        # Keep results in the configured technology order
+        for tech, result in zip(technologies, outcomes):
+            if result is not None:
                 self.results[tech] = result
-                logger.info(f"{tech} enhanced test completed")
-
-                time.sleep(2)  # Wait between tests
-
-            except Exception as e:
-                logger.error(f"Error in enhanced {tech} test: {e}")
-                self.results[tech] = {
-                    'technology': tech,
-                    'test_type': 'enhanced_performance',
-                    'status': f'Error: {str(e)}',
-                    'network_condition_results': {},
-                    'timestamp': datetime.now().isoformat()
-                }
 
         end_time = datetime.now()
 
@@ -880,16 +875,45 @@ class RealPerformanceTestRunner:
             'test_id': self.test_id,
             'start_time': start_time.isoformat(),
             'end_time': end_time.isoformat(),
-            'duration_seconds': (end_time - start_time).total_seconds(),
+            'duration_seconds': (time.monotonic_ns() - start_ns) / 1e9,
             'config': self.test_config,
             'results': self.results,
             'summary': self._generate_comprehensive_summary(),
             'test_type': 'enhanced_performance'
         }
 
-        logger.info(f"Enhanced performance test suite completed - ID: {self.test_id}")
+        logger.info("Enhanced performance test suite completed - ID: %s", self.test_id)
         return final_results
 
+    def _run_one(self, tech: str) -> Optional[Dict[str, Any]]:
+        """Run a single technology test, returning an error result on failure"""
+        logger.info("Running enhanced %s test...", tech)
+
+        try:
+            if tech == 'websocket':
+                tester = EnhancedWebSocketTester(self.websocket_url, self.test_config)
+            elif tech == 'longpolling':
+                tester = EnhancedLongPollingTester(self.longpolling_url, self.test_config)
+            elif tech == 'firebase':
+                tester = EnhancedFirebaseTester(self.firebase_url, self.test_config)
+            else:
+                logger.warning("Unknown technology: %s", tech)
+                return None
+
+            result = tester.run_test()
+            logger.info("%s enhanced test completed", tech)
+            return result
+
+        except Exception as e:
+            logger.error("Error in enhanced %s test: %s", tech, e)
+            return {
+                'technology': tech,
+                'test_type': 'enhanced_performance',
+                'status': f'Error: {str(e)}',
+                'network_condition_results': {},
+                'timestamp': datetime.now().isoformat()
+            }
+
     def _generate_comprehensive_summary(self) -> Dict[str, Any]:
         """Generate comprehensive summary"""
         summary = {
@@ -918,12 +942,20 @@ class RealPerformanceTestRunner:
         return summary
 
     # Class-level storage for compatibility with existing views
-    _test_results = {}
+    _test_results: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+    _latest_test_id: Optional[str] = None
+    _results_lock = threading.Lock()
+    MAX_STORED_RESULTS = 64
 
     @classmethod
     def store_results(cls, test_id: str, results: Dict[str, Any]):
-        """Store test results"""
-        cls._test_results[test_id] = results
+        """Store test results, evicting the oldest run once the cap is reached"""
+        with cls._results_lock:
+            cls._test_results[test_id] = results
+            cls._test_results.move_to_end(test_id)
+            while len(cls._test_results) > cls.MAX_STORED_RESULTS:
+                cls._test_results.popitem(last=False)
+            cls._latest_test_id = test_id
 
     @classmethod
     def get_test_results(cls, test_id: str) -> Dict[str, Any]:
@@ -933,12 +965,10 @@ class RealPerformanceTestRunner:
     @classmethod
     def get_latest_results(cls) -> Dict[str, Any]:
         """Get the latest test results"""
-        if not cls._test_results:
+        if cls._latest_test_id is None:
             return {'error': 'No tests have been run'}
 
-        latest_test_id = max(cls._test_results.keys(),
-                             key=lambda k: cls._test_results[k]['start_time'])
-        return cls._test_results[latest_test_id]
+        return cls._test_results.get(cls._latest_test_id, {'error': 'No tests have been run'})
 
 
 def main():
@@ -989,21 +1019,14 @@ def main():
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         report_generator = EnhancedPerformanceReport()
 
-        # Generate comprehensive reports
-        report_generator.generate_comprehensive_html_report(
-            results,
-            f"comprehensive_report_{timestamp}.html"
-        )
-
-        report_generator.generate_research_analysis_report(
-            results,
-            f"research_analysis_{timestamp}.html"
-        )
-
-        report_generator.generate_detailed_csv_report(
-            results,
-            f"detailed_metrics_{timestamp}.csv"
-        )
+        # Generate comprehensive reports; each writes its own file, so they run side by side
+        report_jobs = [
+            (report_generator.generate_comprehensive_html_report, f"comprehensive_report_{timestamp}.html"),
+            (report_generator.generate_research_analysis_report, f"research_analysis_{timestamp}.html"),
+            (report_generator.generate_detailed_csv_report, f"detailed_metrics_{timestamp}.csv")
+        ]
+        with ThreadPoolExecutor(max_workers=len(report_jobs)) as executor:
+            list(executor.map(lambda job: job[0](results, job[1]), report_jobs))
 
         print(f"\n✓ Enhanced reports generated:")
         print(f"  • comprehensive_report_{timestamp}.html")
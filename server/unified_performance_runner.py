@@ -2,9 +2,13 @@
 
 import json
 import time
+import threading
 import statistics
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from operator import itemgetter
+from typing import Dict, List, Any, Optional, Tuple
 from network_condition_simulator import NetworkConditionSimulator, StatisticalAnalyzer
 from websocket_performance_test import test_websocket_performance
 from firebase_performance_test import test_firebase_performance
@@ -14,6 +18,63 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Metrics compared across technologies, as (short name, comprehensive metrics key)
+COMPARISON_METRIC_KEYS = (
+    ('latency', 'message_latency_ms'),
+    ('success_rate', 'success_rate_percent'),
+    ('throughput', 'throughput_msg_per_sec'),
+    ('cpu_usage', 'cpu_usage_percent'),
+    ('memory_usage', 'memory_usage_mb'),
+)
+
+_by_value = itemgetter(1)
+
+# (base capacity, scales with free CPU) per technology; WebSockets hold many connections,
+# Long Polling is limited by the thread pool, Firebase is handled by Google infrastructure
+MAX_CONCURRENT_BY_TECH = {
+    'websocket': (2000, True),
+    'longpolling': (500, True),
+    'firebase': (10000, False),
+}
+
+# (cpu below, success above, label), checked in order
+DEGRADATION_TIERS = (
+    (30, 95, "Minimal degradation expected"),
+    (50, 90, "Moderate degradation under high load"),
+)
+DEGRADATION_FALLBACK = "Significant degradation likely under load"
+
+# Recommendation sentences, filled in by _generate_enhanced_recommendations
+RECOMMENDATION_TEMPLATES = {
+    'overall': "Overall best performer: {tech} - recommended for most applications",
+    'latency': "For ultra-low latency requirements: Use {tech}",
+    'reliability': "For maximum reliability: Use {tech}",
+    'poor_mobile': "For poor mobile networks: {tech} performs best",
+    'use_case': "{use_case}: Use {tech} - {reason}",
+    'scalability': "For high scalability: Prefer {best} over {worst}",
+}
+
+
+def _extremes(items: List[Tuple[str, float]]) -> Tuple[Optional[Tuple[str, float]], Optional[Tuple[str, float]]]:
+    """Return the (tech, value) pairs with the lowest and highest value, or (None, None) when empty"""
+    if not items:
+        return None, None
+
+    # One pass tracking both extremes; ties keep the first entry, as min()/max() would
+    lowest = highest = items[0]
+    for item in items[1:]:
+        if item[1] < lowest[1]:
+            lowest = item
+        elif item[1] > highest[1]:
+            highest = item
+    return lowest, highest
+
 
 class EnhancedUnifiedPerformanceRunner:
     """Enhanced unified runner with comprehensive analysis"""
@@ -38,6 +99,7 @@ class EnhancedUnifiedPerformanceRunner:
         print(f"Start time: {datetime.now().isoformat()}")
 
         self.start_time = time.time()
+        start_ns = time.monotonic_ns()
 
         # Run tests for each technology with enhanced metrics
         for tech in technologies:
@@ -62,7 +124,7 @@ class EnhancedUnifiedPerformanceRunner:
 
             except Exception as e:
                 print(f"✗ {tech} testing failed: {e}")
-                logger.error(f"Technology {tech} test failed", exc_info=True)
+                logger.error("Technology %s test failed", tech, exc_info=True)
                 self.results[tech] = {
                     'technology': tech,
                     'test_type': 'enhanced_performance',
@@ -72,6 +134,7 @@ class EnhancedUnifiedPerformanceRunner:
                 }
 
         self.end_time = time.time()
+        duration_seconds = (time.monotonic_ns() - start_ns) / 1e9
 
         # Generate comprehensive comparison and analysis
         comprehensive_analysis = self._generate_comprehensive_analysis()
@@ -82,7 +145,7 @@ class EnhancedUnifiedPerformanceRunner:
             'test_type': 'performance_validation',
             'start_time': datetime.fromtimestamp(self.start_time).isoformat(),
             'end_time': datetime.fromtimestamp(self.end_time).isoformat(),
-            'total_duration_seconds': self.end_time - self.start_time,
+            'total_duration_seconds': duration_seconds,
             'technologies_tested': technologies,
             'individual_results': self.results,
             'comprehensive_analysis': comprehensive_analysis,
@@ -151,7 +214,9 @@ class EnhancedUnifiedPerformanceRunner:
         for tech, result in self.results.items():
             network_results = result.get('network_condition_results', {})
             if profile in network_results and network_results[profile].get('status') == 'Completed':
-                metrics = network_results[profile]['metrics']
+                metrics = network_results[profile].get('metrics')
+                if not metrics:
+                    continue
                 condition_data[tech] = {
                     'latency_ms': metrics.get('message_latency_ms', 0),
                     'connection_time_ms': metrics.get('connection_time_ms', 0),
@@ -164,20 +229,24 @@ class EnhancedUnifiedPerformanceRunner:
         if not condition_data:
             return None
 
-        # Find best and worst performers for this condition
-        latencies = {tech: data['latency_ms'] for tech, data in condition_data.items()}
-        success_rates = {tech: data['success_rate'] for tech, data in condition_data.items()}
+        # Find best and worst performers for this condition; a zero latency means no samples were
+        # recorded and an all-zero success rate means nothing ran, so neither picks a "best"
+        fastest, slowest = _extremes([(tech, data['latency_ms']) for tech, data in condition_data.items()
+                                      if data['latency_ms'] > 0])
+        least_reliable, most_reliable = _extremes([(tech, data['success_rate']) for tech, data in condition_data.items()])
+        if most_reliable and most_reliable[1] <= 0:
+            least_reliable = most_reliable = None
 
         return {
             'condition': profile,
             'technologies_tested': list(condition_data.keys()),
-            'best_latency': min(latencies, key=latencies.get) if latencies else None,
-            'worst_latency': max(latencies, key=latencies.get) if latencies else None,
-            'best_reliability': max(success_rates, key=success_rates.get) if success_rates else None,
-            'worst_reliability': min(success_rates, key=success_rates.get) if success_rates else None,
+            'best_latency': fastest[0] if fastest else None,
+            'worst_latency': slowest[0] if slowest else None,
+            'best_reliability': most_reliable[0] if most_reliable else None,
+            'worst_reliability': least_reliable[0] if least_reliable else None,
             'performance_data': condition_data,
-            'latency_spread': max(latencies.values()) - min(latencies.values()) if latencies else 0,
-            'reliability_spread': max(success_rates.values()) - min(success_rates.values()) if success_rates else 0
+            'latency_spread': slowest[1] - fastest[1] if fastest else 0,
+            'reliability_spread': most_reliable[1] - least_reliable[1] if most_reliable else 0
         }
 
     def _generate_detailed_technology_comparison(self) -> Dict[str, Any]:
@@ -208,13 +277,10 @@ class EnhancedUnifiedPerformanceRunner:
             satellite_metrics = network_results.get('satellite', {}).get('metrics', {})
 
             if poor_metrics and satellite_metrics:
-                # Average the degraded conditions
+                # Average the degraded conditions over the compared metrics only
                 degraded_data[tech] = {
-                    'message_latency_ms': (poor_metrics.get('message_latency_ms', 0) + satellite_metrics.get('message_latency_ms', 0)) / 2,
-                    'success_rate_percent': (poor_metrics.get('success_rate_percent', 0) + satellite_metrics.get('success_rate_percent', 0)) / 2,
-                    'throughput_msg_per_sec': (poor_metrics.get('throughput_msg_per_sec', 0) + satellite_metrics.get('throughput_msg_per_sec', 0)) / 2,
-                    'cpu_usage_percent': (poor_metrics.get('cpu_usage_percent', 0) + satellite_metrics.get('cpu_usage_percent', 0)) / 2,
-                    'memory_usage_mb': (poor_metrics.get('memory_usage_mb', 0) + satellite_metrics.get('memory_usage_mb', 0)) / 2
+                    key: (poor_metrics.get(key, 0) + satellite_metrics.get(key, 0)) / 2
+                    for _, key in COMPARISON_METRIC_KEYS
                 }
 
         if degraded_data:
@@ -233,25 +299,32 @@ class EnhancedUnifiedPerformanceRunner:
         if not tech_data:
             return {}
 
-        latencies = {tech: data.get('message_latency_ms', 0) for tech, data in tech_data.items()}
-        success_rates = {tech: data.get('success_rate_percent', 0) for tech, data in tech_data.items()}
-        throughputs = {tech: data.get('throughput_msg_per_sec', 0) for tech, data in tech_data.items()}
-        cpu_usage = {tech: data.get('cpu_usage_percent', 0) for tech, data in tech_data.items()}
-        memory_usage = {tech: data.get('memory_usage_mb', 0) for tech, data in tech_data.items()}
+        # Single pass over each technology's metrics into (tech, value) lists per metric
+        items = {name: [] for name, _ in COMPARISON_METRIC_KEYS}
+        for tech, data in tech_data.items():
+            if not data:
+                continue
+            for name, key in COMPARISON_METRIC_KEYS:
+                items[name].append((tech, data.get(key, 0)))
+
+        # An all-zero metric carries no ranking information (errored or unmeasured runs)
+        for name, values in items.items():
+            if not any(value for _, value in values):
+                items[name] = []
 
         return {
             'condition': condition,
-            'latency_ranking': sorted(latencies.items(), key=lambda x: x[1]),
-            'reliability_ranking': sorted(success_rates.items(), key=lambda x: x[1], reverse=True),
-            'throughput_ranking': sorted(throughputs.items(), key=lambda x: x[1], reverse=True),
-            'cpu_efficiency_ranking': sorted(cpu_usage.items(), key=lambda x: x[1]),
-            'memory_efficiency_ranking': sorted(memory_usage.items(), key=lambda x: x[1]),
+            'latency_ranking': sorted(items['latency'], key=_by_value),
+            'reliability_ranking': sorted(items['success_rate'], key=_by_value, reverse=True),
+            'throughput_ranking': sorted(items['throughput'], key=_by_value, reverse=True),
+            'cpu_efficiency_ranking': sorted(items['cpu_usage'], key=_by_value),
+            'memory_efficiency_ranking': sorted(items['memory_usage'], key=_by_value),
             'performance_metrics': {
-                'latency_values': latencies,
-                'success_rate_values': success_rates,
-                'throughput_values': throughputs,
-                'cpu_usage_values': cpu_usage,
-                'memory_usage_values': memory_usage
+                'latency_values': dict(items['latency']),
+                'success_rate_values': dict(items['success_rate']),
+                'throughput_values': dict(items['throughput']),
+                'cpu_usage_values': dict(items['cpu_usage']),
+                'memory_usage_values': dict(items['memory_usage'])
             }
         }
 
@@ -418,32 +491,22 @@ class EnhancedUnifiedPerformanceRunner:
 
     def _estimate_max_concurrent(self, tech: str, metrics: Dict[str, Any]) -> int:
         """Estimate maximum concurrent clients based on performance metrics"""
-        cpu_usage = metrics.get('cpu_usage_percent', 50)
-        memory_usage = metrics.get('memory_usage_mb', 200)
+        base_capacity, cpu_bound = MAX_CONCURRENT_BY_TECH.get(tech, (100, False))
+        if not cpu_bound:
+            return base_capacity
 
-        if tech == 'websocket':
-            # WebSockets can handle many concurrent connections
-            return int(2000 * (100 - cpu_usage) / 100)
-        elif tech == 'longpolling':
-            # Limited by thread pool
-            return int(500 * (100 - cpu_usage) / 100)
-        elif tech == 'firebase':
-            # Handled by Google infrastructure
-            return 10000  # Effectively unlimited for testing purposes
-
-        return 100
+        cpu_usage = metrics.get('cpu_usage_percent', 50)
+        return int(base_capacity * (100 - cpu_usage) / 100)
 
     def _estimate_performance_degradation(self, tech: str, metrics: Dict[str, Any]) -> str:
         """Estimate performance degradation under load"""
         cpu_usage = metrics.get('cpu_usage_percent', 50)
         success_rate = metrics.get('success_rate_percent', 95)
 
-        if cpu_usage < 30 and success_rate > 95:
-            return "Minimal degradation expected"
-        elif cpu_usage < 50 and success_rate > 90:
-            return "Moderate degradation under high load"
-        else:
-            return "Significant degradation likely under load"
+        for max_cpu, min_success, label in DEGRADATION_TIERS:
+            if cpu_usage < max_cpu and success_rate > min_success:
+                return label
+        return DEGRADATION_FALLBACK
 
     def _generate_reliability_analysis(self) -> Dict[str, Any]:
         """Analyze reliability characteristics across network conditions"""
@@ -664,31 +727,36 @@ class EnhancedUnifiedPerformanceRunner:
         # Performance-based recommendations
         rankings = analysis.get('performance_rankings', {})
         if rankings.get('overall_best'):
-            recommendations.append(f"Overall best performer: {rankings['overall_best']} - recommended for most applications")
+            recommendations.append(RECOMMENDATION_TEMPLATES['overall'].format(tech=rankings['overall_best']))
 
         if rankings.get('latency_champion'):
-            recommendations.append(f"For ultra-low latency requirements: Use {rankings['latency_champion']}")
+            recommendations.append(RECOMMENDATION_TEMPLATES['latency'].format(tech=rankings['latency_champion']))
 
         if rankings.get('reliability_champion'):
-            recommendations.append(f"For maximum reliability: Use {rankings['reliability_champion']}")
+            recommendations.append(RECOMMENDATION_TEMPLATES['reliability'].format(tech=rankings['reliability_champion']))
 
         # Network condition recommendations
         network_analysis = analysis.get('network_condition_analysis', {})
         if 'poor_mobile' in network_analysis:
             poor_mobile = network_analysis['poor_mobile']
             if poor_mobile.get('best_latency'):
-                recommendations.append(f"For poor mobile networks: {poor_mobile['best_latency']} performs best")
+                recommendations.append(RECOMMENDATION_TEMPLATES['poor_mobile'].format(tech=poor_mobile['best_latency']))
 
         # Use case recommendations
         use_cases = analysis.get('technology_comparison', {}).get('use_case_suitability', {})
         for use_case, recommendation in use_cases.items():
-            recommendations.append(f"{use_case.replace('_', ' ').title()}: Use {recommendation['best_choice']} - {recommendation['reason']}")
+            recommendations.append(RECOMMENDATION_TEMPLATES['use_case'].format(
+                use_case=use_case.replace('_', ' ').title(),
+                tech=recommendation['best_choice'],
+                reason=recommendation['reason']
+            ))
 
         # Scalability recommendations
         scalability = analysis.get('scalability_analysis', {})
         scalability_ranking = scalability.get('scalability_ranking', [])
         if scalability_ranking:
-            recommendations.append(f"For high scalability: Prefer {scalability_ranking[0]} over {scalability_ranking[-1]}")
+            recommendations.append(RECOMMENDATION_TEMPLATES['scalability'].format(
+                best=scalability_ranking[0], worst=scalability_ranking[-1]))
 
         # Hybrid architecture recommendations
         recommendations.append("Consider hybrid approach: WebSocket for real-time features, Long Polling for periodic updates, Firebase for mobile notifications")
@@ -765,12 +833,20 @@ class EnhancedUnifiedPerformanceRunner:
         print("=" * 80)
 
     # Class-level storage for results
-    _test_results = {}
+    _test_results: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+    _latest_test_id: Optional[str] = None
+    _results_lock = threading.Lock()
+    MAX_STORED_RESULTS = 64
 
     @classmethod
     def store_results(cls, test_id: str, results: Dict[str, Any]):
-        """Store test results"""
-        cls._test_results[test_id] = results
+        """Store test results, evicting the oldest run once the cap is reached"""
+        with cls._results_lock:
+            cls._test_results[test_id] = results
+            cls._test_results.move_to_end(test_id)
+            while len(cls._test_results) > cls.MAX_STORED_RESULTS:
+                cls._test_results.popitem(last=False)
+            cls._latest_test_id = test_id
 
     @classmethod
     def get_test_results(cls, test_id: str) -> Dict[str, Any]:
@@ -780,12 +856,10 @@ class EnhancedUnifiedPerformanceRunner:
     @classmethod
     def get_latest_results(cls) -> Dict[str, Any]:
         """Get the latest test results"""
-        if not cls._test_results:
+        if cls._latest_test_id is None:
             return {'error': 'No tests have been run'}
 
-        latest_test_id = max(cls._test_results.keys(),
-                             key=lambda k: cls._test_results[k].get('start_time', ''))
-        return cls._test_results[latest_test_id]
+        return cls._test_results.get(cls._latest_test_id, {'error': 'No tests have been run'})
 
 
 def run_enhanced_performance_tests(technologies: List[str] = None) -> Dict[str, Any]:
@@ -802,9 +876,13 @@ if __name__ == "__main__":
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"enhanced_performance_results_{timestamp}.json"
 
+    # Results are always saved, independently of the optional reporting module
     try:
-        with open(filename, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        with open(filename, 'wb') as f:
+            if ORJSON_AVAILABLE:
+                f.write(orjson.dumps(results, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                f.write(json.dumps(results, indent=2, default=str).encode('utf-8'))
         print(f"\n✓ Enhanced results saved to {filename}")
     except Exception as e:
         print(f"✗ Failed to save results: {e}")
@@ -814,10 +892,14 @@ if __name__ == "__main__":
         from enhanced_performance_report import EnhancedPerformanceReport
         report_generator = EnhancedPerformanceReport()
 
-        # Generate multiple report formats
-        report_generator.generate_comprehensive_html_report(results, f"enhanced_report_{timestamp}.html")
-        report_generator.generate_research_analysis_report(results, f"performance_validation_{timestamp}.html")
-        report_generator.generate_detailed_csv_report(results, f"detailed_metrics_{timestamp}.csv")
+        # Generate multiple report formats; each job writes its own file
+        report_jobs = [
+            (report_generator.generate_comprehensive_html_report, f"enhanced_report_{timestamp}.html"),
+            (report_generator.generate_research_analysis_report, f"performance_validation_{timestamp}.html"),
+            (report_generator.generate_detailed_csv_report, f"detailed_metrics_{timestamp}.csv")
+        ]
+        with ThreadPoolExecutor(max_workers=len(report_jobs)) as executor:
+            list(executor.map(lambda job: job[0](results, job[1]), report_jobs))
 
         print(f"✓ Comprehensive reports generated")
     except ImportError:
@@ -5,26 +5,25 @@ import json
 import asyncio
 import time
 import uuid
-import psutil
 import os
 from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.db import database_sync_to_async
 from django.conf import settings
 import logging
+from ServerSide.system_sampler import SystemMetricsSampler
 from autobahn.exception import Disconnected
 
 logger = logging.getLogger(__name__)
 
 
-class RealTimeWebSocketMetrics:
+class RealTimeWebSocketMetrics(SystemMetricsSampler):
     """Real-time WebSocket performance metrics collection for testing"""
 
     def __init__(self):
+        super().__init__()
         self.connection_times = []
         self.message_latencies = []
         self.ping_latencies = []
-        self.memory_usage = []
-        self.cpu_usage = []
         self.bytes_sent = 0
         self.bytes_received = 0
         self.messages_sent = 0
@@ -59,32 +58,26 @@ class RealTimeWebSocketMetrics:
         if received:
             self.messages_received += 1
 
-    def record_system_metrics(self):
-        """Record current system metrics"""
-        try:
-            process = psutil.Process(os.getpid())
-            self.memory_usage.append(process.memory_info().rss / 1024 / 1024)  # MB
-            self.cpu_usage.append(process.cpu_percent())
-        except:
-            pass
-
     def get_real_metrics(self):
         """Get comprehensive real-time metrics"""
         duration = time.time() - self.start_time
 
         import statistics
 
+        # One sort serves min, max and p95; fmean is a single C-level pass over floats
+        latencies = sorted(self.message_latencies)
+
         return {
-            'connection_time_ms': statistics.mean(self.connection_times) if self.connection_times else 0,
-            'message_latency_ms': statistics.mean(self.message_latencies) if self.message_latencies else 0,
-            'ping_latency_ms': statistics.mean(self.ping_latencies) if self.ping_latencies else 0,
-            'latency_min_ms': min(self.message_latencies) if self.message_latencies else 0,
-            'latency_max_ms': max(self.message_latencies) if self.message_latencies else 0,
-            'latency_p95_ms': self._percentile(self.message_latencies, 95) if self.message_latencies else 0,
+            'connection_time_ms': statistics.fmean(self.connection_times) if self.connection_times else 0,
+            'message_latency_ms': statistics.fmean(latencies) if latencies else 0,
+            'ping_latency_ms': statistics.fmean(self.ping_latencies) if self.ping_latencies else 0,
+            'latency_min_ms': latencies[0] if latencies else 0,
+            'latency_max_ms': latencies[-1] if latencies else 0,
+            'latency_p95_ms': self._percentile(latencies, 95, presorted=True),
             'throughput_msg_per_sec': self.messages_sent / duration if duration > 0 else 0,
             'success_rate_percent': ((self.messages_sent - self.errors_count) / max(self.messages_sent, 1)) * 100,
-            'memory_usage_mb': statistics.mean(self.memory_usage) if self.memory_usage else 0,
-            'cpu_usage_percent': statistics.mean(self.cpu_usage) if self.cpu_usage else 0,
+            'memory_usage_mb': statistics.fmean(self.memory_usage) if self.memory_usage else 0,
+            'cpu_usage_percent': statistics.fmean(self.cpu_usage) if self.cpu_usage else 0,
             'network_bytes_sent': self.bytes_sent,
             'network_bytes_received': self.bytes_received,
             'error_rate_percent': (self.errors_count / max(self.messages_sent, 1)) * 100,
@@ -94,11 +87,11 @@ class RealTimeWebSocketMetrics:
             'total_messages_received': self.messages_received
         }
 
-    def _percentile(self, data, percentile):
-        """Calculate percentile"""
+    def _percentile(self, data, percentile, presorted=False):
+        """Calculate percentile (pass presorted=True to skip the sort)"""
         if not data:
             return 0
-        sorted_data = sorted(data)
+        sorted_data = data if presorted else sorted(data)
         index = (percentile / 100) * (len(sorted_data) - 1)
         if index.is_integer():
             return sorted_data[int(index)]
@@ -142,7 +135,7 @@ class AlertConsumer(AsyncWebsocketConsumer):
         # Calculate connection time
         connection_time = (time.time() - self.connection_start_time) * 1000
         websocket_metrics.record_connection(connection_time)
-        websocket_metrics.record_system_metrics()
+        websocket_metrics.start_system_sampling()
 
         logger.info(f"WebSocket client connected: {self.channel_name} in {connection_time:.2f}ms")
 
@@ -160,6 +153,8 @@ class AlertConsumer(AsyncWebsocketConsumer):
         """Handle WebSocket disconnection with cleanup"""
         self.is_connected = False
         websocket_metrics.connections_count -= 1
+        if websocket_metrics.connections_count <= 0:
+            websocket_metrics.stop_system_sampling()
 
         # Cancel any running alert task
         if self.alert_task and not self.alert_task.done():
@@ -384,7 +379,6 @@ class AlertConsumer(AsyncWebsocketConsumer):
             # Record metrics
             websocket_metrics.record_data_transfer(bytes_sent=len(message_json.encode()))
             websocket_metrics.record_message_activity(sent=True)
-            websocket_metrics.record_system_metrics()
 
             return True
         except Disconnected:
@@ -174,6 +174,8 @@ def reset_metrics(request):
         global websocket_metrics
         try:
             from .consumers import RealTimeWebSocketMetrics
+            if hasattr(websocket_metrics, 'stop_system_sampling'):
+                websocket_metrics.stop_system_sampling()
             websocket_metrics = RealTimeWebSocketMetrics()
         except ImportError:
             # If import fails, create dummy metrics
@@ -2,92 +2,73 @@
 
 import json
 import time
+import socket
+import threading
 import websocket
 import uuid
-from typing import Dict, Any
-from network_condition_simulator import NetworkConditionSimulator, EnhancedPerformanceMetrics
+from typing import Dict, Any, Optional, Tuple
+from network_condition_simulator import BasePerformanceTester, EnhancedPerformanceMetrics, prime_dns
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
-class RealWebSocketTester:
+# Pre-encoded payloads for the repeated sends; only the numeric fields are filled in per message
+THROUGHPUT_MESSAGE_TEMPLATE = b'{"type": "throughput_test", "timestamp": %.3f, "sequence": %d}'
+SCALABILITY_MESSAGE_TEMPLATE = b'{"type": "scalability_test", "connection_id": %d, "timestamp": %.3f}'
+RELIABILITY_MESSAGE_TEMPLATE = b'{"type": "reliability_test", "burst_sequence": %d, "timestamp": %.3f}'
+
+
+class RealWebSocketTester(BasePerformanceTester):
     """Enhanced WebSocket tester with network simulation and comprehensive metrics"""
 
+    technology_label = 'WebSocket'
+    short_name = 'WebSocket'
+    metrics_name = 'websocket'
+
     def __init__(self, url: str, test_config: Dict[str, Any]):
+        super().__init__(test_config)
         self.url = url
-        self.test_config = test_config
         self.ws = None
         self.running = False
         self.ping_responses = {}
-        self.network_simulator = NetworkConditionSimulator()
-
-    def run_test(self) -> Dict[str, Any]:
-        """Run comprehensive WebSocket performance test"""
-        logger.info(f"Starting enhanced WebSocket test: {self.test_config}")
-
-        # Test all network conditions
-        all_results = {}
-        network_profiles = ['perfect', 'local_wifi', 'good_mobile', 'poor_mobile', 'satellite']
-
-        for profile in network_profiles:
-            logger.info(f"Testing WebSocket under {profile} network conditions...")
-
-            def test_under_conditions():
-                return self._run_single_test(profile)
-
-            profile_results = self.network_simulator.apply_network_conditions(profile, test_under_conditions)
-            all_results[profile] = profile_results
-
-            # Wait between network condition tests
-            time.sleep(2)
-
-        return {
-            'technology': 'WebSocket',
-            'test_type': 'enhanced_performance',
-            'network_condition_results': all_results,
-            'summary': self._generate_summary(all_results)
-        }
-
-    def _run_single_test(self, network_profile: str) -> Dict[str, Any]:
-        """Run single test under specific network conditions"""
-        metrics = EnhancedPerformanceMetrics('websocket')
-        metrics.start_test(network_profile)
 
+    def _run_test_phases(self, metrics: EnhancedPerformanceMetrics) -> Optional[str]:
+        """Run the WebSocket test phases under the active network conditions"""
         self.running = True
 
-        try:
-            # Test 1: Connection performance (multiple connections)
-            connection_success = self._test_connection_performance(metrics)
-            if not connection_success:
-                return self._get_results(metrics, "Connection failed")
-
-            # Test 2: Message latency with statistical analysis
-            self._test_message_latency(metrics)
+        # Test 1: Connection performance (multiple connections)
+        connection_success = self._test_connection_performance(metrics)
+        if not connection_success:
+            return "Connection failed"
 
-            # Test 3: Throughput measurement
-            self._test_throughput(metrics)
+        # Test 2: Message latency with statistical analysis
+        self._test_message_latency(metrics)
 
-            # Test 4: Scalability test with many clients
-            self._test_scalability(metrics)
+        # Test 3: Throughput measurement
+        self._test_throughput(metrics)
 
-            # Test 5: Reliability under stress
-            self._test_reliability(metrics)
+        # Test 4: Scalability test with many clients
+        self._test_scalability(metrics)
 
-        except Exception as e:
-            logger.error(f"WebSocket test error under {network_profile}: {e}")
-            metrics.record_failure()
-        finally:
-            self.running = False
-            if self.ws:
-                try:
-                    self.ws.close()
-                except:
-                    pass
-            metrics.end_test()
+        # Test 5: Reliability under stress
+        self._test_reliability(metrics)
+        return None
 
-        return self._get_results(metrics, "Completed")
+    def _cleanup_single_test(self) -> None:
+        """Close the shared websocket after a run"""
+        self.running = False
+        if self.ws:
+            try:
+                self.ws.close()
+            except Exception as e:
+                logger.debug(f"WebSocket close failed: {e}")
 
     def _test_connection_performance(self, metrics: EnhancedPerformanceMetrics) -> bool:
         """Test connection establishment performance with multiple attempts"""
@@ -95,12 +76,15 @@ class RealWebSocketTester:
 
         successful_connections = 0
 
+        # Keep DNS resolution out of the first connection sample
+        prime_dns(self.url)
+
         # Test multiple connections to get statistical data
         for attempt in range(10):
             try:
-                start_time = time.time()
+                start_time = time.perf_counter_ns()
                 test_ws = websocket.create_connection(self.url, timeout=15)
-                connection_time = (time.time() - start_time) * 1000
+                connection_time = (time.perf_counter_ns() - start_time) / 1e6
 
                 metrics.record_connection_time(connection_time)
                 metrics.record_success()
@@ -133,30 +117,23 @@ class RealWebSocketTester:
         # Send more messages for better statistical analysis
         message_count = self.test_config.get('message_count', 50)
 
-        for i in range(message_count):
-            ping_id = str(uuid.uuid4())
-            send_time = time.time() * 1000
-
-            ping_message = {
-                'type': 'ping',
-                'ping_id': ping_id,
-                'timestamp': send_time,
-                'sequence': i
-            }
+        # Control-frame pings are answered by the server's websocket layer, so the RTT
+        # excludes JSON work on both ends; 'application' keeps the JSON ping/pong exchange
+        use_control_frames = self.test_config.get('latency_ping', 'control_frame') == 'control_frame'
 
-            try:
-                message_json = json.dumps(ping_message)
-                self.ws.send(message_json)
-                metrics.record_data_transfer(bytes_sent=len(message_json.encode()))
+        # One uuid per run; the sequence number keeps each ping id unique
+        ping_prefix = uuid.uuid4().hex
 
-                response = self.ws.recv()
-                receive_time = time.time() * 1000
+        for i in range(message_count):
+            ping_id = f"{ping_prefix}-{i}"
 
-                metrics.record_data_transfer(bytes_received=len(response.encode()))
+            try:
+                if use_control_frames:
+                    matched, real_latency = self._send_control_ping(ping_id.encode(), metrics)
+                else:
+                    matched, real_latency = self._send_application_ping(ping_id, i, metrics)
 
-                data = json.loads(response)
-                if data.get('type') == 'pong' and data.get('ping_id') == ping_id:
-                    real_latency = receive_time - send_time
+                if matched:
                     metrics.record_message_latency(real_latency)
                     metrics.record_success()
 
@@ -171,6 +148,44 @@ class RealWebSocketTester:
                 logger.error(f"Message {i + 1} failed: {e}")
                 metrics.record_failure()
 
+    def _send_control_ping(self, ping_payload: bytes, metrics: EnhancedPerformanceMetrics) -> Tuple[bool, float]:
+        """Round-trip a websocket PING control frame and wait for its PONG"""
+        send_counter = time.perf_counter_ns()
+        self.ws.ping(ping_payload)
+        metrics.record_data_transfer(bytes_sent=len(ping_payload))
+
+        # Alerts may arrive in between; skip data frames until our PONG (bounded by the socket timeout)
+        while True:
+            opcode, response = self.ws.recv_data(control_frame=True)
+            if opcode == websocket.ABNF.OPCODE_PONG:
+                real_latency = (time.perf_counter_ns() - send_counter) / 1e6
+                metrics.record_data_transfer(bytes_received=len(response))
+                return response == ping_payload, real_latency
+
+    def _send_application_ping(self, ping_id: str, sequence: int,
+                               metrics: EnhancedPerformanceMetrics) -> Tuple[bool, float]:
+        """Round-trip a JSON ping message through the consumer's ping handler"""
+        ping_message = {
+            'type': 'ping',
+            'ping_id': ping_id,
+            'timestamp': time.time() * 1000,  # Wall-clock stamp for the payload only
+            'sequence': sequence
+        }
+
+        payload = json.dumps(ping_message).encode()
+        send_counter = time.perf_counter_ns()
+        self.ws.send(payload)
+        metrics.record_data_transfer(bytes_sent=len(payload))
+
+        # recv_data() hands back the raw frame bytes, so nothing is decoded and re-encoded
+        _, response = self.ws.recv_data()
+        real_latency = (time.perf_counter_ns() - send_counter) / 1e6
+
+        metrics.record_data_transfer(bytes_received=len(response))
+
+        data = json_loads(response)
+        return data.get('type') == 'pong' and data.get('ping_id') == ping_id, real_latency
+
     def _test_throughput(self, metrics: EnhancedPerformanceMetrics) -> None:
         """Test message throughput with detailed measurement"""
         logger.info("Testing WebSocket throughput...")
@@ -179,38 +194,41 @@ class RealWebSocketTester:
             return
 
         duration = self.test_config.get('duration', 30)
-        start_time = time.time()
+        message_interval = self.test_config.get('message_interval', 0.01)
+        start_time = time.perf_counter()
+        end_time = start_time + duration
         messages_sent = 0
 
         # Sample throughput every 5 seconds
         last_sample_time = start_time
         last_sample_count = 0
 
-        while (time.time() - start_time) < duration:
+        # Replies are drained on a reader thread so the sender never waits on recv
+        reader_stats = {'bytes_received': 0, 'messages_received': 0}
+        reader_stop = threading.Event()
+        self.ws.settimeout(0.5)
+        reader_thread = threading.Thread(
+            target=self._throughput_reader_loop,
+            args=(reader_stop, reader_stats)
+        )
+        reader_thread.daemon = True
+        reader_thread.start()
+
+        # Sends are scheduled against absolute deadlines so time spent sending
+        # does not push every later message back (no cumulative drift)
+        next_send = start_time
+
+        while time.perf_counter() < end_time:
             try:
-                message = {
-                    'type': 'throughput_test',
-                    'timestamp': time.time() * 1000,
-                    'sequence': messages_sent
-                }
+                payload = THROUGHPUT_MESSAGE_TEMPLATE % (time.time() * 1000, messages_sent)
+                self.ws.send(payload)
 
-                message_json = json.dumps(message)
-                self.ws.send(message_json)
-
-                metrics.record_data_transfer(bytes_sent=len(message_json.encode()))
+                metrics.record_data_transfer(bytes_sent=len(payload))
                 metrics.record_success()
                 messages_sent += 1
 
-                # Try to receive response (non-blocking)
-                try:
-                    self.ws.settimeout(0.1)
-                    response = self.ws.recv()
-                    metrics.record_data_transfer(bytes_received=len(response.encode()))
-                except websocket.WebSocketTimeoutException:
-                    pass
-
                 # Sample throughput
-                current_time = time.time()
+                current_time = time.perf_counter()
                 if current_time - last_sample_time >= 5:
                     sample_duration = current_time - last_sample_time
                     sample_messages = messages_sent - last_sample_count
@@ -219,20 +237,43 @@ class RealWebSocketTester:
                     last_sample_time = current_time
                     last_sample_count = messages_sent
 
-                time.sleep(0.01)  # Small delay
+                next_send += message_interval
+                delay = next_send - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
 
             except Exception as e:
                 logger.error(f"Throughput test error: {e}")
                 metrics.record_failure()
                 break
 
+        total_duration = time.perf_counter() - start_time
+
+        reader_stop.set()
+        reader_thread.join(timeout=2)
+        metrics.record_data_transfer(bytes_received=reader_stats['bytes_received'])
+        logger.info(f"Throughput reader received {reader_stats['messages_received']} replies")
+
         # Final throughput sample
-        total_duration = time.time() - start_time
         if total_duration > 0:
             metrics.record_throughput_sample(messages_sent, total_duration)
             throughput = messages_sent / total_duration
             logger.info(f"Overall throughput: {throughput:.2f} msg/s over {total_duration:.1f}s")
 
+    def _throughput_reader_loop(self, stop_event: threading.Event, stats: Dict[str, int]) -> None:
+        """Drain replies during the throughput test (counters are merged once the test ends)"""
+        while not stop_event.is_set():
+            try:
+                _, response = self.ws.recv_data()
+                stats['bytes_received'] += len(response)
+                stats['messages_received'] += 1
+            except websocket.WebSocketTimeoutException:
+                continue
+            except Exception as e:
+                if not stop_event.is_set():
+                    logger.error(f"Throughput reader error: {e}")
+                break
+
     def _test_scalability(self, metrics: EnhancedPerformanceMetrics) -> None:
         """Test scalability with simulated concurrent connections"""
         logger.info("Testing WebSocket scalability...")
@@ -244,9 +285,9 @@ class RealWebSocketTester:
         # Create multiple connections to test scalability
         for i in range(min(max_connections, 50)):  # Limit for local testing
             try:
-                start_time = time.time()
+                start_time = time.perf_counter_ns()
                 ws_conn = websocket.create_connection(self.url, timeout=10)
-                connection_time = (time.time() - start_time) * 1000
+                connection_time = (time.perf_counter_ns() - start_time) / 1e6
 
                 concurrent_connections.append(ws_conn)
                 metrics.record_connection_time(connection_time)
@@ -265,13 +306,7 @@ class RealWebSocketTester:
         # Test message sending across all connections
         for i, ws_conn in enumerate(concurrent_connections):
             try:
-                test_message = {
-                    'type': 'scalability_test',
-                    'connection_id': i,
-                    'timestamp': time.time() * 1000
-                }
-
-                ws_conn.send(json.dumps(test_message))
+                ws_conn.send(SCALABILITY_MESSAGE_TEMPLATE % (i, time.time() * 1000))
                 metrics.record_success()
 
             except Exception as e:
@@ -282,8 +317,8 @@ class RealWebSocketTester:
         for ws_conn in concurrent_connections:
             try:
                 ws_conn.close()
-            except:
-                pass
+            except Exception as e:
+                logger.debug(f"Scalability connection close failed: {e}")
 
     def _test_reliability(self, metrics: EnhancedPerformanceMetrics) -> None:
         """Test reliability under stress conditions"""
@@ -296,78 +331,47 @@ class RealWebSocketTester:
         burst_count = 100
         successful_messages = 0
 
-        for i in range(burst_count):
-            try:
-                message = {
-                    'type': 'reliability_test',
-                    'burst_sequence': i,
-                    'timestamp': time.time() * 1000
-                }
+        # Encode the whole burst up front so the send loop only does socket writes
+        burst_timestamp = time.time() * 1000
+        payloads = [RELIABILITY_MESSAGE_TEMPLATE % (i, burst_timestamp) for i in range(burst_count)]
 
-                self.ws.send(json.dumps(message))
-                metrics.record_success()
-                successful_messages += 1
-
-            except Exception as e:
-                logger.error(f"Reliability test message {i} failed: {e}")
-                metrics.record_failure()
-
-                # Attempt reconnection
+        # Let Nagle coalesce the burst into fewer packets, then restore TCP_NODELAY
+        self._set_tcp_nodelay(False)
+        try:
+            for i, payload in enumerate(payloads):
                 try:
-                    self.ws.close()
-                    self.ws = websocket.create_connection(self.url, timeout=10)
-                    metrics.record_reconnection()
-                    logger.info(f"Reconnected after failure at message {i}")
-                except:
-                    logger.error(f"Failed to reconnect at message {i}")
-                    break
+                    self.ws.send(payload)
+                    metrics.record_success()
+                    successful_messages += 1
 
-        logger.info(f"Reliability test: {successful_messages}/{burst_count} messages successful")
+                except Exception as e:
+                    logger.error(f"Reliability test message {i} failed: {e}")
+                    metrics.record_failure()
 
-    def _get_results(self, metrics: EnhancedPerformanceMetrics, status: str) -> Dict[str, Any]:
-        """Get comprehensive test results"""
-        return {
-            'technology': 'WebSocket',
-            'status': status,
-            'metrics': metrics.calculate_comprehensive_metrics(),
-            'config': self.test_config,
-            'network_profile': metrics.network_profile
-        }
+                    # Attempt reconnection
+                    try:
+                        self.ws.close()
+                        self.ws = websocket.create_connection(self.url, timeout=10)
+                        self._set_tcp_nodelay(False)
+                        metrics.record_reconnection()
+                        logger.info(f"Reconnected after failure at message {i}")
+                    except Exception as reconnect_error:
+                        logger.error(f"Failed to reconnect at message {i}: {reconnect_error}")
+                        break
+        finally:
+            self._set_tcp_nodelay(True)
 
-    def _generate_summary(self, all_results: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate summary across all network conditions"""
-        summary = {
-            'best_performance_profile': None,
-            'worst_performance_profile': None,
-            'average_metrics': {},
-            'network_impact_analysis': {}
-        }
+        logger.info(f"Reliability test: {successful_messages}/{burst_count} messages successful")
 
-        # Find best and worst performing profiles
-        latencies = {}
-        success_rates = {}
-
-        for profile, result in all_results.items():
-            if result['status'] == 'Completed':
-                metrics = result['metrics']
-                latencies[profile] = metrics.get('message_latency_ms', float('inf'))
-                success_rates[profile] = metrics.get('success_rate_percent', 0)
-
-        if latencies:
-            summary['best_performance_profile'] = min(latencies, key=latencies.get)
-            summary['worst_performance_profile'] = max(latencies, key=latencies.get)
-
-            # Calculate network impact
-            perfect_latency = latencies.get('perfect', 0)
-            for profile, latency in latencies.items():
-                if profile != 'perfect' and perfect_latency > 0:
-                    impact = ((latency - perfect_latency) / perfect_latency) * 100
-                    summary['network_impact_analysis'][profile] = {
-                        'latency_increase_percent': impact,
-                        'success_rate_impact': success_rates.get(profile, 0) - success_rates.get('perfect', 0)
-                    }
-
-        return summary
+    def _set_tcp_nodelay(self, enabled: bool) -> None:
+        """Toggle TCP_NODELAY on the current websocket's underlying socket"""
+        sock = getattr(self.ws, 'sock', None)
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1 if enabled else 0)
+        except OSError as e:
+            logger.debug(f"Could not set TCP_NODELAY={enabled}: {e}")
 
 
 def test_websocket_performance() -> Dict[str, Any]: